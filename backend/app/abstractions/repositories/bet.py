@@ -3,6 +3,7 @@ from uuid import UUID
 
 from abstractions.repositories import CRUDRepositoryInterface
 from domain.dto.bet import CreateBetDTO, UpdateBetDTO
+from domain.dto.ledger import CreateLedgerEntryDTO
 from domain.models import Bet
 
 
@@ -18,3 +19,26 @@ class BetRepositoryInterface(
     @abstractmethod
     async def get_last_user_completed_bet(self, user_id: UUID) -> Bet:
         ...
+
+    @abstractmethod
+    async def get_pending_user_bets(self, user_id: UUID) -> list[Bet]:
+        """
+        Ставки пользователя в текущих блоках, от новых к старым.
+        """
+        ...
+
+    @abstractmethod
+    async def place_batch(
+            self,
+            user_id: UUID,
+            balance: float,
+            bets: list[CreateBetDTO],
+            canceled_bet_ids: list[UUID],
+            entries: list[CreateLedgerEntryDTO],
+    ) -> None:
+        """
+        Одной транзакцией отменяет ставки `canceled_bet_ids`, добавляет записи журнала `entries` и ставки `bets`.
+        Баланс сверяется под блокировкой пользователя: если он уже не равен `balance` или отменяемая
+        ставка уже не ожидает, ничего не пишется и бросается ConflictException.
+        """
+        ...
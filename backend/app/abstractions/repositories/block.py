@@ -5,6 +5,7 @@ from uuid import UUID
 from abstractions.repositories import CRUDRepositoryInterface
 from domain.dto.block import CreateBlockDTO, UpdateBlockDTO
 from domain.metaholder.responses.block_state import BlockStateResponse
+from domain.models.bets_aggregate import BetsAggregate
 from domain.models.block import Block
 
 
@@ -46,3 +47,9 @@ class BlockRepositoryInterface(
     async def get_current_block_state(self, pair_id: UUID) -> BlockStateResponse:
         ...
 
+    @abstractmethod
+    async def get_bets_aggregate(self, block_id: UUID) -> BetsAggregate:
+        """
+        Взвешенные по ставке суммы векторов, сумма ставок и число ставок блока, без загрузки самих ставок.
+        """
+        ...
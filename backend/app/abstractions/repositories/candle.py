@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from domain.dto.candle import BlockCandleDTO
+from domain.enums.candle import CandleResolution
+from domain.models.candle import Candle
+
+
+class CandleRepositoryInterface(ABC):
+    @abstractmethod
+    async def record(self, candle: BlockCandleDTO) -> None:
+        """
+        Сохраняет свечу блока и добавляет её в часовую и дневную свечи.
+        Цена открытия — цена закрытия предыдущей свечи блока пары.
+        """
+        ...
+
+    @abstractmethod
+    async def get_range(
+            self,
+            pair_id: UUID,
+            resolution: CandleResolution,
+            n: int,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None,
+    ) -> list[Candle]:
+        """
+        Последние `n` свечей, начавшихся в [start, end), от новых к старым.
+        """
+        ...
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from domain.enums.leaderboard import LeaderboardMetric, LeaderboardPeriod
+from domain.models.leaderboard import LeaderboardEntry
+from domain.models.user_reward import UserReward
+
+
+class LeaderboardRepositoryInterface(ABC):
+    @abstractmethod
+    async def record(self, pair_id: UUID, at: datetime, rewards: list[UserReward]) -> None:
+        """
+        Добавляет награды и точность рассчитанного блока в таблицы лидеров пары за день, неделю и всё время.
+        """
+        ...
+
+    @abstractmethod
+    async def get_top(
+            self,
+            pair_id: UUID,
+            period: LeaderboardPeriod,
+            metric: LeaderboardMetric,
+            at: datetime,
+            limit: int,
+    ) -> list[LeaderboardEntry]:
+        """
+        Первые `limit` пользователей периода, в который попадает `at`.
+        """
+        ...
+
+    @abstractmethod
+    async def get_entry(
+            self,
+            pair_id: UUID,
+            period: LeaderboardPeriod,
+            metric: LeaderboardMetric,
+            at: datetime,
+            user_id: UUID,
+    ) -> Optional[LeaderboardEntry]:
+        """
+        Место пользователя в таблице, None если за период у него нет рассчитанных ставок.
+        """
+        ...
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from domain.dto.ledger import CreateLedgerEntryDTO
+
+
+class LedgerRepositoryInterface(ABC):
+    @abstractmethod
+    async def append(self, entries: list[CreateLedgerEntryDTO]) -> None:
+        """
+        Дописывает проводки в журнал одной транзакцией. Записи журнала не изменяются и не удаляются.
+        """
+        ...
+
+    @abstractmethod
+    async def get_balance(self, user_id: UUID) -> float:
+        """
+        Баланс пользователя: последний снимок плюс сумма проводок после него.
+        """
+        ...
+
+    @abstractmethod
+    async def take_snapshots(self) -> int:
+        """
+        Сворачивает проводки после последних снимков в новые снимки балансов, возвращает число обновлённых снимков.
+        """
+        ...
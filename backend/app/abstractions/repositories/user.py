@@ -17,5 +17,13 @@ class UserRepositoryInterface(
         ...
 
     @abstractmethod
-    async def fund_user(self, user_id: UUID, amount: float) -> None:
+    async def exists(self, user_id: UUID) -> bool:
+        ...
+
+    @abstractmethod
+    async def get_history(self, user_id: UUID) -> User:
+        """
+        Пользователь со ставками и транзакциями для истории. Читается с реплики, если она есть
+        и уже догнала последнее полученное событие.
+        """
         ...
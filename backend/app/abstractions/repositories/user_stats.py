@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.dto.user_stats import UserStatsDeltaDTO
+from domain.models.user_stats import UserStats
+
+
+class UserStatsRepositoryInterface(ABC):
+    @abstractmethod
+    async def apply(self, deltas: list[UserStatsDeltaDTO]) -> None:
+        """
+        Прибавляет приращения к статистике пользователя по паре и к итогам пользователя одной транзакцией.
+        """
+        ...
+
+    @abstractmethod
+    async def get(self, user_id: UUID) -> Optional[UserStats]:
+        """
+        Итоги пользователя по всем парам, None если он ещё не ставил.
+        """
+        ...
+
+    @abstractmethod
+    async def get_by_pairs(self, user_id: UUID) -> list[UserStats]:
+        ...
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Optional
+
+from domain.enums.request_priority import RequestPriority
+
+
+class AdmissionControllerInterface(ABC):
+    @abstractmethod
+    def admit(self, priority: RequestPriority, replica: bool = False) -> Optional[timedelta]:
+        """
+        None, если запрос с приоритетом `priority` можно выполнить сейчас,
+        иначе через сколько клиенту повторить запрос. `replica` — запрос читает с реплики,
+        и допуск решает загрузка её пула. Отказы учитываются в метриках.
+        """
+        ...
+
+    @abstractmethod
+    async def start(self) -> None:
+        """
+        Запускает замер задержки event loop.
+        """
+        ...
+
+    @abstractmethod
+    async def stop(self) -> None:
+        ...
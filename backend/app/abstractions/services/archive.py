@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class ArchiveServiceInterface(ABC):
+    @abstractmethod
+    async def maintain(self) -> None:
+        """
+        Заранее создаёт месячные партиции ставок и блоков и уносит в архив завершённые месяцы старше срока хранения.
+        """
+        ...
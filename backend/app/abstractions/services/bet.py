@@ -16,6 +16,14 @@ class BetServiceInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    async def create_bets(self, create_dtos: list[PlaceBetRequest], user_id: UUID) -> None:
+        """
+        Создаёт ставки на несколько пар сразу: все или ни одной.
+        Бросает NotEnoughMoney, если баланса не хватает хотя бы на одну из них.
+        """
+        ...
+
     @abstractmethod
     async def cancel_bet(self, bet_id: UUID) -> None:
         """
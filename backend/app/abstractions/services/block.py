@@ -3,6 +3,7 @@ from typing import Optional
 from uuid import UUID
 
 from domain.metaholder.responses.block_state import BlockStateResponse
+from domain.models.bet import BetVector
 from domain.models.block import Block
 from domain.models.reward_model import Rewards
 
@@ -50,9 +51,9 @@ class BlockServiceInterface(ABC):
         ...
 
     @abstractmethod
-    async def complete_block(self, block_id: UUID) -> None:
+    async def complete_block(self, block_id: UUID) -> Block:
         """
-        Помечает блок как завершённый.
+        Помечает блок как завершённый и возвращает его с итоговым вектором.
         """
         ...
 
@@ -71,3 +72,17 @@ class BlockServiceInterface(ABC):
     async def get_current_block_state(self, pair_id: UUID) -> BlockStateResponse:
         ...
 
+    @abstractmethod
+    async def get_last_result_vector(self, pair_id: UUID) -> Optional[BetVector]:
+        """
+        Возвращает итоговый вектор последнего завершённого блока пары.
+        """
+        ...
+
+    @abstractmethod
+    async def get_default_pair_id(self) -> UUID:
+        """
+        Пара первой цепочки: для клиентов, которые не передают пару.
+        """
+        ...
+
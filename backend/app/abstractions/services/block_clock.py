@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from domain.models.block_clock import BlockClock
+from domain.models.chain import Chain
+
+
+class BlockClockRegistryInterface(ABC):
+    @abstractmethod
+    def get_for_chain(self, chain: Chain) -> BlockClock:
+        """
+        Возвращает часы блоков цепочки, отсчитываемые от её создания.
+        """
+        ...
+
+    @abstractmethod
+    async def get_by_pair_id(self, pair_id: UUID) -> BlockClock:
+        """
+        Возвращает часы блоков цепочки пары, загружая цепочку только при первом обращении.
+        """
+        ...
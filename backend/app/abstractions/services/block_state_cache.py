@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.models.block_state import CachedBlockState
+from domain.models.bet import BetVector
+from domain.models.events import Event
+
+
+class BlockStateCacheInterface(ABC):
+    @abstractmethod
+    def get_generation(self, pair_id: UUID) -> int:
+        """
+        Меняется на каждом событии пары и сбросе кэша. Читается перед загрузкой из БД
+        и передаётся в `set_*`: загрузка, во время которой пришло событие, не сохраняется.
+        """
+        ...
+
+    @abstractmethod
+    def get_current_block(self, pair_id: UUID) -> Optional[CachedBlockState]:
+        """
+        Текущий блок пары или None, если его нет в кэше или его время уже вышло.
+        """
+        ...
+
+    @abstractmethod
+    def set_current_block(self, pair_id: UUID, state: CachedBlockState, generation: Optional[int] = None) -> None:
+        ...
+
+    @abstractmethod
+    def get_last_result_vector(self, pair_id: UUID) -> Optional[BetVector]:
+        ...
+
+    @abstractmethod
+    def set_last_result_vector(self, pair_id: UUID, vector: BetVector, generation: Optional[int] = None) -> None:
+        ...
+
+    @abstractmethod
+    def handle(self, event: Event) -> None:
+        """
+        Обновляет кэш по событию из другого процесса.
+        """
+        ...
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        ...
+
+    @abstractmethod
+    def set_active(self, active: bool) -> None:
+        """
+        Кэш отдаёт данные только пока слушатель событий подключён.
+        Сбрасывает накопленное состояние, так как события могли быть пропущены.
+        """
+        ...
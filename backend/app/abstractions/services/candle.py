@@ -1,10 +1,24 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
 
-from domain.models.block import Block
+from domain.enums.candle import CandleResolution
+from domain.metaholder.responses.candle import Candle
 
 
 class CandleServiceInterface(ABC):
 
     @abstractmethod
-    async def get_n_last_blocks_by_pair_id(self, pair_id: str, n: int) -> list[Block]:
+    async def get_candles(
+            self,
+            pair_id: UUID,
+            resolution: CandleResolution,
+            n: int,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None,
+    ) -> list[Candle]:
+        """
+        Последние `n` свечей пары, начавшихся в [start, end), от новых к старым.
+        """
         ...
@@ -27,6 +27,13 @@ class ChainServiceInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    async def suspend_block_generation(self) -> None:
+        """
+        Останавливает планировщик, не трогая блоки в БД.
+        """
+        ...
+
     @abstractmethod
     async def get_by_pair_id(self, pair_id: UUID) -> Chain:
         """
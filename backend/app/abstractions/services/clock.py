@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class ClockInterface(ABC):
+    @abstractmethod
+    def now(self) -> datetime:
+        """
+        Текущее локальное время без часового пояса, как datetime.now().
+        """
+        ...
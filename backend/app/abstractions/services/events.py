@@ -0,0 +1,54 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+from uuid import UUID
+
+from domain.models.events import Event
+
+
+class EventPublisherInterface(ABC):
+    @abstractmethod
+    async def publish(self, *events: Event) -> None:
+        """
+        Рассылает события всем процессам API.
+        """
+        ...
+
+
+class EventListenerInterface(ABC):
+    @abstractmethod
+    def subscribe(self, handler: Callable[[Event], None]) -> None:
+        ...
+
+    @abstractmethod
+    def on_connection_change(self, handler: Callable[[bool], None]) -> None:
+        """
+        Обработчик вызывается при подключении (True) и обрыве (False):
+        в обоих случаях события могли быть пропущены.
+        """
+        ...
+
+    @abstractmethod
+    async def start(self) -> None:
+        ...
+
+    @abstractmethod
+    async def stop(self) -> None:
+        ...
+
+
+class EventBroadcasterInterface(ABC):
+    @abstractmethod
+    def subscribe(self, user_id: Optional[UUID]) -> asyncio.Queue[Event]:
+        """
+        Регистрирует подключённого клиента и возвращает очередь его событий.
+        """
+        ...
+
+    @abstractmethod
+    def unsubscribe(self, queue: asyncio.Queue[Event]) -> None:
+        ...
+
+    @abstractmethod
+    def handle(self, event: Event) -> None:
+        ...
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Optional
+
+from apscheduler.triggers.base import BaseTrigger
+
+
+class JobRunnerInterface(ABC):
+    @abstractmethod
+    def add_job(
+            self,
+            job_id: str,
+            func: Callable[[], Awaitable[Any]],
+            trigger: BaseTrigger,
+            timeout: Optional[timedelta] = None,
+            misfire_grace_time: Optional[timedelta] = None,
+    ) -> None:
+        """
+        Регистрирует задачу: не более одного запуска одновременно, таймаут и отсрочка после ошибок.
+        Повторная регистрация с тем же job_id заменяет расписание.
+        """
+        ...
+
+    @abstractmethod
+    def remove_job(self, job_id: str) -> None:
+        ...
+
+    @property
+    @abstractmethod
+    def running(self) -> bool:
+        ...
+
+    @abstractmethod
+    def start(self) -> None:
+        ...
+
+    @abstractmethod
+    async def shutdown(self, cancel: bool = False) -> None:
+        """
+        Останавливает планировщик и возвращается, когда выполняющиеся задачи завершились.
+        С `cancel` они отменяются, иначе выполняются до конца.
+        """
+        ...
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+
+class LeaderElectionInterface(ABC):
+    @abstractmethod
+    async def try_acquire(self) -> bool:
+        """
+        Пытается стать лидером, не блокируясь. Возвращает True, если лидерство получено.
+        """
+        ...
+
+    @abstractmethod
+    async def is_leader(self) -> bool:
+        """
+        Проверяет, что лидерство всё ещё удерживается этим процессом.
+        """
+        ...
+
+    @abstractmethod
+    async def release(self) -> None:
+        """
+        Отдаёт лидерство, чтобы резервный процесс мог его подхватить.
+        """
+        ...
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.enums.leaderboard import LeaderboardMetric, LeaderboardPeriod
+from domain.metaholder.responses.leaderboard import LeaderboardResponse
+from domain.models.events import Event
+
+
+class LeaderboardServiceInterface(ABC):
+    @abstractmethod
+    async def get_leaderboard(
+            self,
+            pair_id: UUID,
+            period: LeaderboardPeriod,
+            metric: LeaderboardMetric,
+            limit: int,
+            user_id: Optional[UUID] = None,
+    ) -> LeaderboardResponse:
+        """
+        Первые `limit` пользователей пары за текущий период и место пользователя `user_id`.
+        """
+        ...
+
+    @abstractmethod
+    def handle(self, event: Event) -> None:
+        """
+        Сбрасывает закэшированные таблицы после расчёта блока.
+        """
+        ...
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        ...
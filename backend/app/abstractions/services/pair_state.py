@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.metaholder.responses.pair_state import PairsStateResponse
+from domain.models.events import Event
+
+
+class PairStateServiceInterface(ABC):
+    @abstractmethod
+    async def get_pairs_state(self, user_id: Optional[UUID] = None) -> PairsStateResponse:
+        """
+        Текущий блок, последний результат, последняя свеча и ставка пользователя в текущем блоке
+        по всем активным парам.
+        """
+        ...
+
+    @abstractmethod
+    def handle(self, event: Event) -> None:
+        """
+        Сбрасывает последнюю свечу пары, блок которой рассчитан.
+        """
+        ...
+
+    @abstractmethod
+    def set_active(self, active: bool) -> None:
+        """
+        Свечи кэшируются только пока слушатель событий подключён.
+        """
+        ...
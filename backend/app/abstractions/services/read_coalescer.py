@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Hashable, Optional, TypeVar
+from uuid import UUID
+
+from domain.models.events import Event
+
+T = TypeVar('T')
+
+
+class ReadCoalescerInterface(ABC):
+    @abstractmethod
+    async def run(
+            self,
+            name: str,
+            pair_id: Optional[UUID],
+            params: Hashable,
+            load: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Результат `load` для чтения `name` с параметрами `params`. Одновременные одинаковые чтения
+        ждут один вызов `load`, его результат ещё недолго отдаётся без запроса. Ошибки не кэшируются.
+        """
+        ...
+
+    @abstractmethod
+    def handle(self, event: Event) -> None:
+        """
+        Сбрасывает чтения пары, блок которой начался или завершился.
+        """
+        ...
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        ...
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
-from domain.metaholder.responses.user import UserBetsResponse, UserHistoryResponse
+from domain.metaholder.responses.user import UserBetsResponse, UserHistoryResponse, UserInfoResponse, UserStatsResponse
 from domain.models import User
 
 
@@ -14,6 +14,20 @@ class UserServiceInterface(ABC):
     async def get_user_by_wallet(self, wallet_address: str) -> User:
         ...
 
+    @abstractmethod
+    async def get_user_info(self, user_id: UUID) -> UserInfoResponse:
+        """
+        Баланс и статистика пользователя без загрузки его ставок.
+        """
+        ...
+
+    @abstractmethod
+    async def get_user_stats(self, user_id: UUID) -> UserStatsResponse:
+        """
+        Статистика пользователя по каждой паре, на которую он ставил.
+        """
+        ...
+
     @abstractmethod
     async def get_user_history(self, user_id: UUID) -> UserHistoryResponse:
         ...
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from uuid import UUID
+
+from domain.models.events import Event
+from domain.models.version import Version
+
+
+class VersionRegistryInterface(ABC):
+    @abstractmethod
+    def get_pair_version(self, pair_id: UUID) -> Optional[Version]:
+        """
+        Версия данных пары, которые меняются только с блоками: свечей и векторов.
+        None, если версия неизвестна и ответ нельзя подтверждать по ней.
+        """
+        ...
+
+    @abstractmethod
+    def get_user_version(self, user_id: UUID) -> Optional[Version]:
+        """
+        Версия ставок и истории пользователя.
+        """
+        ...
+
+    @abstractmethod
+    def touch_users(self, user_ids: Iterable[UUID]) -> None:
+        """
+        Меняет версии пользователей, чьи ставки или баланс изменил этот процесс.
+        Вызывается сразу после записи: ответ после неё не должен подтверждаться по старой версии,
+        даже если событие о ней опоздает или не будет опубликовано.
+        """
+        ...
+
+    @abstractmethod
+    def handle(self, event: Event) -> None:
+        ...
+
+    @abstractmethod
+    def set_active(self, active: bool) -> None:
+        """
+        Версии выдаются только пока слушатель событий подключён:
+        пропущенное событие оставило бы клиенту устаревший ответ.
+        """
+        ...
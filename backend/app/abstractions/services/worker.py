@@ -0,0 +1,11 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+
+class SettlementWorkerInterface(ABC):
+    @abstractmethod
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """
+        Ждёт лидерства и крутит генерацию блоков, пока не выставлен stop_event.
+        """
+        ...
@@ -0,0 +1,19 @@
+import hashlib
+from dataclasses import dataclass, field
+
+from .abstractions import VaultClientInterface
+
+
+@dataclass
+class InMemoryVaultClient(VaultClientInterface):
+    """
+    Offline stand-in for load tests and simulations.
+    Unknown secrets resolve to a deterministic 32-byte value derived from path and key.
+    """
+    secrets: dict[tuple[str, str], bytes] = field(default_factory=dict)
+
+    async def get_secret(self, path: str, key: str) -> bytes:
+        secret = self.secrets.get((path, key))
+        if secret is None:
+            secret = hashlib.sha256(f'{path}/{key}'.encode()).digest()
+        return secret
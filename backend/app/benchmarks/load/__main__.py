@@ -0,0 +1,215 @@
+"""
+End-to-end load test against the FastAPI app with a seeded local Postgres.
+
+    python -m benchmarks.load --reset --users 1000 --pairs 3 --history-blocks 200 --duration 60
+
+Runs fully offline: TON and Vault are replaced by in-memory stand-ins (ton.offline, secrets.offline),
+the app is driven in-process through ASGITransport and block generation runs in the same process
+with a short block interval, so many blocks are settled during one run.
+
+The database from settings.json is TRUNCATED with --reset: point it at a throwaway database,
+e.g. a separate database in the Postgres from backend/database/db-compose.yaml.
+With --backend memory no database is needed: the repositories keep everything in this process,
+which measures the service and HTTP layers alone.
+
+Latencies of failed requests are a measure of the error path, not of the service: the run exits with 1
+when requests fail (above --max-error-rate, zero by default) or a scheduler job run fails, and the report
+lists the failures by route and status code.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import subprocess
+import sys
+import time
+
+from settings import settings
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reset', action='store_true', help='truncate all tables before seeding')
+    parser.add_argument('--backend', choices=['sql', 'memory'], default='sql', help='repository backend')
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--pairs', type=int, default=3)
+    parser.add_argument('--history-blocks', type=int, default=200)
+    parser.add_argument('--bets-per-block', type=int, default=50)
+    parser.add_argument('--duration', type=float, default=60, help='seconds of load')
+    parser.add_argument('--concurrency', type=int, default=50, help='virtual users')
+    parser.add_argument('--deposit-rate', type=float, default=2, help='deposits per second')
+    parser.add_argument('--block-seconds', type=int, default=10, help='block interval during the run')
+    parser.add_argument('--deposit-check-seconds', type=int, default=2)
+    parser.add_argument('--ton-latency-ms', type=int, default=50, help='simulated TON call latency')
+    parser.add_argument('--json', dest='json_path', help='write the report as JSON')
+    parser.add_argument('--max-p99-ms', type=float, help='exit with 1 if any route p99 exceeds this')
+    parser.add_argument('--max-error-rate', type=float, default=0.0,
+                        help='exit with 1 if the share of failed requests exceeds this; failed jobs always fail the run')
+    args = parser.parse_args()
+    if args.history_blocks < 1:
+        parser.error('--history-blocks must be at least 1: bets are priced off the last completed block')
+    return args
+
+
+def _configure(args: argparse.Namespace) -> None:
+    # must happen before any dependency factory is called: services read settings on construction
+    settings.ton.offline = True
+    settings.ton.offline_latency_ms = args.ton_latency_ms
+    settings.secrets.offline = True
+    settings.chain.block_interval = args.block_seconds
+    settings.chain.resume_blocks = True
+    settings.jobs.transaction_check_interval = args.deposit_check_seconds
+    settings.debug = False
+    settings.repositories.backend = args.backend
+
+
+async def _run(args: argparse.Namespace) -> int:
+    from datetime import timedelta
+
+    from httpx import ASGITransport, AsyncClient
+    from sqlalchemy import func, select
+
+    from benchmarks.load.report import (
+        failed_job_runs,
+        format_report,
+        summarize_jobs,
+        summarize_routes,
+        summarize_settlement,
+    )
+    from benchmarks.load.scenario import LatencyRecorder, ScenarioConfig, feed_deposits, run_virtual_user
+    from benchmarks.load.seed import SeedConfig, is_database_empty, reset_database, seed_database, seed_memory_store
+    from dependencies.repositories import get_memory_store
+    from dependencies.services.auth.tokens import get_token_service
+    from dependencies.services.chain import get_chain_service
+    from dependencies.services.events import get_event_listener
+    from dependencies.services.ton.client import get_offline_client
+    from infrastructure.db import engine, session_maker
+    from infrastructure.db.entities import Block, DepositEntry
+    from main import app, log_listener
+    from services.CurrencyService import CurrencyService
+
+    logger = logging.getLogger('benchmarks.load')
+    # per-block INFO records of the services would drown the report
+    logging.getLogger().setLevel(logging.WARNING)
+
+    memory = args.backend == 'memory'
+    if not memory:
+        if subprocess.call(['alembic', 'upgrade', 'head']) != 0:
+            logger.error('migrations failed')
+            return 2
+
+        if args.reset:
+            await reset_database(session_maker)
+        elif not await is_database_empty(session_maker):
+            logger.error('database is not empty, pass --reset to truncate it (%s)', settings.db.name)
+            return 2
+
+    seed_config = SeedConfig(
+        users=args.users,
+        pairs=args.pairs,
+        history_blocks=args.history_blocks,
+        bets_per_block=args.bets_per_block,
+        block_interval=timedelta(seconds=args.block_seconds),
+        pool_address=CurrencyService.pool_address,
+    )
+    seed_started = time.perf_counter()
+    if memory:
+        seeded = await seed_memory_store(get_memory_store(), seed_config, inner_token_symbol=settings.inner_token.symbol)
+    else:
+        seeded = await seed_database(session_maker, seed_config, inner_token_symbol=settings.inner_token.symbol)
+    seed_seconds = time.perf_counter() - seed_started
+
+    token_service = get_token_service()
+    tokens = [
+        token_service.create_auth_token(wallet, payload='load-test').access_token.get_secret_value()
+        for wallet in seeded.user_wallets
+    ]
+
+    listener = get_event_listener()
+    await listener.start()
+    chain_service = get_chain_service()
+    await chain_service.start_block_generation()
+
+    config = ScenarioConfig(duration=args.duration, concurrency=args.concurrency, deposit_rate=args.deposit_rate)
+    recorder = LatencyRecorder()
+    rng = random.Random(config.seed)
+    deadline = time.perf_counter() + config.duration
+    started = time.perf_counter()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://load-test', timeout=60) as client:
+        results = await asyncio.gather(
+            feed_deposits(get_offline_client(), seeded.user_wallets, seeded.deposit_wallet_address, config, deadline,
+                          random.Random(rng.random())),
+            *(
+                run_virtual_user(client, rng.choice(tokens), seeded.pair_ids, config, recorder, deadline,
+                                 random.Random(rng.random()))
+                for _ in range(config.concurrency)
+            ),
+        )
+    elapsed = time.perf_counter() - started
+
+    await chain_service.stop_block_generation()
+    await listener.stop()
+
+    if memory:
+        store = get_memory_store()
+        deposits_credited, blocks_total = len(store.deposits), len(store.blocks)
+    else:
+        async with session_maker() as session:
+            deposits_credited = (await session.execute(select(func.count()).select_from(DepositEntry))).scalar()
+            blocks_total = (await session.execute(select(func.count()).select_from(Block))).scalar()
+    await engine.dispose()
+
+    routes = summarize_routes(recorder, elapsed)
+    settlement = summarize_settlement()
+    jobs = summarize_jobs()
+    extra = {
+        'seed_seconds': round(seed_seconds, 2),
+        'duration_seconds': round(elapsed, 2),
+        'total_rps': round(sum(len(v) for v in recorder.latencies.values()) / elapsed, 1),
+        'deposits_fed': results[0],
+        'deposits_credited': deposits_credited,
+        'blocks_in_db': blocks_total,
+    }
+    print(format_report(routes, settlement, jobs, extra))
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(
+                {'args': vars(args), 'routes': routes, 'settlement': settlement, 'jobs': jobs, 'extra': extra},
+                f,
+                indent=2,
+            )
+
+    if log_listener:
+        log_listener.stop()
+
+    status = 0
+    requests = sum(stats['requests'] for stats in routes.values())
+    errors = sum(stats['errors'] for stats in routes.values())
+    if requests and errors / requests > args.max_error_rate:
+        print(f'{errors} of {requests} requests failed: '
+              f'{ {route: stats["errors_by_status"] for route, stats in routes.items() if stats["errors"]} }',
+              file=sys.stderr)
+        status = 1
+    failed_jobs = failed_job_runs(jobs)
+    if failed_jobs:
+        print(f'failed job runs: {failed_jobs}', file=sys.stderr)
+        status = 1
+
+    if args.max_p99_ms is not None:
+        slow = {route: stats['p99_ms'] for route, stats in routes.items() if stats['p99_ms'] > args.max_p99_ms}
+        if slow:
+            print(f'p99 above {args.max_p99_ms} ms: {slow}', file=sys.stderr)
+            status = 1
+    return status
+
+
+def main() -> None:
+    args = _parse_args()
+    _configure(args)
+    sys.exit(asyncio.run(_run(args)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Latency percentiles from the recorder and settlement timings from the in-process Prometheus registry.
+"""
+import math
+from typing import Optional
+
+from prometheus_client import REGISTRY
+
+from benchmarks.load.scenario import LatencyRecorder
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize_routes(recorder: LatencyRecorder, duration: float) -> dict[str, dict]:
+    summary = {}
+    for route, latencies in sorted(recorder.latencies.items()):
+        summary[route] = {
+            'requests': len(latencies),
+            'errors': sum(recorder.errors.get(route, {}).values()),
+            'errors_by_status': dict(sorted(recorder.errors.get(route, {}).items())),
+            'rps': len(latencies) / duration,
+            'p50_ms': percentile(latencies, 0.5) * 1000,
+            'p99_ms': percentile(latencies, 0.99) * 1000,
+            'max_ms': max(latencies) * 1000,
+        }
+    return summary
+
+
+def _histogram_samples(name: str, labels: Optional[dict[str, str]] = None) -> tuple[list[tuple[float, float]], float]:
+    buckets, total = [], 0.0
+    for metric in REGISTRY.collect():
+        if metric.name != name:
+            continue
+        for sample in metric.samples:
+            sample_labels = {k: v for k, v in sample.labels.items() if k != 'le'}
+            if labels and sample_labels != labels:
+                continue
+            if sample.name == f'{name}_bucket':
+                buckets.append((float(sample.labels['le']), sample.value))
+            elif sample.name == f'{name}_sum':
+                total += sample.value
+    return sorted(buckets), total
+
+
+def histogram_summary(name: str, labels: Optional[dict[str, str]] = None) -> dict[str, float]:
+    """
+    Count, mean and bucket-interpolated p50/p99 of a histogram, the same estimate histogram_quantile gives.
+    """
+    buckets, total = _histogram_samples(name, labels)
+    count = buckets[-1][1] if buckets else 0
+    result = {'count': count, 'mean_ms': total / count * 1000 if count else 0.0}
+    for key, q in (('p50_ms', 0.5), ('p99_ms', 0.99)):
+        result[key] = _bucket_quantile(buckets, q) * 1000 if count else 0.0
+    return result
+
+
+def _bucket_quantile(buckets: list[tuple[float, float]], q: float) -> float:
+    rank = q * buckets[-1][1]
+    previous_bound, previous_count = 0.0, 0.0
+    for bound, cumulative in buckets:
+        if cumulative >= rank:
+            if math.isinf(bound):
+                return previous_bound
+            in_bucket = cumulative - previous_count
+            fraction = (rank - previous_count) / in_bucket if in_bucket else 0.0
+            return previous_bound + (bound - previous_bound) * fraction
+        previous_bound, previous_count = bound, cumulative
+    return previous_bound
+
+
+def summarize_settlement() -> dict[str, dict]:
+    summary = {'total': histogram_summary('block_settlement_duration_seconds')}
+    for stage in ('aggregate', 'rewards', 'mint', 'resolve', 'stats', 'rebets'):
+        summary[stage] = histogram_summary('block_settlement_stage_duration_seconds', {'stage': stage})
+    return summary
+
+
+def summarize_jobs() -> dict[str, dict[str, int]]:
+    """
+    Scheduler job runs by outcome: a failed block_generation run leaves its block unsettled.
+    """
+    summary = {}
+    for metric in REGISTRY.collect():
+        if metric.name != 'scheduler_job_runs':
+            continue
+        for sample in metric.samples:
+            if sample.name == 'scheduler_job_runs_total':
+                summary.setdefault(sample.labels['job'], {})[sample.labels['outcome']] = int(sample.value)
+    return dict(sorted(summary.items()))
+
+
+def failed_job_runs(jobs: dict[str, dict[str, int]]) -> dict[str, int]:
+    failed = {job: outcomes.get('error', 0) + outcomes.get('timeout', 0) for job, outcomes in jobs.items()}
+    return {job: count for job, count in failed.items() if count}
+
+
+def format_report(
+        routes: dict[str, dict],
+        settlement: dict[str, dict],
+        jobs: dict[str, dict[str, int]],
+        extra: dict[str, float],
+) -> str:
+    lines = [f'{"route":<24}{"requests":>10}{"errors":>8}{"rps":>9}{"p50 ms":>10}{"p99 ms":>10}{"max ms":>10}']
+    for route, stats in routes.items():
+        lines.append(
+            f'{route:<24}{stats["requests"]:>10}{stats["errors"]:>8}{stats["rps"]:>9.1f}'
+            f'{stats["p50_ms"]:>10.1f}{stats["p99_ms"]:>10.1f}{stats["max_ms"]:>10.1f}'
+        )
+    errors = [(route, status, count) for route, stats in routes.items()
+              for status, count in stats['errors_by_status'].items()]
+    if errors:
+        lines.append('')
+        lines.append(f'{"errors":<24}{"status":>10}{"count":>8}')
+        lines.extend(f'{route:<24}{status:>10}{count:>8}' for route, status, count in errors)
+    lines.append('')
+    lines.append(f'{"settlement":<24}{"blocks":>10}{"mean ms":>10}{"p50 ms":>10}{"p99 ms":>10}')
+    for stage, stats in settlement.items():
+        lines.append(
+            f'{stage:<24}{int(stats["count"]):>10}{stats["mean_ms"]:>10.1f}{stats["p50_ms"]:>10.1f}{stats["p99_ms"]:>10.1f}'
+        )
+    lines.append('')
+    for job, outcomes in jobs.items():
+        lines.append(f'{job}: ' + ', '.join(f'{outcome} {count}' for outcome, count in sorted(outcomes.items())))
+    lines.append('')
+    lines.extend(f'{key}: {value:g}' for key, value in extra.items())
+    return '\n'.join(lines)
@@ -0,0 +1,131 @@
+"""
+Virtual users hitting the API and a deposit feeder for the offline TON client.
+"""
+import asyncio
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Optional
+from uuid import UUID, uuid4
+
+from httpx import AsyncClient, Response
+
+from domain.ton.transaction import TonTransaction, TonTransactionStatus
+from services.ton.client.offline import OfflineTonClient
+
+
+@dataclass(kw_only=True)
+class ScenarioConfig:
+    duration: float  # seconds
+    concurrency: int
+    deposit_rate: float  # deposits per second
+    # relative frequency of each user action
+    weights: dict[str, float] = field(default_factory=lambda: {
+        'bet': 1.0,
+        'time': 4.0,
+        'candles': 2.0,
+        'info': 2.0,
+        'state': 1.0,
+    })
+    candles: int = 50
+    seed: int = 42
+
+
+@dataclass
+class LatencyRecorder:
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    # route -> status code -> count; 599 stands for a request that raised instead of answering
+    errors: dict[str, dict[int, int]] = field(default_factory=lambda: defaultdict(lambda: defaultdict(int)))
+
+    def record(self, route: str, status_code: int, elapsed: float) -> None:
+        self.latencies[route].append(elapsed)
+        if status_code >= 400:
+            self.errors[route][status_code] += 1
+
+
+async def _send(recorder: LatencyRecorder, route: str, request: Awaitable[Response]) -> Optional[Response]:
+    started = time.perf_counter()
+    try:
+        response = await request
+        status_code = response.status_code
+    except Exception:
+        response, status_code = None, 599
+    recorder.record(route, status_code, time.perf_counter() - started)
+    return response if status_code < 400 else None
+
+
+async def run_virtual_user(
+        client: AsyncClient,
+        token: str,
+        pair_ids: list[UUID],
+        config: ScenarioConfig,
+        recorder: LatencyRecorder,
+        deadline: float,
+        rng: random.Random,
+) -> None:
+    headers = {'Authorization': f'Bearer {token}'}
+    actions, weights = zip(*config.weights.items())
+    while time.perf_counter() < deadline:
+        action = rng.choices(actions, weights)[0]
+        pair_id = rng.choice(pair_ids)
+        match action:
+            case 'bet':
+                # the client prices its prediction off the last result, as the frontend does:
+                # bets too far from it are rejected
+                response = await _send(recorder, 'GET /block/last_vector', client.get(
+                    '/block/last_vector',
+                    headers=headers,
+                    params={'pair_id': str(pair_id)},
+                ))
+                if response is None:
+                    continue
+                price = response.json()[0]
+                route, request = 'POST /bets/bet', client.post('/bets/bet', headers=headers, json={
+                    'pair_id': str(pair_id),
+                    'amount': 0,
+                    'predicted_vector': [price * (1 + rng.uniform(-0.05, 0.05)), rng.randint(0, 1_000)],
+                })
+            case 'time':
+                route, request = 'GET /chain/time', client.get('/chain/time', headers=headers)
+            case 'candles':
+                route, request = 'GET /candles', client.get(
+                    '/candles',
+                    headers=headers,
+                    params={'pair_id': str(pair_id), 'n': config.candles},
+                )
+            case 'info':
+                route, request = 'GET /user/info', client.get('/user/info', headers=headers)
+            case 'state':
+                route, request = 'GET /chain/state', client.get('/chain/state', headers=headers)
+            case _:
+                raise ValueError(f'Unknown action {action}')
+        await _send(recorder, route, request)
+
+
+async def feed_deposits(
+        ton_client: OfflineTonClient,
+        user_wallets: list[str],
+        deposit_wallet_address: str,
+        config: ScenarioConfig,
+        deadline: float,
+        rng: random.Random,
+) -> int:
+    if config.deposit_rate <= 0:
+        return 0
+
+    fed = 0
+    while time.perf_counter() < deadline:
+        ton_client.add_incoming_transaction(TonTransaction(
+            from_address=rng.choice(user_wallets),
+            to_address=deposit_wallet_address,
+            amount=int(rng.uniform(1, 100) * 1e9),
+            token='TON',
+            sent_at=datetime.now(),
+            status=TonTransactionStatus.COMPLETED,
+            tx_id=uuid4().hex,
+        ))
+        fed += 1
+        await asyncio.sleep(1 / config.deposit_rate)
+    return fed
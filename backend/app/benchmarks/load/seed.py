@@ -0,0 +1,240 @@
+"""
+Seeds a dedicated Postgres database, or the in-memory store, with users, pairs, chains and historical blocks
+for load tests.
+"""
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from domain.dto.candle import BlockCandleDTO
+from domain.enums import BetStatus, WalletType
+from domain.enums.block_status import BlockStatus
+from domain.enums.chain_status import ChainStatus
+from domain.enums.ledger import LedgerEntryType
+from domain.models.app_wallet import AppWalletVersion
+from infrastructure.db.entities import AppWallet, Bet, Block, Candle, Chain, LedgerEntry, Pair, User
+from infrastructure.memory import InMemoryStore
+from infrastructure.memory.repositories import (
+    InMemoryAppWalletRepository,
+    InMemoryBetRepository,
+    InMemoryBlockRepository,
+    InMemoryCandleRepository,
+    InMemoryChainRepository,
+    InMemoryPairRepository,
+    InMemoryUserRepository,
+)
+from infrastructure.memory.store import AppWalletRow, BetRow, BlockRow, ChainRow, PairRow, UserRow
+from services.app_wallet.provider import AppWalletProvider
+
+TABLES = (
+    'candles', 'leaderboard_entries', 'user_pair_stats', 'user_stats', 'balance_snapshots', 'ledger_entries',
+    'deposit_entries', 'transactions', 'bets', 'blocks', 'chains', 'swap', 'pairs', 'app_wallets', 'users',
+)
+CHUNK_SIZE = 5_000
+DEPOSIT_WALLET_ADDRESS = '0:' + 'de' * 32
+
+
+@dataclass(kw_only=True)
+class SeedConfig:
+    users: int
+    pairs: int
+    history_blocks: int
+    bets_per_block: int
+    block_interval: timedelta
+    initial_balance: float = 1_000.0
+    # contract address of the first pair: deposits are converted at the price of the pool the currency service
+    # reads, and without a pair at that address every deposit check fails
+    pool_address: Optional[str] = None
+    seed: int = 42
+
+
+@dataclass(kw_only=True)
+class SeededData:
+    user_wallets: list[str]
+    pair_ids: list[UUID]
+    deposit_wallet_address: str
+
+
+async def reset_database(session_maker: async_sessionmaker) -> None:
+    async with session_maker() as session, session.begin():
+        await session.execute(text(f"TRUNCATE {', '.join(TABLES)} CASCADE"))
+
+
+async def is_database_empty(session_maker: async_sessionmaker) -> bool:
+    async with session_maker() as session:
+        return not (await session.execute(text('SELECT EXISTS (SELECT 1 FROM users)'))).scalar()
+
+
+def _generate(
+        config: SeedConfig,
+        inner_token_symbol: str,
+) -> tuple[dict[str, list[dict]], list[BlockCandleDTO], SeededData]:
+    rng = random.Random(config.seed)
+    now = datetime.now()
+
+    users = [
+        {
+            'id': uuid4(),
+            'username': f'load_{i}',
+            'wallet_address': f'0:{i:064x}',
+            'balance': config.initial_balance,
+        }
+        for i in range(config.users)
+    ]
+    pairs = [
+        {
+            'id': uuid4(),
+            'name': f'LT{i}/{inner_token_symbol}',
+            'contract_address': config.pool_address if i == 0 and config.pool_address else f'EQ-load-{i}',
+            'last_ratio': 1.0,
+        }
+        for i in range(config.pairs)
+    ]
+
+    # the current block started a moment ago; history is laid out on the same slot grid
+    origin = now - config.block_interval * (config.history_blocks + 0.1)
+    chains, blocks, bets, candles = [], [], [], []
+    for pair in pairs:
+        chain_id = uuid4()
+        chains.append({
+            'id': chain_id,
+            'pair_id': pair['id'],
+            'current_block': config.history_blocks + 1,
+            'status': ChainStatus.ACTIVE,
+            'created_at': origin.astimezone(),
+        })
+
+        price = 100.0
+        for number in range(1, config.history_blocks + 2):
+            block_id = uuid4()
+            created_at = origin + config.block_interval * (number - 1)
+            completed = number <= config.history_blocks
+            price *= 1 + rng.uniform(-0.02, 0.02)
+            blocks.append({
+                'id': block_id,
+                'chain_id': chain_id,
+                'block_number': number,
+                'status': BlockStatus.COMPLETED if completed else BlockStatus.IN_PROGRESS,
+                'result_vector': [price, rng.randint(0, 1_000)] if completed else None,
+                'created_at': created_at,
+                'completed_at': created_at + config.block_interval if completed else None,
+            })
+            if not completed:
+                continue
+            block_bets = []
+            for user in rng.sample(users, min(config.bets_per_block, len(users))):
+                block_bets.append({
+                    'id': uuid4(),
+                    'user_id': user['id'],
+                    'pair_id': pair['id'],
+                    'block_id': block_id,
+                    'amount': rng.uniform(1, 10),
+                    'vector': [price * (1 + rng.uniform(-0.05, 0.05)), rng.randint(0, 1_000)],
+                    'status': BetStatus.RESOLVED,
+                    'reward': rng.uniform(-1, 1),
+                    'accuracy': rng.random(),
+                    'created_at': created_at,
+                })
+            bets.extend(block_bets)
+            prices = [bet['vector'][0] for bet in block_bets]
+            candles.append(BlockCandleDTO(
+                pair_id=pair['id'],
+                block_number=number,
+                created_at=created_at,
+                close=price,
+                high=max(prices, default=None),
+                low=min(prices, default=None),
+                volume=sum(bet['amount'] for bet in block_bets),
+            ))
+
+    deposit_wallet = {
+        'id': AppWalletProvider.deposit_wallet_id,
+        'address': DEPOSIT_WALLET_ADDRESS,
+        'wallet_version': AppWalletVersion.V4R2,
+        'wallet_type': WalletType.DEPOSIT,
+        'balance': 0.0,
+    }
+
+    tables = {
+        'users': users,
+        'pairs': pairs,
+        'app_wallets': [deposit_wallet],
+        'chains': chains,
+        'blocks': blocks,
+        'bets': bets,
+    }
+    return tables, candles, SeededData(
+        user_wallets=[user['wallet_address'] for user in users],
+        pair_ids=[pair['id'] for pair in pairs],
+        deposit_wallet_address=DEPOSIT_WALLET_ADDRESS,
+    )
+
+
+def _split_vector(row: dict, key: str, columns: tuple[str, str]) -> dict:
+    # bulk inserts bypass the vector properties of the entities
+    row = dict(row)
+    vector = row.pop(key)
+    row.update(zip(columns, vector if vector is not None else (None, None)))
+    return row
+
+
+async def _roll_up(store: InMemoryStore, candles: list[BlockCandleDTO]) -> None:
+    repository = InMemoryCandleRepository(store)
+    for candle in candles:
+        await repository.record(candle)
+
+
+async def seed_database(session_maker: async_sessionmaker, config: SeedConfig, inner_token_symbol: str) -> SeededData:
+    tables, candles, seeded = _generate(config, inner_token_symbol)
+    blocks = [_split_vector(row, 'result_vector', ('result_price', 'result_tx_count')) for row in tables['blocks']]
+    bets = [_split_vector(row, 'vector', ('predicted_price', 'predicted_tx_count')) for row in tables['bets']]
+    # balances live in the ledger: every user starts with one deposit
+    users = [{key: value for key, value in row.items() if key != 'balance'} for row in tables['users']]
+    ledger = [
+        {'id': uuid4(), 'user_id': row['id'], 'type': LedgerEntryType.DEPOSIT, 'amount': row['balance']}
+        for row in tables['users']
+    ]
+    # the rollups are computed in memory by the code that maintains them, then inserted in bulk
+    rollups = InMemoryStore()
+    await _roll_up(rollups, candles)
+    candle_rows = [
+        {'pair_id': pair_id, 'resolution': resolution, **asdict(row)}
+        for (pair_id, resolution), series in rollups.candles.items()
+        for row in series
+    ]
+    async with session_maker() as session, session.begin():
+        for entity, rows in (
+                (User, users),
+                (LedgerEntry, ledger),
+                (Pair, tables['pairs']),
+                (AppWallet, tables['app_wallets']),
+                (Chain, tables['chains']),
+                (Block, blocks),
+                (Bet, bets),
+                (Candle, candle_rows),
+        ):
+            for start in range(0, len(rows), CHUNK_SIZE):
+                await session.execute(insert(entity), rows[start:start + CHUNK_SIZE])
+    return seeded
+
+
+async def seed_memory_store(store: InMemoryStore, config: SeedConfig, inner_token_symbol: str) -> SeededData:
+    tables, candles, seeded = _generate(config, inner_token_symbol)
+    now = store.now()
+    for repository, row_type, rows in (
+            (InMemoryUserRepository(store), UserRow, tables['users']),
+            (InMemoryPairRepository(store), PairRow, tables['pairs']),
+            (InMemoryAppWalletRepository(store), AppWalletRow, tables['app_wallets']),
+            (InMemoryChainRepository(store), ChainRow, tables['chains']),
+            (InMemoryBlockRepository(store), BlockRow, tables['blocks']),
+            (InMemoryBetRepository(store), BetRow, tables['bets']),
+    ):
+        for row in rows:
+            repository.add_row(row_type(**{'created_at': now, 'updated_at': now, **row}))
+    await _roll_up(store, candles)
+    return seeded
@@ -0,0 +1,97 @@
+"""
+Event-loop time spent in logging while aggregating a block of bets.
+
+    python -m benchmarks.logging_overhead --bets 10000
+
+"before": synchronous root StreamHandler (the former logging.basicConfig) with the per-bet INFO lines
+AggregateBetsService used to emit. "after": setup_logging() with the queue listener and the current
+per-bet DEBUG line. Output goes to a temporary file so terminal speed does not skew the numbers.
+"""
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from uuid import uuid4
+
+from infrastructure.log import TEXT_FORMAT, setup_logging
+from settings import LoggingSettings
+
+logger = logging.getLogger('services.math_services.AggregateBetsService')
+
+
+def _make_bets(n: int) -> list[tuple]:
+    return [(uuid4(), float(i % 100 + 1), (0.01 * (i % 7), i % 13)) for i in range(n)]
+
+
+async def _aggregate(bets: list[tuple], log_style: str) -> None:
+    total_weight = aggregate_x = aggregate_y = 0.0
+    for bet_id, weight, vector in bets:
+        total_weight += weight
+        aggregate_x += vector[0] * weight
+        aggregate_y += vector[1] * weight
+        if log_style == 'before':
+            for name, value in (
+                    ('weight', weight),
+                    ('total_weight', total_weight),
+                    ('aggregate_x', aggregate_x),
+                    ('aggregate_y', aggregate_y),
+            ):
+                logger.info(name)
+                logger.info(value)
+        elif log_style == 'after':
+            logger.debug(
+                'bet %s: weight=%s total_weight=%s aggregate_x=%s aggregate_y=%s',
+                bet_id, weight, total_weight, aggregate_x, aggregate_y,
+            )
+    logger.info('aggregated over %s bets: %s', len(bets), (aggregate_x, aggregate_y))
+
+
+def _measure(bets: list[tuple], log_style: str) -> float:
+    started = time.perf_counter()
+    asyncio.run(_aggregate(bets, log_style))
+    return time.perf_counter() - started
+
+
+def _configure_before(stream) -> None:
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bets', type=int, default=10_000)
+    parser.add_argument('--level', choices=['INFO', 'DEBUG'], default='INFO',
+                        help='level of the "after" pipeline; DEBUG shows the cost of enabled per-bet records')
+    args = parser.parse_args()
+
+    bets = _make_bets(args.bets)
+    with tempfile.TemporaryFile('w+') as stream:
+        logging.disable(logging.CRITICAL)
+        baseline = _measure(bets, 'none')
+        logging.disable(logging.NOTSET)
+
+        _configure_before(stream)
+        before = _measure(bets, 'before') - baseline
+
+        listener = setup_logging(LoggingSettings(), getattr(logging, args.level), stream=stream)
+        after = _measure(bets, 'after') - baseline
+        drain_started = time.perf_counter()
+        if listener:
+            listener.stop()
+        drain = time.perf_counter() - drain_started
+
+    print(f'bets: {args.bets}, compute without logging: {baseline * 1000:.1f} ms')
+    print(f'{"pipeline":<10}{"loop time, ms":>16}{"per bet, us":>14}')
+    for name, elapsed in (('before', before), ('after', after)):
+        print(f'{name:<10}{elapsed * 1000:>16.1f}{elapsed / args.bets * 1e6:>14.2f}')
+    print(f'writer thread drain after the run (off-loop): {drain * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,4 @@
+"""
+Micro-benchmarks of the math services: AggregateBetsService, RewardDistributionService and LiquidityManager
+at a growing number of bets, see `python -m benchmarks.math --help`.
+"""
@@ -0,0 +1,185 @@
+"""
+Micro-benchmarks of the math services at 10, 1k, 100k and 1M bets: wall time and peak traced memory.
+
+    python -m benchmarks.math run --output /tmp/math.json
+    python -m benchmarks.math compare benchmarks/math/baselines/baseline.json
+    python -m benchmarks.math compare benchmarks/math/baselines/baseline.json /tmp/math.json
+
+`compare` without a second file runs the suite with the sizes and cases of the baseline first.
+It exits with 1 if any case got slower or bigger than the tolerances allow, so it can gate a change to
+the aggregation or reward math. Time is the best of several runs and is only comparable on the same
+machine (the baseline records where it was taken); peak memory is measured in a separate run under
+tracemalloc and is stable across machines running the same Python version.
+
+Refresh the committed baseline with `run --output benchmarks/math/baselines/baseline.json` when a change
+is accepted.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.math.cases import CASES
+
+DEFAULT_SIZES = [10, 1_000, 100_000, 1_000_000]
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run the suite and print or save the results')
+    run.add_argument('--output', help='write the results as JSON')
+    _add_run_options(run, sizes_default=DEFAULT_SIZES, cases_default=list(CASES))
+
+    compare = commands.add_parser('compare', help='compare results with a baseline')
+    compare.add_argument('baseline')
+    compare.add_argument('current', nargs='?', help='results of `run --output`; the suite is run if omitted')
+    compare.add_argument('--time-tolerance', type=float, default=0.25,
+                         help='allowed relative slowdown, 0.25 = 25%%')
+    compare.add_argument('--memory-tolerance', type=float, default=0.10,
+                         help='allowed relative growth of peak memory')
+    compare.add_argument('--min-seconds', type=float, default=0.001,
+                         help='slowdowns smaller than this many seconds are noise')
+    compare.add_argument('--min-bytes', type=int, default=4096,
+                         help='growth of peak memory smaller than this many bytes is noise')
+    _add_run_options(compare, sizes_default=None, cases_default=None)
+    return parser.parse_args()
+
+
+def _add_run_options(parser: argparse.ArgumentParser, sizes_default, cases_default) -> None:
+    parser.add_argument('--sizes', type=int, nargs='+', default=sizes_default, help='numbers of bets')
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=cases_default)
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per case, the best one counts')
+    parser.add_argument('--budget', type=float, default=3.0,
+                        help='stop repeating a case once its timed runs took this many seconds')
+    parser.add_argument('--seed', type=int, default=0)
+
+
+async def _measure(case: str, n: int, seed: int, repeat: int, budget: float) -> dict:
+    run = await CASES[case](n, random.Random(seed))
+    gc.collect()
+
+    timings = []
+    while len(timings) < max(1, repeat) and sum(timings) < budget:
+        started = time.perf_counter()
+        await run()
+        timings.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del run
+    gc.collect()
+    return {'seconds': min(timings), 'runs': len(timings), 'peak_bytes': peak - before}
+
+
+async def _run_suite(cases: list[str], sizes: list[int], seed: int, repeat: int, budget: float) -> dict:
+    results = {}
+    for case in cases:
+        results[case] = {}
+        for n in sizes:
+            result = await _measure(case, n, seed, repeat, budget)
+            results[case][str(n)] = result
+            print(
+                f'{case:<28}{n:>10}{result["seconds"] * 1000:>12.2f} ms{result["peak_bytes"] / 1024:>12.1f} KiB',
+                file=sys.stderr,
+            )
+    return {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'machine': f'{platform.system()} {platform.machine()} {platform.processor() or ""}'.strip(),
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def _ratio(current: float, baseline: float) -> float:
+    return current / baseline if baseline else float('inf') if current else 1.0
+
+
+def _compare(baseline: dict, current: dict, args: argparse.Namespace) -> int:
+    if baseline['meta'].get('machine') != current['meta'].get('machine'):
+        print(
+            f'warning: the baseline was taken on {baseline["meta"].get("machine")!r}, '
+            f'timings from {current["meta"].get("machine")!r} are not comparable',
+            file=sys.stderr,
+        )
+
+    regressions = missing = 0
+    print(f'{"case":<28}{"bets":>10}{"base ms":>12}{"now ms":>12}{"x":>7}{"base KiB":>12}{"now KiB":>12}{"x":>7}')
+    for case, sizes in baseline['results'].items():
+        for n, base in sizes.items():
+            now = current['results'].get(case, {}).get(n)
+            if now is None:
+                missing += 1
+                continue
+            time_ratio = _ratio(now['seconds'], base['seconds'])
+            memory_ratio = _ratio(now['peak_bytes'], base['peak_bytes'])
+            slower = (
+                    time_ratio > 1 + args.time_tolerance
+                    and now['seconds'] - base['seconds'] > args.min_seconds
+            )
+            bigger = (
+                    memory_ratio > 1 + args.memory_tolerance
+                    and now['peak_bytes'] - base['peak_bytes'] > args.min_bytes
+            )
+            regressions += slower or bigger
+            flags = ' '.join(flag for flag, on in (('SLOWER', slower), ('BIGGER', bigger)) if on)
+            print(
+                f'{case:<28}{n:>10}'
+                f'{base["seconds"] * 1000:>12.2f}{now["seconds"] * 1000:>12.2f}{time_ratio:>7.2f}'
+                f'{base["peak_bytes"] / 1024:>12.1f}{now["peak_bytes"] / 1024:>12.1f}{memory_ratio:>7.2f}'
+                f'  {flags}'.rstrip()
+            )
+    if missing:
+        print(f'{missing} baseline result(s) not measured in the current run')
+    print(f'{regressions} regression(s)')
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    args = _parse_args()
+    # AggregateBetsService logs a summary per call; keep it out of the numbers
+    logging.disable(logging.CRITICAL)
+
+    if args.command == 'run':
+        results = asyncio.run(_run_suite(args.cases, args.sizes, args.seed, args.repeat, args.budget))
+        output = json.dumps(results, indent=2)
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(output + '\n')
+        else:
+            print(output)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.current:
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        cases = args.cases or list(baseline['results'])
+        sizes = args.sizes or sorted({int(n) for sizes in baseline['results'].values() for n in sizes})
+        current = asyncio.run(_run_suite(cases, sizes, args.seed, args.repeat, args.budget))
+    return _compare(baseline, current, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+What is measured. Every case prepares its inputs for `n` bets once, outside of the measurement, and returns
+a coroutine factory that runs the service call under test.
+
+    aggregate_bets   AggregateBetsService.aggregate_bets over a block with n bets; the block model is
+                     loaded once, so the number is the weighted-mean loop itself
+    aggregate_bets_in_database
+                     the same with in_database=True: the repository sums the stored rows, no bet models
+                     are built (the in-memory stand-in for the SQL aggregate)
+    calculate_rewards
+                     RewardDistributionService.calculate_rewards for n users, including update_rewards,
+                     which looks up the last resolved bet and writes the reward of every user through
+                     the in-memory bet repository
+    liquidity_action LiquidityManager.decide_liquidity_action for n predicted prices, one per settled block
+"""
+import random
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable
+from uuid import UUID, uuid4
+
+from domain.enums import BetStatus
+from domain.enums.block_status import BlockStatus
+from domain.enums.chain_status import ChainStatus
+from domain.models.block import Block as BlockModel
+from domain.models.prediction import Prediction
+from domain.models.user_prediction import UserPrediction
+from infrastructure.memory import InMemoryStore
+from infrastructure.memory.repositories import InMemoryBetRepository, InMemoryBlockRepository
+from infrastructure.memory.store import BetRow, BlockRow, ChainRow, PairRow, UserRow
+from services.math_services.AggregateBetsService import AggregateBetsService
+from services.math_services.LiquidityManager import LiquidityManager
+from services.math_services.RewardDistributionService import RewardDistributionService
+
+PRICE = 5.0
+TX_COUNT = 120.0
+INNER_TOKEN = 'DD'
+
+Run = Callable[[], Awaitable[object]]
+
+
+@dataclass
+class _PreloadedBlockRepository(InMemoryBlockRepository):
+    """
+    Returns the same block model on every `get`, so aggregate_bets is measured without building n bet models.
+    """
+    block: BlockModel = None
+
+    async def get(self, obj_id: UUID) -> BlockModel:
+        return self.block
+
+
+def _populate(n: int, rng: random.Random) -> tuple[InMemoryStore, BlockRow]:
+    """
+    One pair, one chain and one completed block holding a resolved bet of each of n users.
+    """
+    store = InMemoryStore()
+    now = datetime.now()
+    pair = PairRow(id=uuid4(), name='TON/DD', created_at=now, updated_at=now)
+    chain = ChainRow(
+        id=uuid4(), pair_id=pair.id, current_block=1, status=ChainStatus.ACTIVE, created_at=now, updated_at=now,
+    )
+    block = BlockRow(
+        id=uuid4(), chain_id=chain.id, block_number=1, status=BlockStatus.COMPLETED,
+        result_vector=[PRICE, TX_COUNT], completed_at=now, created_at=now, updated_at=now,
+    )
+    store.pairs[pair.id] = pair
+    store.chains[chain.id] = chain
+    store.chains_by_pair[pair.id] = chain
+    store.blocks[block.id] = block
+    store.blocks_by_chain[chain.id] = [block]
+
+    block_bets = store.bets_by_block[block.id] = []
+    for i in range(n):
+        user = UserRow(id=uuid4(), wallet_address=f'0:{i:064x}', balance=1000.0, created_at=now, updated_at=now)
+        bet = BetRow(
+            id=uuid4(), user_id=user.id, pair_id=pair.id, block_id=block.id,
+            amount=rng.uniform(1, 100),
+            vector=[PRICE * rng.uniform(0.9, 1.1), TX_COUNT * rng.uniform(0.8, 1.2)],
+            status=BetStatus.RESOLVED, created_at=now, updated_at=now,
+        )
+        store.users[user.id] = user
+        store.bets[bet.id] = bet
+        block_bets.append(bet)
+        store.bets_by_user[user.id] = [bet]
+    return store, block
+
+
+async def aggregate_bets(n: int, rng: random.Random) -> Run:
+    store, block = _populate(n, rng)
+    repository = _PreloadedBlockRepository(store=store)
+    repository.block = await InMemoryBlockRepository.get(repository, block.id)
+    service = AggregateBetsService(block_repository=repository)
+    return lambda: service.aggregate_bets(block.id)
+
+
+async def aggregate_bets_in_database(n: int, rng: random.Random) -> Run:
+    store, block = _populate(n, rng)
+    service = AggregateBetsService(block_repository=InMemoryBlockRepository(store=store), in_database=True)
+    return lambda: service.aggregate_bets(block.id)
+
+
+async def calculate_rewards(n: int, rng: random.Random) -> Run:
+    store, block = _populate(n, rng)
+    prediction = Prediction(
+        user_predictions=[
+            UserPrediction(
+                user_id=bet.user_id,
+                stake=bet.amount,
+                predicted_price_change=bet.vector[0],
+                predicted_tx_count=bet.vector[1],
+            ) for bet in store.bets_by_block[block.id]
+        ],
+        actual_price_change=PRICE,
+        actual_tx_count=TX_COUNT,
+        block_id=block.id,
+    )
+    service = RewardDistributionService(bet_repository=InMemoryBetRepository(store=store))
+    return lambda: service.calculate_rewards(prediction)
+
+
+async def liquidity_action(n: int, rng: random.Random) -> Run:
+    manager = LiquidityManager(inner_token_symbol=INNER_TOKEN)
+    pool = {INNER_TOKEN: 1000.0, 'TON': PRICE * 1000.0}
+    # every third prediction equals the pool price, so HOLD is exercised along with both directions
+    prices = [PRICE if i % 3 == 0 else PRICE * rng.uniform(0.5, 1.5) for i in range(n)]
+
+    async def run():
+        for price in prices:
+            await manager.decide_liquidity_action(current_pool_state=pool, predicted_price=price)
+
+    return run
+
+
+CASES: dict[str, Callable[[int, random.Random], Awaitable[Run]]] = {
+    'aggregate_bets': aggregate_bets,
+    'aggregate_bets_in_database': aggregate_bets_in_database,
+    'calculate_rewards': calculate_rewards,
+    'liquidity_action': liquidity_action,
+}
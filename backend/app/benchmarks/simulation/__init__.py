@@ -0,0 +1,4 @@
+"""
+Offline block simulator: the real ChainService, BlockService, OrchestratorService and math services
+run against a virtual clock and in-memory repositories, see `python -m benchmarks.simulation --help`.
+"""
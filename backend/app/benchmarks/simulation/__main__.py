@@ -0,0 +1,110 @@
+"""
+Simulates block settlement offline, without a database and without waiting for block boundaries.
+
+    python -m benchmarks.simulation --blocks 5000 --users 200 --pairs 2
+    python -m benchmarks.simulation --blocks 2000 --base-multiplier 1.1 --accuracy squared --json report.json
+    python -m benchmarks.simulation --trace incident.json --blocks-jsonl blocks.jsonl
+
+The production ChainService, BlockService, OrchestratorService, BetService and math services run against
+in-memory repositories and a virtual clock: block generation jumps straight to the next block boundary.
+TON and Vault are offline stand-ins, minted amounts are only counted. No database is touched.
+See benchmarks/simulation/scenario.py for the trace format.
+
+blocks_per_second counts every settled round, including those whose block generation failed part way
+(job_failures): a failed settlement skips its remaining stages, so quote the throughput with the failure count.
+With the synthetic bettors most settlements currently fail. The aggregated price is also divided by the number
+of bets, so prices collapse within a few blocks and re-bets are rejected with "No money bro":
+300 blocks fail 257 times with --users 10 and every time with --users 100 --pairs 2.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from datetime import timedelta
+
+from settings import settings
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--blocks', type=int, help='block rounds to settle (default: 1000, or the trace length)')
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--pairs', type=int, default=1)
+    parser.add_argument('--initial-balance', type=float, default=1_000)
+    parser.add_argument('--price', type=float, default=100, help='result price of the genesis block')
+    parser.add_argument('--tx-count', type=float, default=100, help='result tx count of the genesis block')
+    parser.add_argument('--activity', type=float, default=0.3, help='chance of a user to place a fresh bet per block')
+    parser.add_argument('--noise', type=float, default=0.02, help='mean relative error of predictions')
+    parser.add_argument('--trace', help='replay bets from a JSON trace instead of synthetic bettors')
+    parser.add_argument('--block-seconds', type=int, default=settings.chain.block_interval, help='virtual block interval')
+    parser.add_argument('--base-multiplier', type=float, default=1.3)
+    parser.add_argument('--accuracy', default='relative', help='relative, squared, exponential or module:function')
+    parser.add_argument('--no-history', dest='history', action='store_false',
+                        help='do not seed a resolved bet per user (settling first bets then fails)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--stop-on-error', action='store_true', help='stop at the first failed block generation')
+    parser.add_argument('--json', dest='json_path', help='write the summary as JSON')
+    parser.add_argument('--blocks-jsonl', help='write every settled block as a JSON line')
+    parser.add_argument('--log-level', default='CRITICAL', help='ERROR logs the traceback of every failed settlement')
+    return parser.parse_args()
+
+
+async def _run(args: argparse.Namespace) -> int:
+    from benchmarks.simulation.report import format_summary, summarize, write_blocks
+    from benchmarks.simulation.scenario import (
+        ReplayBettors,
+        SyntheticBettors,
+        load_trace,
+        resolve_accuracy_formula,
+        synthetic_scenario,
+    )
+    from benchmarks.simulation.world import SimulationConfig, build_simulation
+
+    if args.trace:
+        scenario = load_trace(args.trace)
+        blocks = args.blocks or len(scenario.blocks)
+
+        def bettors_factory(bet_service, block_repository, user_ids, pair_ids, rng):
+            return ReplayBettors(bet_service, block_repository, user_ids, pair_ids, blocks=scenario.blocks)
+    else:
+        scenario = synthetic_scenario(args.pairs, args.users, args.initial_balance, args.price, args.tx_count)
+        blocks = args.blocks or 1_000
+
+        def bettors_factory(bet_service, block_repository, user_ids, pair_ids, rng):
+            return SyntheticBettors(
+                bet_service, block_repository, user_ids, pair_ids,
+                rng=rng, activity=args.activity, noise=args.noise,
+            )
+
+    config = SimulationConfig(
+        block_interval=timedelta(seconds=args.block_seconds),
+        base_multiplier=args.base_multiplier,
+        accuracy_formula=resolve_accuracy_formula(args.accuracy),
+        history=args.history,
+        seed=args.seed,
+    )
+    simulation = await build_simulation(scenario, config, bettors_factory)
+    await simulation.run(blocks, stop_on_error=args.stop_on_error)
+
+    summary = summarize(simulation)
+    print(format_summary(summary))
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump({'args': vars(args), 'summary': summary}, f, indent=2, default=str)
+    if args.blocks_jsonl:
+        write_blocks(simulation, args.blocks_jsonl)
+
+    return 1 if simulation.stalled or (args.stop_on_error and simulation.job_runner.failures) else 0
+
+
+def main() -> None:
+    args = _parse_args()
+    # services log every block at INFO and every failed block at ERROR, which would dominate the run time;
+    # failures are in the summary anyway
+    logging.basicConfig(level=args.log_level)
+    sys.exit(asyncio.run(_run(args)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+A JobRunnerInterface that runs jobs on a virtual clock instead of APScheduler.
+"""
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Optional
+
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from abstractions.services.job_runner import JobRunnerInterface
+from services.clock import VirtualClock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _VirtualJob:
+    func: Callable[[], Awaitable[Any]]
+    run_at: datetime
+    interval: Optional[timedelta]
+
+
+@dataclass(kw_only=True)
+class JobFailure:
+    job_id: str
+    at: datetime
+    error: BaseException
+
+
+@dataclass
+class VirtualJobRunner(JobRunnerInterface):
+    """
+    Runs due jobs one by one in run-time order, jumping the clock straight to the next run:
+    a block lasts as long as its settlement code, not the block interval.
+    Timeouts and misfire grace need wall-clock time and are ignored.
+    """
+    clock: VirtualClock
+
+    failures: list[JobFailure] = field(default_factory=list, init=False)
+    _jobs: dict[str, _VirtualJob] = field(default_factory=dict, init=False)
+    _running: bool = field(default=False, init=False)
+
+    def add_job(
+            self,
+            job_id: str,
+            func: Callable[[], Awaitable[Any]],
+            trigger: BaseTrigger,
+            timeout: Optional[timedelta] = None,
+            misfire_grace_time: Optional[timedelta] = None,
+    ) -> None:
+        match trigger:
+            case DateTrigger():
+                # APScheduler localizes naive dates, the wall time is unchanged
+                self._jobs[job_id] = _VirtualJob(func, trigger.run_date.replace(tzinfo=None), None)
+            case IntervalTrigger():
+                self._jobs[job_id] = _VirtualJob(func, self.clock.now() + trigger.interval, trigger.interval)
+            case _:
+                raise ValueError(f'Unsupported trigger for virtual time: {trigger}')
+
+    def remove_job(self, job_id: str) -> None:
+        self._jobs.pop(job_id, None)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        self._running = True
+
+    async def shutdown(self, cancel: bool = False) -> None:
+        # jobs run inside run_next, none is running while the caller is
+        self._running = False
+
+    async def run_next(self) -> Optional[str]:
+        """
+        Runs the earliest job and returns its id, or None when there is nothing to run.
+        """
+        if not self._running or not self._jobs:
+            return None
+
+        job_id, job = min(self._jobs.items(), key=lambda item: item[1].run_at)
+        self.clock.advance_to(job.run_at)
+        if job.interval is None:
+            # one-shot jobs are dropped before the run, so they can schedule their next run themselves
+            del self._jobs[job_id]
+        else:
+            job.run_at += job.interval
+
+        try:
+            await job.func()
+        except Exception as e:
+            logger.debug('Job %s failed at %s', job_id, self.clock.now(), exc_info=True)
+            self.failures.append(JobFailure(job_id=job_id, at=self.clock.now(), error=e))
+        return job_id
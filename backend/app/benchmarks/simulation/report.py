@@ -0,0 +1,67 @@
+"""
+Summary of a finished simulation: throughput, settlement results, rewards and balances.
+"""
+import json
+import statistics
+import traceback
+from collections import Counter
+from dataclasses import asdict
+
+from benchmarks.simulation.world import Simulation
+
+
+def summarize(simulation: Simulation) -> dict:
+    store = simulation.store
+    records = simulation.recorder.blocks
+    balances = [user.balance for user in store.users.values()]
+    bets = store.bets.values()
+    rewarded = [bet for bet in bets if bet.reward is not None]
+    final_prices = {record.pair: record.result_vector[0] for record in records}
+    failures = simulation.job_runner.failures
+
+    return {
+        'rounds': simulation.rounds,
+        'stalled': simulation.stalled,
+        'blocks_settled': len(records),
+        'wall_seconds': round(simulation.wall_seconds, 3),
+        'blocks_per_second': round(len(records) / simulation.wall_seconds, 1) if simulation.wall_seconds else 0.0,
+        # next to the throughput: failed settlements stop early and make it look better
+        'job_failures': len(failures),
+        'virtual_end': str(simulation.clock.now()),
+        'first_failures': [f'{failure.at} {failure.job_id}: {failure.error!r}' for failure in failures[:5]],
+        'first_failure_traceback': ''.join(traceback.format_exception(failures[0].error)) if failures else None,
+        'bets_placed': simulation.bettors.stats.placed,
+        'bets_rejected': simulation.bettors.stats.rejected,
+        'bet_errors': dict(simulation.bettors.stats.errors),
+        'bets_by_status': {status.value: count for status, count in Counter(bet.status for bet in bets).items()},
+        'empty_blocks': sum(1 for record in records if not record.bets),
+        'rewarded_bets': len(rewarded),
+        'total_reward': sum(bet.reward for bet in rewarded),
+        'mean_accuracy': statistics.fmean(bet.accuracy for bet in rewarded) if rewarded else 0.0,
+        'minted': simulation.ton_client.minted / 1e9,
+        'initial_balance': simulation.initial_balance,
+        'balance_total': sum(balances),
+        'balance_min': min(balances, default=0.0),
+        'balance_median': statistics.median(balances) if balances else 0.0,
+        'balance_max': max(balances, default=0.0),
+        'final_prices': final_prices,
+    }
+
+
+def format_summary(summary: dict) -> str:
+    lines = [f'{key}: {value}' for key, value in summary.items()]
+    if summary['job_failures']:
+        lines.append(
+            f"note: {summary['job_failures']} block generation runs failed part way, "
+            f"blocks_per_second is not the throughput of complete settlements"
+        )
+    return '\n'.join(lines)
+
+
+def write_blocks(simulation: Simulation, path: str) -> None:
+    """
+    One JSON line per settled block, in settlement order: diff two runs to see where they diverge.
+    """
+    with open(path, 'w') as f:
+        for record in simulation.recorder.blocks:
+            f.write(json.dumps(asdict(record), default=str) + '\n')
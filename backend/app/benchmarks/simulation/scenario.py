@@ -0,0 +1,199 @@
+"""
+What is simulated: pairs, users and the bets placed in every block, either synthetic or replayed from a trace.
+
+A trace reproduces an incident block by block; bets are placed through BetService, so the bet amount
+is derived from the balance exactly as in production and only the predicted vector is taken from the trace:
+
+    {
+        "pairs": [{"name": "TON/DD", "price": 5.2, "tx_count": 120}],
+        "users": [{"name": "alice", "balance": 1000}, {"name": "bob", "balance": 250}],
+        "blocks": [
+            [{"user": "alice", "pair": "TON/DD", "vector": [5.3, 118]}],
+            [],
+            [{"user": "bob", "pair": "TON/DD", "vector": [5.0, 130]}]
+        ]
+    }
+
+Re-bets of resolved bets into the next block happen on their own, as in production.
+"""
+import json
+import logging
+import math
+import random
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Callable, Optional
+from uuid import UUID
+
+from abstractions.repositories.block import BlockRepositoryInterface
+from abstractions.services.bet import BetServiceInterface
+from domain.metaholder.requests.bet import PlaceBetRequest
+from services.exceptions import NotEnoughMoney
+
+logger = logging.getLogger(__name__)
+
+AccuracyFormula = Callable[[float, float], float]
+
+
+@dataclass(kw_only=True)
+class PairSpec:
+    name: str
+    price: float
+    tx_count: float
+
+
+@dataclass(kw_only=True)
+class UserSpec:
+    name: str
+    balance: float
+
+
+@dataclass(kw_only=True)
+class BetSpec:
+    user: str
+    pair: str
+    vector: tuple[float, float]
+
+
+@dataclass(kw_only=True)
+class Scenario:
+    pairs: list[PairSpec]
+    users: list[UserSpec]
+    # bets per block for a replay, None for synthetic bettors
+    blocks: Optional[list[list[BetSpec]]] = None
+
+
+def synthetic_scenario(pairs: int, users: int, initial_balance: float, price: float, tx_count: float) -> Scenario:
+    return Scenario(
+        pairs=[PairSpec(name=f'SIM{i}', price=price, tx_count=tx_count) for i in range(pairs)],
+        users=[UserSpec(name=f'sim_{i}', balance=initial_balance) for i in range(users)],
+    )
+
+
+def load_trace(path: str) -> Scenario:
+    with open(path) as f:
+        raw = json.load(f)
+
+    pairs = [PairSpec(**pair) for pair in raw['pairs']]
+    users = [UserSpec(**user) for user in raw['users']]
+    pair_names, user_names = {pair.name for pair in pairs}, {user.name for user in users}
+    blocks = []
+    for number, bets in enumerate(raw['blocks'], start=1):
+        block = []
+        for bet in bets:
+            if bet['user'] not in user_names or bet['pair'] not in pair_names:
+                raise ValueError(f'Block {number} of the trace refers to an unknown user or pair: {bet}')
+            block.append(BetSpec(user=bet['user'], pair=bet['pair'], vector=tuple(bet['vector'])))
+        blocks.append(block)
+    return Scenario(pairs=pairs, users=users, blocks=blocks)
+
+
+@dataclass
+class BetStats:
+    placed: int = 0
+    rejected: int = 0  # NotEnoughMoney
+    errors: Counter[str] = field(default_factory=Counter)
+
+
+@dataclass
+class Bettors(ABC):
+    """
+    Places the bets of one block round through BetService.
+    """
+    bet_service: BetServiceInterface
+    block_repository: BlockRepositoryInterface
+    user_ids: dict[str, UUID]
+    pair_ids: dict[str, UUID]
+
+    stats: BetStats = field(default_factory=BetStats, init=False)
+
+    @abstractmethod
+    async def place_bets(self, round_number: int) -> None:
+        ...
+
+    async def _place(self, user: str, pair: str, vector: tuple[float, float]) -> None:
+        request = PlaceBetRequest(pair_id=self.pair_ids[pair], amount=0, predicted_vector=vector)
+        try:
+            await self.bet_service.create_bet(create_dto=request, user_id=self.user_ids[user])
+        except NotEnoughMoney:
+            self.stats.rejected += 1
+        except Exception as e:
+            # e.g. a zero price of the last block: count it and keep simulating, the report shows it
+            logger.debug('Bet of %s on %s failed', user, pair, exc_info=True)
+            self.stats.errors[type(e).__name__] += 1
+        else:
+            self.stats.placed += 1
+
+
+@dataclass
+class SyntheticBettors(Bettors):
+    """
+    Every user bets on every pair with probability `activity` per block, predicting the last
+    result of the pair with a personal relative error drawn once from [0.2, 2] * `noise`.
+    """
+    rng: random.Random = field(default_factory=random.Random)
+    activity: float = 0.3
+    noise: float = 0.02
+
+    _user_noise: dict[str, float] = field(default_factory=dict, init=False)
+
+    def __post_init__(self):
+        self._user_noise = {user: self.noise * self.rng.uniform(0.2, 2) for user in self.user_ids}
+
+    async def place_bets(self, round_number: int) -> None:
+        for pair, pair_id in self.pair_ids.items():
+            last_block = await self.block_repository.get_last_completed_block_by_pair_id(pair_id)
+            price, tx_count = last_block.result_vector
+            for user, noise in self._user_noise.items():
+                if self.rng.random() >= self.activity:
+                    continue
+                vector = (
+                    price * (1 + self.rng.gauss(0, noise)),
+                    max(0.0, tx_count * (1 + self.rng.gauss(0, noise))),
+                )
+                await self._place(user, pair, vector)
+
+
+@dataclass
+class ReplayBettors(Bettors):
+    blocks: list[list[BetSpec]] = field(default_factory=list)
+
+    async def place_bets(self, round_number: int) -> None:
+        if round_number >= len(self.blocks):
+            return
+        for bet in self.blocks[round_number]:
+            await self._place(bet.user, bet.pair, bet.vector)
+
+
+def _squared_accuracy(predicted: float, actual: float) -> float:
+    if actual == 0:
+        return 0
+    return max(.0, 1 - (abs(predicted - actual) / abs(actual)) ** 2)
+
+
+def _exponential_accuracy(predicted: float, actual: float) -> float:
+    if actual == 0:
+        return 0
+    return math.exp(-abs(predicted - actual) / abs(actual) / 0.05)
+
+
+# None keeps RewardDistributionService._calculate_accuracy_coefficient
+ACCURACY_FORMULAS: dict[str, Optional[AccuracyFormula]] = {
+    'relative': None,
+    'squared': _squared_accuracy,
+    'exponential': _exponential_accuracy,
+}
+
+
+def resolve_accuracy_formula(name: str) -> Optional[AccuracyFormula]:
+    """
+    A built-in formula name or `module:function` with the (predicted, actual) -> [0, 1] signature.
+    """
+    if name in ACCURACY_FORMULAS:
+        return ACCURACY_FORMULAS[name]
+    module_name, sep, function_name = name.partition(':')
+    if not sep:
+        raise ValueError(f'Unknown accuracy formula {name!r}, expected one of {sorted(ACCURACY_FORMULAS)} or module:function')
+    return getattr(import_module(module_name), function_name)
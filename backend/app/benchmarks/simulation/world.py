@@ -0,0 +1,381 @@
+"""
+Wires the production services to the in-memory repositories, a virtual clock and offline TON/Vault clients,
+seeds a scenario and steps block generation through the virtual job runner.
+"""
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from ahvac.memory import InMemoryVaultClient
+from benchmarks.simulation.jobs import VirtualJobRunner
+from benchmarks.simulation.scenario import AccuracyFormula, Bettors, Scenario
+from domain.dto.app_wallet import CreateAppWalletDTO
+from domain.dto.bet import CreateBetDTO
+from domain.dto.block import CreateBlockDTO
+from domain.dto.chain import CreateChainDTO
+from domain.dto.ledger import CreateLedgerEntryDTO
+from domain.dto.pair import CreatePairDTO
+from domain.dto.user import CreateUserDTO
+from domain.enums import BetStatus, WalletType
+from domain.enums.block_status import BlockStatus
+from domain.enums.chain_status import ChainStatus
+from domain.enums.ledger import LedgerEntryType
+from domain.models.app_wallet import AppWalletVersion
+from domain.models.events import BlockCompletedEvent, Event
+from infrastructure.memory import InMemoryStore
+from infrastructure.memory.repositories import (
+    InMemoryAppWalletRepository,
+    InMemoryBetRepository,
+    InMemoryBlockRepository,
+    InMemoryCandleRepository,
+    InMemoryChainRepository,
+    InMemoryDepositRepository,
+    InMemoryLeaderboardRepository,
+    InMemoryLedgerRepository,
+    InMemoryPairRepository,
+    InMemoryTransactionRepository,
+    InMemoryUserRepository,
+    InMemoryUserStatsRepository,
+)
+from services.BetService import BetService
+from services.BlockService import BlockService
+from services.ChainService import ChainService
+from services.CurrencyService import CurrencyService
+from services.DepositService import DepositService
+from services.InnerToken import InnerTokenService
+from services.OrchestratorService import OrchestratorService
+from services.app_wallet.provider import AppWalletProvider
+from services.app_wallet.service import AppWalletService
+from services.app_wallet.vault import VaultService
+from services.block_clock import BlockClockRegistry
+from services.block_state_cache import BlockStateCache
+from services.read_coalescer import ReadCoalescer
+from services.clock import VirtualClock
+from services.events import LocalEventPublisher
+from services.math_services.AggregateBetsService import AggregateBetsService
+from services.math_services.LiquidityManager import LiquidityManager
+from services.math_services.PoolService import PoolService
+from services.math_services.RewardDistributionService import RewardDistributionService
+from services.ton.client.offline import OfflineTonClient
+from services.user import UserService
+from settings import settings
+
+# the job ChainService schedules for closing blocks
+BLOCK_GENERATION_JOB = 'block_generation'
+MINTER_ADDRESS = '0:' + '00' * 32
+
+
+@dataclass
+class SimulatedRewardDistributionService(RewardDistributionService):
+    """
+    RewardDistributionService with a replaceable accuracy formula; None keeps the production one.
+    """
+    accuracy_formula: Optional[AccuracyFormula] = None
+
+    def _calculate_accuracy_coefficient(self, predicted: float, actual: float) -> float:
+        if self.accuracy_formula is None:
+            return super()._calculate_accuracy_coefficient(predicted, actual)
+        return self.accuracy_formula(predicted, actual)
+
+
+@dataclass(kw_only=True)
+class BlockRecord:
+    pair: str
+    block_number: int
+    result_vector: list[float]
+    bets: int
+    stake: float
+    completed_at: datetime
+
+
+@dataclass
+class SimulationRecorder:
+    store: InMemoryStore
+    pair_names: dict[UUID, str]
+
+    blocks: list[BlockRecord] = field(default_factory=list)
+
+    def handle(self, event: Event) -> None:
+        if not isinstance(event, BlockCompletedEvent):
+            return
+        bets = self.store.bets_by_block.get(event.block_id, ())
+        self.blocks.append(BlockRecord(
+            pair=self.pair_names[event.pair_id],
+            block_number=event.block_number,
+            result_vector=list(event.result_vector),
+            bets=len(bets),
+            stake=sum(bet.amount for bet in bets),
+            completed_at=event.completed_at,
+        ))
+
+
+@dataclass(kw_only=True)
+class SimulationConfig:
+    block_interval: timedelta = timedelta(seconds=settings.chain.block_interval)
+    base_multiplier: float = 1.3
+    accuracy_formula: Optional[AccuracyFormula] = None
+    # a resolved bet per user in the genesis block: rewards are written to the user's last resolved bet,
+    # and users without one fail the whole settlement (reproduce it with history=False)
+    history: bool = True
+    seed: int = 42
+
+
+@dataclass
+class Simulation:
+    store: InMemoryStore
+    clock: VirtualClock
+    job_runner: VirtualJobRunner
+    chain_service: ChainService
+    ton_client: OfflineTonClient
+    bettors: Bettors
+    recorder: SimulationRecorder
+    initial_balance: float
+
+    # block generation runs in a row that settled nothing before the run is given up
+    max_idle_runs: int = 3
+
+    rounds: int = field(default=0, init=False)
+    stalled: bool = field(default=False, init=False)
+    wall_seconds: float = field(default=0.0, init=False)
+
+    async def run(self, blocks: int, stop_on_error: bool = False) -> None:
+        """
+        Settles `blocks` rounds: every round closes the current block of each chain and opens the next one.
+        A failed settlement leaves its chain without an open block, exactly as in production;
+        once no chain settles anymore the run stops and is reported as stalled.
+        """
+        started = time.perf_counter()
+        await self.chain_service.start_block_generation()
+        await self.bettors.place_bets(self.rounds)
+        idle_runs = 0
+        while self.rounds < blocks:
+            settled = len(self.recorder.blocks)
+            job_id = await self.job_runner.run_next()
+            if job_id is None:
+                break
+            if stop_on_error and self.job_runner.failures:
+                break
+            if job_id != BLOCK_GENERATION_JOB:
+                continue
+            if len(self.recorder.blocks) == settled:
+                idle_runs += 1
+                if idle_runs >= self.max_idle_runs:
+                    self.stalled = True
+                    break
+                continue
+            idle_runs = 0
+            self.rounds += 1
+            await self.bettors.place_bets(self.rounds)
+        await self.chain_service.suspend_block_generation()
+        self.wall_seconds = time.perf_counter() - started
+
+
+async def build_simulation(scenario: Scenario, config: SimulationConfig, bettors_factory) -> Simulation:
+    """
+    `bettors_factory(bet_service, block_repository, user_ids, pair_ids, rng)` creates the Bettors of the run.
+    Services with SingletonMeta are created here for the first time, so one process runs one simulation.
+    """
+    clock = VirtualClock()
+    store = InMemoryStore(clock=clock)
+    user_repository = InMemoryUserRepository(store)
+    pair_repository = InMemoryPairRepository(store)
+    chain_repository = InMemoryChainRepository(store)
+    block_repository = InMemoryBlockRepository(store, block_generation_interval=config.block_interval)
+    bet_repository = InMemoryBetRepository(store)
+    transaction_repository = InMemoryTransactionRepository(store)
+    deposit_repository = InMemoryDepositRepository(store)
+    app_wallet_repository = InMemoryAppWalletRepository(store)
+    ledger_repository = InMemoryLedgerRepository(store)
+    user_stats_repository = InMemoryUserStatsRepository(store)
+    leaderboard_repository = InMemoryLeaderboardRepository(store)
+    candle_repository = InMemoryCandleRepository(store)
+
+    user_ids, pair_ids = await _seed(scenario, config, store, clock)
+
+    ton_client = OfflineTonClient()
+    event_publisher = LocalEventPublisher()
+    recorder = SimulationRecorder(store, {pair_id: name for name, pair_id in pair_ids.items()})
+    event_publisher.subscribe(recorder.handle)
+
+    app_wallet_service = AppWalletService(
+        provider=AppWalletProvider(
+            vault_service=VaultService(client=InMemoryVaultClient()),
+            wallet_repository=app_wallet_repository,
+        ),
+    )
+    inner_token_service = InnerTokenService(
+        ton_client=ton_client,
+        user_repository=user_repository,
+        ledger_repository=ledger_repository,
+        block_repository=block_repository,
+        transaction_repository=transaction_repository,
+        app_wallet_provider=app_wallet_service,
+        token_minter_address_str=MINTER_ADDRESS,
+    )
+    aggregate_bets_service = AggregateBetsService(block_repository=block_repository)
+    bet_service = BetService(
+        bet_repository=bet_repository,
+        ledger_repository=ledger_repository,
+        block_repository=block_repository,
+        user_stats_repository=user_stats_repository,
+    )
+    block_clocks = BlockClockRegistry(
+        chain_repository=chain_repository,
+        block_generation_interval=config.block_interval,
+    )
+    block_service = BlockService(
+        block_repository=block_repository,
+        aggregate_bets_service=aggregate_bets_service,
+        chain_repository=chain_repository,
+        ledger_repository=ledger_repository,
+        user_stats_repository=user_stats_repository,
+        leaderboard_repository=leaderboard_repository,
+        candle_repository=candle_repository,
+        bet_repository=bet_repository,
+        bet_service=bet_service,
+        block_state_cache=BlockStateCache(clock=clock),
+        block_clocks=block_clocks,
+        read_coalescer=ReadCoalescer(clock=clock),
+        clock=clock,
+    )
+    user_service = UserService(
+        user_repository=user_repository,
+        block_service=block_service,
+        deposit_repository=deposit_repository,
+        ledger_repository=ledger_repository,
+        user_stats_repository=user_stats_repository,
+        currency_service=CurrencyService(inner_token_service=inner_token_service),
+    )
+    liquidity_manager = LiquidityManager(inner_token_symbol=settings.inner_token.symbol)
+    orchestrator_service = OrchestratorService(
+        aggregate_bets_service=aggregate_bets_service,
+        liquidity_manager=liquidity_manager,
+        reward_service=SimulatedRewardDistributionService(
+            bet_repository=bet_repository,
+            base_multiplier=config.base_multiplier,
+            accuracy_formula=config.accuracy_formula,
+        ),
+        user_service=user_service,
+        block_service=block_service,
+        app_wallet_service=app_wallet_service,
+        chain_repository=chain_repository,
+        pool_service=PoolService(),
+        inner_token_symbol=settings.inner_token.symbol,
+        inner_token_service=inner_token_service,
+        block_repository=block_repository,
+    )
+    job_runner = VirtualJobRunner(clock)
+    chain_service = ChainService(
+        job_runner=job_runner,
+        block_service=block_service,
+        chain_repository=chain_repository,
+        pair_repository=pair_repository,
+        orchestrator_service=orchestrator_service,
+        deposit_service=DepositService(
+            deposit_repository=deposit_repository,
+            app_wallet_service=app_wallet_service,
+            transaction_repository=transaction_repository,
+            user_service=user_service,
+            ton_client=ton_client,
+            event_publisher=event_publisher,
+        ),
+        liquidity_manager=liquidity_manager,
+        ton_client=ton_client,
+        inner_token=settings.inner_token,
+        app_wallet_service=app_wallet_service,
+        pool_service=PoolService(),
+        inner_token_service=inner_token_service,
+        inner_token_symbol=settings.inner_token.symbol,
+        event_publisher=event_publisher,
+        block_clocks=block_clocks,
+        block_generation_interval=config.block_interval,
+        resume_blocks=True,
+        clock=clock,
+    )
+
+    return Simulation(
+        store=store,
+        clock=clock,
+        job_runner=job_runner,
+        chain_service=chain_service,
+        ton_client=ton_client,
+        bettors=bettors_factory(bet_service, block_repository, user_ids, pair_ids, random.Random(config.seed)),
+        recorder=recorder,
+        initial_balance=sum(user.balance for user in scenario.users),
+    )
+
+
+async def _seed(
+        scenario: Scenario,
+        config: SimulationConfig,
+        store: InMemoryStore,
+        clock: VirtualClock,
+) -> tuple[dict[str, UUID], dict[str, UUID]]:
+    """
+    Every chain gets a completed genesis block carrying the initial price (bets are priced off it)
+    and a block in progress that ChainService resumes, as after a restart.
+    """
+    user_repository = InMemoryUserRepository(store)
+    ledger_repository = InMemoryLedgerRepository(store)
+    pair_repository = InMemoryPairRepository(store)
+    chain_repository = InMemoryChainRepository(store)
+    block_repository = InMemoryBlockRepository(store)
+    bet_repository = InMemoryBetRepository(store)
+
+    # withdraw and deposit wallets share the id, minting only needs the wallet and a key
+    await InMemoryAppWalletRepository(store).create(CreateAppWalletDTO(
+        id=AppWalletProvider.withdraw_wallet_id,
+        address=MINTER_ADDRESS,
+        wallet_version=AppWalletVersion.V4R2,
+        wallet_type=WalletType.DEPOSIT,
+        balance=0.0,
+    ))
+
+    user_ids = {}
+    for number, user in enumerate(scenario.users):
+        dto = CreateUserDTO(wallet_address=f'0:{number:064x}', username=user.name)
+        await user_repository.create(dto)
+        await ledger_repository.append([
+            CreateLedgerEntryDTO(user_id=dto.id, type=LedgerEntryType.DEPOSIT, amount=user.balance),
+        ])
+        user_ids[user.name] = dto.id
+
+    now = clock.now()
+    origin = now - config.block_interval
+    pair_ids = {}
+    for number, pair in enumerate(scenario.pairs):
+        pair_dto = CreatePairDTO(name=pair.name, contract_address=f'EQ-sim-{number}', last_ratio=1.0)
+        await pair_repository.create(pair_dto)
+        pair_ids[pair.name] = pair_dto.id
+
+        chain_dto = CreateChainDTO(current_block=2, pair_id=pair_dto.id, status=ChainStatus.ACTIVE, created_at=origin)
+        await chain_repository.create(chain_dto)
+        genesis = CreateBlockDTO(
+            block_number=1,
+            status=BlockStatus.COMPLETED,
+            chain_id=chain_dto.id,
+            result_vector=[pair.price, pair.tx_count],
+            created_at=origin,
+            completed_at=now,
+        )
+        await block_repository.create(genesis)
+        if config.history:
+            for user_id in user_ids.values():
+                await bet_repository.create(CreateBetDTO(
+                    user_id=user_id,
+                    pair_id=pair_dto.id,
+                    amount=0.0,
+                    block_id=genesis.id,
+                    vector=[pair.price, pair.tx_count],
+                    status=BetStatus.RESOLVED,
+                ))
+        await block_repository.create(CreateBlockDTO(
+            block_number=2,
+            status=BlockStatus.IN_PROGRESS,
+            chain_id=chain_dto.id,
+            created_at=now,
+        ))
+    return user_ids, pair_ids
@@ -1,7 +1,27 @@
+from functools import cache
+
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from infrastructure.db import session_maker
+from infrastructure.db import read_session_maker, session_maker
+from infrastructure.db.replica import SessionFactory
+from infrastructure.memory import InMemoryStore
+from settings import settings
 
 
 def get_session_maker() -> async_sessionmaker:
     return session_maker
+
+
+def get_read_session_maker() -> SessionFactory:
+    # pure reads of the API, served by the replica once it has caught up with the events seen
+    return read_session_maker
+
+
+def use_memory_backend() -> bool:
+    return settings.repositories.backend == 'memory'
+
+
+@cache
+def get_memory_store() -> InMemoryStore:
+    # one store per process: every in-memory repository must see the same tables
+    return InMemoryStore()
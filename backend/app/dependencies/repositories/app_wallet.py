@@ -1,9 +1,13 @@
+from abstractions.repositories.app_wallet import AppWalletRepositoryInterface
 from infrastructure.db.repositories.AppWalletRepository import AppWalletRepository
+from infrastructure.memory.repositories import InMemoryAppWalletRepository
 
-from . import get_session_maker
+from . import get_memory_store, get_session_maker, use_memory_backend
 
 
-def get_app_wallet_repository() -> AppWalletRepository:
+def get_app_wallet_repository() -> AppWalletRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryAppWalletRepository(store=get_memory_store())
     return AppWalletRepository(
         session_maker=get_session_maker()
     )
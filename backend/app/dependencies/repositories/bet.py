@@ -1,9 +1,13 @@
 from abstractions.repositories.bet import BetRepositoryInterface
 from infrastructure.db.repositories.BetRepository import BetRepository
-from . import get_session_maker
+from infrastructure.memory.repositories import InMemoryBetRepository
+
+from . import get_memory_store, get_session_maker, use_memory_backend
 
 
 def get_bet_repository() -> BetRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryBetRepository(store=get_memory_store())
     return BetRepository(
         session_maker=get_session_maker()
     )
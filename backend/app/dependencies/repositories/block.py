@@ -1,9 +1,14 @@
 from abstractions.repositories.block import BlockRepositoryInterface
 from infrastructure.db.repositories.BlockRepository import BlockRepository
-from . import get_session_maker
+from infrastructure.memory.repositories import InMemoryBlockRepository
+
+from . import get_memory_store, get_read_session_maker, get_session_maker, use_memory_backend
 
 
 def get_block_repository() -> BlockRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryBlockRepository(store=get_memory_store())
     return BlockRepository(
-        session_maker=get_session_maker()
+        session_maker=get_session_maker(),
+        read_session_maker=get_read_session_maker(),
     )
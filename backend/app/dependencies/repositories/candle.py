@@ -0,0 +1,14 @@
+from abstractions.repositories.candle import CandleRepositoryInterface
+from infrastructure.db.repositories.CandleRepository import CandleRepository
+from infrastructure.memory.repositories import InMemoryCandleRepository
+
+from . import get_memory_store, get_read_session_maker, get_session_maker, use_memory_backend
+
+
+def get_candle_repository() -> CandleRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryCandleRepository(store=get_memory_store())
+    return CandleRepository(
+        session_maker=get_session_maker(),
+        read_session_maker=get_read_session_maker(),
+    )
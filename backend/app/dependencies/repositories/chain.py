@@ -1,10 +1,13 @@
 from abstractions.repositories.chain import ChainRepositoryInterface
 from infrastructure.db.repositories.ChainRepository import ChainRepository
+from infrastructure.memory.repositories import InMemoryChainRepository
 
-from . import get_session_maker
+from . import get_memory_store, get_session_maker, use_memory_backend
 
 
 def get_chain_repository() -> ChainRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryChainRepository(store=get_memory_store())
     return ChainRepository(
         session_maker=get_session_maker()
     )
@@ -1,9 +1,13 @@
 from abstractions.repositories.deposit import DepositRepositoryInterface
-from dependencies.repositories import get_session_maker
 from infrastructure.db.repositories.DepositRepository import DepositRepository
+from infrastructure.memory.repositories import InMemoryDepositRepository
+
+from . import get_memory_store, get_session_maker, use_memory_backend
 
 
 def get_deposit_repository() -> DepositRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryDepositRepository(store=get_memory_store())
     return DepositRepository(
         session_maker=get_session_maker()
     )
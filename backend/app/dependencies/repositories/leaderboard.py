@@ -0,0 +1,14 @@
+from abstractions.repositories.leaderboard import LeaderboardRepositoryInterface
+from infrastructure.db.repositories.LeaderboardRepository import LeaderboardRepository
+from infrastructure.memory.repositories import InMemoryLeaderboardRepository
+
+from . import get_memory_store, get_read_session_maker, get_session_maker, use_memory_backend
+
+
+def get_leaderboard_repository() -> LeaderboardRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryLeaderboardRepository(store=get_memory_store())
+    return LeaderboardRepository(
+        session_maker=get_session_maker(),
+        read_session_maker=get_read_session_maker(),
+    )
@@ -0,0 +1,15 @@
+from abstractions.repositories.ledger import LedgerRepositoryInterface
+from infrastructure.db.repositories.LedgerRepository import LedgerRepository
+from infrastructure.memory.repositories import InMemoryLedgerRepository
+from settings import settings
+
+from . import get_memory_store, get_session_maker, use_memory_backend
+
+
+def get_ledger_repository() -> LedgerRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryLedgerRepository(store=get_memory_store())
+    return LedgerRepository(
+        session_maker=get_session_maker(),
+        copy_threshold=settings.ledger.copy_threshold,
+    )
@@ -1,10 +1,13 @@
 from abstractions.repositories.pair import PairRepositoryInterface
 from infrastructure.db.repositories.PairRepository import PairRepository
+from infrastructure.memory.repositories import InMemoryPairRepository
 
-from . import get_session_maker
+from . import get_memory_store, get_session_maker, use_memory_backend
 
 
 def get_pair_repository() -> PairRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryPairRepository(store=get_memory_store())
     return PairRepository(
         session_maker=get_session_maker()
     )
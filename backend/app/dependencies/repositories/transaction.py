@@ -1,9 +1,13 @@
+from abstractions.repositories.transaction import TransactionRepositoryInterface
 from infrastructure.db.repositories.TransactionRepository import TransactionRepository
+from infrastructure.memory.repositories import InMemoryTransactionRepository
 
-from . import get_session_maker
+from . import get_memory_store, get_session_maker, use_memory_backend
 
 
-def get_transaction_repository() -> TransactionRepository:
+def get_transaction_repository() -> TransactionRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryTransactionRepository(store=get_memory_store())
     return TransactionRepository(
         session_maker=get_session_maker()
     )
@@ -1,9 +1,14 @@
+from abstractions.repositories.user import UserRepositoryInterface
 from infrastructure.db.repositories.UserRepository import UserRepository
+from infrastructure.memory.repositories import InMemoryUserRepository
 
-from . import get_session_maker
+from . import get_memory_store, get_read_session_maker, get_session_maker, use_memory_backend
 
 
-def get_user_repository() -> UserRepository:
+def get_user_repository() -> UserRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryUserRepository(store=get_memory_store())
     return UserRepository(
-        session_maker=get_session_maker()
+        session_maker=get_session_maker(),
+        read_session_maker=get_read_session_maker(),
     )
@@ -0,0 +1,15 @@
+from abstractions.repositories.user_stats import UserStatsRepositoryInterface
+from infrastructure.db.repositories.UserStatsRepository import UserStatsRepository
+from infrastructure.memory.repositories import InMemoryUserStatsRepository
+from settings import settings
+
+from . import get_memory_store, get_session_maker, use_memory_backend
+
+
+def get_user_stats_repository() -> UserStatsRepositoryInterface:
+    if use_memory_backend():
+        return InMemoryUserStatsRepository(store=get_memory_store(), accuracy_alpha=settings.stats.accuracy_alpha)
+    return UserStatsRepository(
+        session_maker=get_session_maker(),
+        accuracy_alpha=settings.stats.accuracy_alpha,
+    )
@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from abstractions.services.admission import AdmissionControllerInterface
+from dependencies.repositories import use_memory_backend
+from infrastructure.db import engine, read_engine
+from services.admission import AdmissionController
+from settings import settings
+
+
+def get_admission_controller() -> AdmissionControllerInterface:
+    return AdmissionController(
+        pool_usage=None if use_memory_backend() else engine.pool.usage,
+        read_pool_usage=read_engine.pool.usage if settings.db.replica and not use_memory_backend() else None,
+        reserved_connections=settings.admission.reserved_connections,
+        low_utilization=settings.admission.low_utilization,
+        normal_utilization=settings.admission.normal_utilization,
+        high_utilization=settings.admission.high_utilization,
+        low_loop_lag=timedelta(seconds=settings.admission.low_loop_lag),
+        normal_loop_lag=timedelta(seconds=settings.admission.normal_loop_lag),
+        sample_interval=timedelta(seconds=settings.admission.sample_interval),
+        retry_after=timedelta(seconds=settings.admission.retry_after),
+    )
@@ -1,9 +1,13 @@
 from ahvac import VaultClientInterface
 from ahvac.fs import FileSystemVaultClient
+from ahvac.memory import InMemoryVaultClient
 from settings import settings
 
 
 def get_vault_client() -> VaultClientInterface:
+    if settings.secrets.offline:
+        return InMemoryVaultClient()
+
     return FileSystemVaultClient(
         expected_path=settings.secrets.expected_path,
         expected_key=settings.secrets.expected_key,
@@ -0,0 +1,20 @@
+from pathlib import Path
+from typing import Optional
+
+from abstractions.services.archive import ArchiveServiceInterface
+from dependencies.repositories import use_memory_backend
+from infrastructure.db import engine
+from infrastructure.db.archive import PostgresArchiveService
+from settings import settings
+
+
+def get_archive_service() -> Optional[ArchiveServiceInterface]:
+    # в памяти партиций нет
+    if use_memory_backend():
+        return None
+    return PostgresArchiveService(
+        engine=engine,
+        months_ahead=settings.archive.months_ahead,
+        retention_months=settings.archive.retention_months,
+        directory=Path(settings.archive.directory),
+    )
@@ -1,13 +1,21 @@
 from abstractions.services.bet import BetServiceInterface
 from dependencies.repositories.bet import get_bet_repository
 from dependencies.repositories.block import get_block_repository
-from dependencies.repositories.user import get_user_repository
+from dependencies.repositories.ledger import get_ledger_repository
+from dependencies.repositories.user_stats import get_user_stats_repository
+from dependencies.services.event_publisher import get_event_publisher
+from dependencies.services.versions import get_version_registry
 from services.BetService import BetService
+from settings import settings
 
 
-def get_bet_service() -> BetServiceInterface:
+def get_bet_service(publish_events: bool = True) -> BetServiceInterface:
     return BetService(
         bet_repository=get_bet_repository(),
-        user_repository=get_user_repository(),
+        ledger_repository=get_ledger_repository(),
         block_repository=get_block_repository(),
+        user_stats_repository=get_user_stats_repository(),
+        batch_attempts=settings.bets.batch_attempts,
+        event_publisher=get_event_publisher() if publish_events else None,
+        version_registry=get_version_registry(),
     )
@@ -2,9 +2,15 @@ from abstractions.services.block import BlockServiceInterface
 from dependencies.math.aggregate_bets import get_aggregate_bets_service
 from dependencies.repositories.bet import get_bet_repository
 from dependencies.repositories.block import get_block_repository
+from dependencies.repositories.candle import get_candle_repository
 from dependencies.repositories.chain import get_chain_repository
-from dependencies.repositories.user import get_user_repository
+from dependencies.repositories.leaderboard import get_leaderboard_repository
+from dependencies.repositories.ledger import get_ledger_repository
+from dependencies.repositories.user_stats import get_user_stats_repository
 from dependencies.services.bet import get_bet_service
+from dependencies.services.block_clock import get_block_clock_registry
+from dependencies.services.block_state_cache import get_block_state_cache
+from dependencies.services.read_coalescer import get_read_coalescer
 from services.BlockService import BlockService
 
 
@@ -13,7 +19,14 @@ def get_block_service() -> BlockServiceInterface:
         block_repository=get_block_repository(),
         aggregate_bets_service=get_aggregate_bets_service(),
         chain_repository=get_chain_repository(),
-        user_repository=get_user_repository(),
+        ledger_repository=get_ledger_repository(),
+        user_stats_repository=get_user_stats_repository(),
+        leaderboard_repository=get_leaderboard_repository(),
+        candle_repository=get_candle_repository(),
         bet_repository=get_bet_repository(),
-        bet_service=get_bet_service()
+        # ставки, которые делает расчёт блока, покрывает BalancesChangedEvent после него
+        bet_service=get_bet_service(publish_events=False),
+        block_state_cache=get_block_state_cache(),
+        block_clocks=get_block_clock_registry(),
+        read_coalescer=get_read_coalescer(),
     )
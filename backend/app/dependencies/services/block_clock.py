@@ -0,0 +1,13 @@
+from datetime import timedelta
+
+from abstractions.services.block_clock import BlockClockRegistryInterface
+from dependencies.repositories.chain import get_chain_repository
+from services.block_clock import BlockClockRegistry
+from settings import settings
+
+
+def get_block_clock_registry() -> BlockClockRegistryInterface:
+    return BlockClockRegistry(
+        chain_repository=get_chain_repository(),
+        block_generation_interval=timedelta(seconds=settings.chain.block_interval),
+    )
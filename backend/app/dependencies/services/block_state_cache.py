@@ -0,0 +1,6 @@
+from abstractions.services.block_state_cache import BlockStateCacheInterface
+from services.block_state_cache import BlockStateCache
+
+
+def get_block_state_cache() -> BlockStateCacheInterface:
+    return BlockStateCache()
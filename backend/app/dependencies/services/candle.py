@@ -1,7 +1,11 @@
 from abstractions.services.candle import CandleServiceInterface
-from dependencies.services.block import get_block_service
+from dependencies.repositories.candle import get_candle_repository
+from dependencies.services.read_coalescer import get_read_coalescer
 from services.candle import CandleService
 
 
 def get_candle_service() -> CandleServiceInterface:
-    return CandleService(block_service=get_block_service())
+    return CandleService(
+        candle_repository=get_candle_repository(),
+        read_coalescer=get_read_coalescer(),
+    )
@@ -1,12 +1,18 @@
+from datetime import timedelta
+
 from abstractions.services.chain import ChainServiceInterface
-from dependencies import get_scheduler
 from dependencies.math.liquidity_management import get_liquidity_manager_service
 from dependencies.repositories.chain import get_chain_repository
+from dependencies.repositories.ledger import get_ledger_repository
 from dependencies.repositories.pair import get_pair_repository
 from dependencies.services.app_wallet.service import get_app_wallet_service
+from dependencies.services.archive import get_archive_service
 from dependencies.services.block import get_block_service
+from dependencies.services.block_clock import get_block_clock_registry
 from dependencies.services.deposit import get_deposit_service
+from dependencies.services.event_publisher import get_event_publisher
 from dependencies.services.inner_token import get_inner_token_service
+from dependencies.services.job_runner import get_job_runner
 from dependencies.services.orchestrator import get_orchestrator_service
 from dependencies.services.pool import get_pool_service
 from dependencies.services.ton.client import get_ton_client
@@ -17,7 +23,7 @@ from settings import settings
 def get_chain_service() -> ChainServiceInterface:
     return ChainService(
         block_service=get_block_service(),
-        scheduler=get_scheduler(),
+        job_runner=get_job_runner(),
         chain_repository=get_chain_repository(),
         pair_repository=get_pair_repository(),
         orchestrator_service=get_orchestrator_service(),
@@ -28,5 +34,15 @@ def get_chain_service() -> ChainServiceInterface:
         pool_service=get_pool_service(),
         inner_token_symbol=settings.inner_token.symbol,
         inner_token=settings.inner_token,
-        inner_token_service=get_inner_token_service()
+        inner_token_service=get_inner_token_service(),
+        event_publisher=get_event_publisher(),
+        block_clocks=get_block_clock_registry(),
+        resume_blocks=settings.chain.resume_blocks,
+        archive_service=get_archive_service(),
+        archive_interval=timedelta(seconds=settings.archive.interval),
+        ledger_repository=get_ledger_repository(),
+        snapshot_interval=timedelta(seconds=settings.ledger.snapshot_interval),
+        block_generation_interval=timedelta(seconds=settings.chain.block_interval),
+        transaction_check_interval=timedelta(seconds=settings.jobs.transaction_check_interval),
+        transaction_check_timeout=timedelta(seconds=settings.jobs.transaction_check_timeout),
     )
@@ -2,6 +2,7 @@ from abstractions.services.deposit import DepositServiceInterface
 from dependencies.repositories.deposit import get_deposit_repository
 from dependencies.repositories.transaction import get_transaction_repository
 from dependencies.services.app_wallet.service import get_app_wallet_service
+from dependencies.services.event_publisher import get_event_publisher
 from dependencies.services.ton.client import get_ton_client
 from dependencies.services.user import get_user_service
 from services.DepositService import DepositService
@@ -14,4 +15,5 @@ def get_deposit_service() -> DepositServiceInterface:
         transaction_repository=get_transaction_repository(),
         user_service=get_user_service(),
         ton_client=get_ton_client(),
+        event_publisher=get_event_publisher(),
     )
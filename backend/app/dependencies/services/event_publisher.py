@@ -0,0 +1,21 @@
+from functools import cache
+
+from abstractions.services.events import EventPublisherInterface
+from dependencies.repositories import get_session_maker, use_memory_backend
+from infrastructure.db.notifications import PostgresEventPublisher
+from services.events import LocalEventPublisher
+from settings import settings
+
+
+@cache
+def get_local_event_publisher() -> LocalEventPublisher:
+    return LocalEventPublisher()
+
+
+def get_event_publisher() -> EventPublisherInterface:
+    if use_memory_backend():
+        return get_local_event_publisher()
+    return PostgresEventPublisher(
+        session_maker=get_session_maker(),
+        channel=settings.events.channel,
+    )
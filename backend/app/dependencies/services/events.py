@@ -0,0 +1,49 @@
+from functools import cache
+
+from abstractions.services.events import EventListenerInterface, EventBroadcasterInterface
+from dependencies.repositories import use_memory_backend
+from dependencies.services.block_state_cache import get_block_state_cache
+from dependencies.services.event_publisher import get_local_event_publisher
+from dependencies.services.leaderboard import get_leaderboard_service
+from dependencies.services.pair_state import get_pair_state_service
+from dependencies.services.read_coalescer import get_read_coalescer
+from dependencies.services.versions import get_version_registry
+from infrastructure.db import engine, replica_session_maker
+from infrastructure.db.notifications import PostgresEventListener
+from services.events import EventBroadcaster
+from settings import settings
+
+
+def get_event_broadcaster() -> EventBroadcasterInterface:
+    return EventBroadcaster()
+
+
+@cache
+def get_event_listener() -> EventListenerInterface:
+    if use_memory_backend():
+        listener = get_local_event_publisher()
+    else:
+        listener = PostgresEventListener(
+            engine=engine,
+            channel=settings.events.channel,
+            replica=replica_session_maker,
+        )
+
+    block_state_cache = get_block_state_cache()
+    listener.subscribe(block_state_cache.handle)
+    listener.on_connection_change(block_state_cache.set_active)
+    listener.subscribe(get_event_broadcaster().handle)
+    leaderboard_service = get_leaderboard_service()
+    listener.subscribe(leaderboard_service.handle)
+    listener.on_connection_change(lambda active: leaderboard_service.invalidate())
+    pair_state_service = get_pair_state_service()
+    listener.subscribe(pair_state_service.handle)
+    listener.on_connection_change(pair_state_service.set_active)
+    read_coalescer = get_read_coalescer()
+    listener.subscribe(read_coalescer.handle)
+    listener.on_connection_change(lambda active: read_coalescer.invalidate())
+    # after the read coalescer: a new version must not be served with reads cached before it
+    version_registry = get_version_registry()
+    listener.subscribe(version_registry.handle)
+    listener.on_connection_change(version_registry.set_active)
+    return listener
@@ -0,0 +1,17 @@
+from datetime import timedelta
+
+from abstractions.services.job_runner import JobRunnerInterface
+from dependencies import get_scheduler
+from services.job_runner import JobRunner
+from settings import settings
+
+
+def get_job_runner() -> JobRunnerInterface:
+    return JobRunner(
+        scheduler=get_scheduler(),
+        backoff_base=timedelta(seconds=settings.jobs.backoff_base),
+        backoff_max=timedelta(seconds=settings.jobs.backoff_max),
+        backoff_jitter=settings.jobs.backoff_jitter,
+        collect_query_shapes=settings.debug,
+        repeated_query_threshold=settings.db.repeated_query_threshold,
+    )
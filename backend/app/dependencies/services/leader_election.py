@@ -0,0 +1,15 @@
+from abstractions.services.leader_election import LeaderElectionInterface
+from dependencies.repositories import use_memory_backend
+from infrastructure.db import engine
+from infrastructure.db.leader_election import PostgresLeaderElection
+from infrastructure.memory.leader_election import InMemoryLeaderElection
+from settings import settings
+
+
+def get_leader_election() -> LeaderElectionInterface:
+    if use_memory_backend():
+        return InMemoryLeaderElection()
+    return PostgresLeaderElection(
+        engine=engine,
+        lock_key=settings.worker.advisory_lock_key,
+    )
@@ -0,0 +1,14 @@
+from datetime import timedelta
+
+from abstractions.services.leaderboard import LeaderboardServiceInterface
+from dependencies.repositories.leaderboard import get_leaderboard_repository
+from services.leaderboard import LeaderboardService
+from settings import settings
+
+
+def get_leaderboard_service() -> LeaderboardServiceInterface:
+    return LeaderboardService(
+        leaderboard_repository=get_leaderboard_repository(),
+        cache_ttl=timedelta(seconds=settings.leaderboard.cache_ttl),
+        max_limit=settings.leaderboard.max_limit,
+    )
@@ -0,0 +1,15 @@
+from abstractions.services.pair_state import PairStateServiceInterface
+from dependencies.repositories.bet import get_bet_repository
+from dependencies.repositories.chain import get_chain_repository
+from dependencies.services.block import get_block_service
+from dependencies.services.candle import get_candle_service
+from services.pair_state import PairStateService
+
+
+def get_pair_state_service() -> PairStateServiceInterface:
+    return PairStateService(
+        chain_repository=get_chain_repository(),
+        bet_repository=get_bet_repository(),
+        block_service=get_block_service(),
+        candle_service=get_candle_service(),
+    )
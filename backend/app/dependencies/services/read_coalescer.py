@@ -0,0 +1,12 @@
+from datetime import timedelta
+
+from abstractions.services.read_coalescer import ReadCoalescerInterface
+from services.read_coalescer import ReadCoalescer
+from settings import settings
+
+
+def get_read_coalescer() -> ReadCoalescerInterface:
+    return ReadCoalescer(
+        ttl=timedelta(seconds=settings.reads.ttl),
+        max_entries=settings.reads.max_entries,
+    )
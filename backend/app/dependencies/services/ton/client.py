@@ -1,7 +1,10 @@
+from datetime import timedelta
+
 from abstractions.services.tonclient import TonClientInterface
 from services.ton.client.api import TonApiClient
 from services.ton.client.lib import TonTonLibClient
 from services.ton.client.main_client import MainTonClient
+from services.ton.client.offline import OfflineTonClient
 from settings import settings
 
 
@@ -17,7 +20,20 @@ def get_lib_client() -> TonTonLibClient:
     )
 
 
+def get_offline_client() -> OfflineTonClient:
+    return OfflineTonClient(
+        latency=timedelta(milliseconds=settings.ton.offline_latency_ms),
+    )
+
+
 def get_ton_client() -> TonClientInterface:
+    if settings.ton.offline:
+        offline_client = get_offline_client()
+        return MainTonClient(
+            ton_client=offline_client,
+            ton_api_client=offline_client,
+        )
+
     return MainTonClient(  # todo: mock
         ton_client=get_lib_client(),
         ton_api_client=get_api_client(),
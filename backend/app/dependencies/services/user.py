@@ -1,6 +1,8 @@
 from abstractions.services.user import UserServiceInterface
 from dependencies.repositories.deposit import get_deposit_repository
+from dependencies.repositories.ledger import get_ledger_repository
 from dependencies.repositories.user import get_user_repository
+from dependencies.repositories.user_stats import get_user_stats_repository
 from dependencies.services.block import get_block_service
 from dependencies.services.currency import get_currency_service
 from services.user import UserService
@@ -11,5 +13,7 @@ def get_user_service() -> UserServiceInterface:
         user_repository=get_user_repository(),
         block_service=get_block_service(),
         deposit_repository=get_deposit_repository(),
+        ledger_repository=get_ledger_repository(),
+        user_stats_repository=get_user_stats_repository(),
         currency_service=get_currency_service()
     )
@@ -0,0 +1,6 @@
+from abstractions.services.versions import VersionRegistryInterface
+from services.versions import VersionRegistry
+
+
+def get_version_registry() -> VersionRegistryInterface:
+    return VersionRegistry()
@@ -0,0 +1,16 @@
+from datetime import timedelta
+
+from abstractions.services.worker import SettlementWorkerInterface
+from dependencies.services.chain import get_chain_service
+from dependencies.services.leader_election import get_leader_election
+from services.worker import SettlementWorker
+from settings import settings
+
+
+def get_settlement_worker() -> SettlementWorkerInterface:
+    return SettlementWorker(
+        chain_service=get_chain_service(),
+        leader_election=get_leader_election(),
+        retry_interval=timedelta(seconds=settings.worker.retry_interval),
+        heartbeat_interval=timedelta(seconds=settings.worker.heartbeat_interval),
+    )
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(kw_only=True)
+class BlockCandleDTO:
+    """
+    Candle of one completed block; it is added to the hour and day candles it falls into.
+    """
+    pair_id: UUID
+    block_number: int
+    created_at: datetime
+    close: float
+    high: Optional[float] = None
+    low: Optional[float] = None
+    volume: float = 0.0
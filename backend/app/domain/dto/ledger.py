@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from domain.dto import CreateDTO
+from domain.enums.ledger import LedgerEntryType
+
+
+@dataclass(kw_only=True)
+class CreateLedgerEntryDTO(CreateDTO):
+    user_id: UUID
+    type: LedgerEntryType
+    amount: float  # signed: < 0 takes from the balance
+    reference_id: Optional[UUID] = None  # bet, deposit or transaction the entry comes from
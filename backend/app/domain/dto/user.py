@@ -24,4 +24,3 @@ class UpdateUserDTO(BaseModel):
     last_name: Optional[str] = None
     last_activity: Optional[datetime] = None
     wallet_address: Optional[str] = None
-    balance: Optional[float] = None
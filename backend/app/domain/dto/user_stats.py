@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(kw_only=True)
+class UserStatsDeltaDTO:
+    """
+    Increments of the stats of a user on a pair; they are added to the pair and to the user totals.
+    """
+    user_id: UUID
+    pair_id: UUID
+    pending_stake: float = 0.0
+    staked: float = 0.0
+    reward: float = 0.0
+    bets: int = 0
+    resolved: int = 0
+    accuracy: Optional[float] = None  # accuracy of one resolved bet, folded into the average
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class CandleResolution(Enum):
+    BLOCK = 'block'
+    HOUR = 'hour'
+    DAY = 'day'
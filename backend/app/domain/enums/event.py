@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class EventType(Enum):
+    BLOCK_STARTED = "block_started"
+    BLOCK_COMPLETED = "block_completed"
+    BALANCES_CHANGED = "balances_changed"
+    BETS_CHANGED = "bets_changed"
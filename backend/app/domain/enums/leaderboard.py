@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class LeaderboardPeriod(Enum):
+    DAY = 'day'
+    WEEK = 'week'
+    ALL_TIME = 'all_time'
+
+
+class LeaderboardMetric(Enum):
+    REWARD = 'reward'  # total reward over the period
+    ACCURACY = 'accuracy'  # mean accuracy of the resolved bets over the period
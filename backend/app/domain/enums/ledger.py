@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class LedgerEntryType(Enum):
+    OPENING = 'opening'  # balance carried over from users.balance
+    DEPOSIT = 'deposit'  # funded deposit from an external wallet
+    WITHDRAWAL = 'withdrawal'  # withdraw to external wallet
+    BET = 'bet'  # stake taken when a bet is placed
+    REFUND = 'refund'  # stake returned when a pending bet is canceled
+    REWARD = 'reward'  # stake returned with the reward when a block is settled
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class RequestPriority(Enum):
+    # shed first when the database or the event loop is overloaded
+    LOW = 'low'
+    NORMAL = 'normal'
+    # writes: admitted as long as connections are left outside the reserve
+    HIGH = 'high'
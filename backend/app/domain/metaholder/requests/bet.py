@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
 
 class PlaceBetRequest(BaseModel):
@@ -9,6 +9,17 @@ class PlaceBetRequest(BaseModel):
     predicted_vector: tuple[float, float]
 
 
+class PlaceBetsRequest(BaseModel):
+    bets: list[PlaceBetRequest] = Field(min_length=1)
+
+    @field_validator('bets')
+    @classmethod
+    def one_bet_per_pair(cls, bets: list[PlaceBetRequest]) -> list[PlaceBetRequest]:
+        if len({bet.pair_id for bet in bets}) != len(bets):
+            raise ValueError('one bet per pair')
+        return bets
+
+
 class CancelBetRequest(BaseModel):
     # user_id: UUID
     bet_id: UUID
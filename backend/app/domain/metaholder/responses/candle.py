@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -8,3 +11,5 @@ class Candle(BaseModel):
     low_price: float
     volume: float
     block_number: int
+    start: Optional[datetime] = None
+    block_count: int = 1
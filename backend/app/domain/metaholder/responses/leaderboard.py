@@ -0,0 +1,22 @@
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from domain.enums.leaderboard import LeaderboardMetric, LeaderboardPeriod
+
+
+class LeaderboardEntryResponse(BaseModel):
+    rank: int
+    user_id: UUID = Field(serialization_alias='userId')
+    total_reward: float = Field(serialization_alias='totalReward')
+    accuracy: float
+    bet_count: int = Field(serialization_alias='betCount')
+
+
+class LeaderboardResponse(BaseModel):
+    pair_id: UUID = Field(serialization_alias='pairId')
+    period: LeaderboardPeriod
+    metric: LeaderboardMetric
+    entries: List[LeaderboardEntryResponse]
+    me: Optional[LeaderboardEntryResponse] = None
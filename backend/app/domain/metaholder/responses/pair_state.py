@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from domain.metaholder.responses.bet import BetResponse
+from domain.metaholder.responses.block_state import BlockStateResponse
+from domain.metaholder.responses.candle import Candle
+
+
+class PairStateResponse(BaseModel):
+    pair_id: UUID
+    block: Optional[BlockStateResponse] = None
+    last_vector: Optional[Tuple[float, float]] = None
+    last_candle: Optional[Candle] = None
+    pending_bet: Optional[BetResponse] = None
+
+
+class PairsStateResponse(BaseModel):
+    server_time: datetime
+    pairs: List[PairStateResponse]
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -20,3 +20,21 @@ class UserInfoResponse(BaseModel):
     user_id: UUID
     balance: float
     at_risk: float = Field(serialization_alias='atRisk')
+    total_staked: float = Field(0.0, serialization_alias='totalStaked')
+    total_reward: float = Field(0.0, serialization_alias='totalReward')
+    bet_count: int = Field(0, serialization_alias='betCount')
+    accuracy: Optional[float] = None
+
+
+class UserPairStatsResponse(BaseModel):
+    pair_id: UUID = Field(serialization_alias='pairId')
+    at_risk: float = Field(serialization_alias='atRisk')
+    total_staked: float = Field(serialization_alias='totalStaked')
+    total_reward: float = Field(serialization_alias='totalReward')
+    bet_count: int = Field(serialization_alias='betCount')
+    accuracy: Optional[float] = None
+
+
+class UserStatsResponse(BaseModel):
+    user_id: UUID
+    pairs: List[UserPairStatsResponse]
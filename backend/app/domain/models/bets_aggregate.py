@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True)
+class BetsAggregate:
+    # sums over the bets of one block, weighted by the bet amount
+    weighted_price: float
+    weighted_tx_count: float
+    total_stake: float
+    count: int
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+
+@dataclass(frozen=True, kw_only=True)
+class BlockClock:
+    """
+    Epoch-aligned block clock: slot N covers [origin + N * interval, origin + (N + 1) * interval).
+    Pure arithmetic, so every process gets the same boundaries without touching the DB.
+    """
+    origin: datetime
+    interval: timedelta
+
+    def slot(self, at: datetime) -> int:
+        return (at - self.origin) // self.interval
+
+    def slot_start(self, slot: int) -> datetime:
+        return self.origin + slot * self.interval
+
+    def slot_end(self, slot: int) -> datetime:
+        return self.slot_start(slot + 1)
+
+    def boundary_after(self, at: datetime) -> datetime:
+        """
+        Ближайшая граница блоков строго после `at`: момент закрытия блока, начатого в `at`.
+        """
+        return self.slot_end(self.slot(at))
+
+    def remaining(self, at: datetime) -> timedelta:
+        return self.boundary_after(at) - at
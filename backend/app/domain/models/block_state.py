@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(kw_only=True)
+class CachedBlockState:
+    block_id: UUID
+    block_number: int
+    ends_at: datetime
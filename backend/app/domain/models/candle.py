@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from domain.enums.candle import CandleResolution
+
+
+def candle_start(resolution: CandleResolution, at: datetime) -> datetime:
+    """
+    Start of the candle that a block created at `at` falls into.
+    """
+    match resolution:
+        case CandleResolution.BLOCK:
+            return at
+        case CandleResolution.HOUR:
+            return at.replace(minute=0, second=0, microsecond=0)
+        case CandleResolution.DAY:
+            return at.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+@dataclass(kw_only=True)
+class Candle:
+    pair_id: UUID
+    resolution: CandleResolution
+    start: datetime
+    block_number: int  # the first block of the candle
+    block_count: int
+    open: Optional[float]  # result price of the block before the first one, None for the first block of a chain
+    close: float
+    high: Optional[float]  # extremes of the predicted prices, None while the candle has no bets
+    low: Optional[float]
+    volume: float
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import ClassVar, Union
+from uuid import UUID
+
+from domain.enums.event import EventType
+from domain.models.bet import BetVector
+
+
+@dataclass(kw_only=True)
+class BlockStartedEvent:
+    type: ClassVar[EventType] = EventType.BLOCK_STARTED
+
+    chain_id: UUID
+    pair_id: UUID
+    block_id: UUID
+    block_number: int
+    created_at: datetime
+    ends_at: datetime
+
+
+@dataclass(kw_only=True)
+class BlockCompletedEvent:
+    type: ClassVar[EventType] = EventType.BLOCK_COMPLETED
+
+    chain_id: UUID
+    pair_id: UUID
+    block_id: UUID
+    block_number: int
+    result_vector: BetVector
+    completed_at: datetime
+
+
+@dataclass(kw_only=True)
+class BalancesChangedEvent:
+    type: ClassVar[EventType] = EventType.BALANCES_CHANGED
+
+    user_ids: list[UUID]
+
+
+@dataclass(kw_only=True)
+class BetsChangedEvent:
+    """
+    Users placed or canceled bets themselves. Settlement publishes BalancesChangedEvent instead.
+    """
+    type: ClassVar[EventType] = EventType.BETS_CHANGED
+
+    user_ids: list[UUID]
+
+
+Event = Union[BlockStartedEvent, BlockCompletedEvent, BalancesChangedEvent, BetsChangedEvent]
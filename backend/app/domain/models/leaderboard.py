@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from domain.enums.leaderboard import LeaderboardPeriod
+
+ALL_TIME_START = datetime(1970, 1, 1)
+
+
+def period_start(period: LeaderboardPeriod, at: datetime) -> datetime:
+    """
+    Start of the day, the week (from Monday) or of all time that `at` falls into.
+    """
+    day = at.replace(hour=0, minute=0, second=0, microsecond=0)
+    match period:
+        case LeaderboardPeriod.DAY:
+            return day
+        case LeaderboardPeriod.WEEK:
+            return day - timedelta(days=day.weekday())
+        case LeaderboardPeriod.ALL_TIME:
+            return ALL_TIME_START
+
+
+@dataclass(kw_only=True)
+class LeaderboardEntry:
+    user_id: UUID
+    rank: int  # 1 + number of users with a strictly better score, ties share a rank
+    total_reward: float
+    accuracy: float
+    resolved_count: int
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, frozen=True)
+class PoolUsage:
+    """
+    Connections of a database pool: `checked_out` are in use, `waiting` checkouts wait for one,
+    at most `capacity` can be open at once.
+    """
+    checked_out: int
+    waiting: int
+    capacity: int
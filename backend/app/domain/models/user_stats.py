@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(kw_only=True)
+class UserStats:
+    # pair_id is None for the totals over all pairs of the user
+    user_id: UUID
+    pair_id: Optional[UUID] = None
+    pending_stake: float = 0.0
+    total_staked: float = 0.0  # canceled bets are not counted
+    total_reward: float = 0.0
+    bet_count: int = 0
+    resolved_count: int = 0
+    accuracy: Optional[float] = None  # exponentially weighted over resolved bets, None before the first one
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(kw_only=True, frozen=True)
+class Version:
+    """
+    Validator of a response: `tag` changes whenever the content may have, `modified_at` is no
+    earlier than the last change.
+    """
+    tag: str
+    modified_at: datetime
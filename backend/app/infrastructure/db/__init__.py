@@ -1,10 +1,62 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from uuid import uuid4
 
-from settings import settings
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
+
+from infrastructure.db.instrumentation import TimedAsyncAdaptedQueuePool, instrument_engine
+from infrastructure.db.replica import ReplicaSessionMaker, SessionFactory
+from settings import EngineProfile, settings
 
 __all__ = [
+    "engine",
     "session_maker",
+    "read_engine",
+    "read_session_maker",
+    "replica_session_maker",
 ]
 
-engine = create_async_engine(settings.db.url, echo=False, pool_recycle=1800, pool_timeout=30)
+
+def _create_engine(url: str, profile: EngineProfile) -> AsyncEngine:
+    connect_args = {
+        # the statement cache of SQLAlchemy's asyncpg adapter and the one of asyncpg itself
+        'prepared_statement_cache_size': profile.statement_cache_size,
+        'statement_cache_size': profile.statement_cache_size,
+    }
+    if profile.pgbouncer:
+        # a prepared statement lives on one server connection, the next transaction may get another one
+        connect_args.update(
+            prepared_statement_cache_size=0,
+            statement_cache_size=0,
+            prepared_statement_name_func=lambda: f'__asyncpg_{uuid4()}__',
+        )
+
+    created = create_async_engine(
+        url,
+        echo=False,
+        pool_recycle=profile.pool_recycle,
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_timeout=profile.pool_timeout,
+        pool_pre_ping=profile.pre_ping,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        connect_args=connect_args,
+    )
+    instrument_engine(created)
+    return created
+
+
+engine = _create_engine(settings.db.url, settings.db.profiles[settings.db.profile])
 session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+# without a replica the pure reads share the primary engine and its pool
+read_session_maker: SessionFactory
+if settings.db.replica:
+    read_engine = _create_engine(settings.db.replica_url, settings.db.profiles[settings.db.replica.profile])
+    replica_session_maker = ReplicaSessionMaker(
+        primary=session_maker,
+        replica=async_sessionmaker(read_engine, expire_on_commit=False),
+    )
+    read_session_maker = replica_session_maker
+else:
+    read_engine = engine
+    replica_session_maker = None
+    read_session_maker = session_maker
@@ -0,0 +1,166 @@
+import asyncio
+import gzip
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from abstractions.services.archive import ArchiveServiceInterface
+from abstractions.services.clock import ClockInterface
+from services.clock import SystemClock
+
+logger = logging.getLogger(__name__)
+
+_PARTITION_NAME = re.compile(r'^(?P<table>bets|blocks)_p(?P<year>\d{4})_(?P<month>\d{2})$')
+
+# a month is archived only when nothing in it can change any more
+_FINAL_CHECKS = {
+    'bets': "SELECT NOT EXISTS (SELECT 1 FROM {partition} WHERE status = 'PENDING')",
+    # the last completed block of a chain prices new bets: keep months up to it
+    'blocks': """
+        SELECT NOT EXISTS (SELECT 1 FROM {partition} WHERE status = 'IN_PROGRESS')
+           AND NOT EXISTS (
+               SELECT 1 FROM chains
+               WHERE NOT EXISTS (
+                   SELECT 1 FROM blocks
+                   WHERE blocks.chain_id = chains.id AND blocks.status = 'COMPLETED' AND blocks.created_at >= :upper
+               )
+           )
+    """,
+}
+
+
+# the month stays attached and read-only if the lock is not granted in time; the next run retries
+_DETACH_LOCK_TIMEOUT = '5s'
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+@dataclass
+class PostgresArchiveService(ArchiveServiceInterface):
+    """
+    Maintains the monthly RANGE (created_at) partitions of bets and blocks.
+
+    Partitions are created `months_ahead` in advance, so rows never land in the DEFAULT partition
+    (a non-empty DEFAULT partition would block creating the month it overlaps).
+    With a positive `retention_months`, a month older than that is exported to a gzipped CSV
+    in `directory` and made read-only, then its partition is detached and dropped.
+    """
+    engine: AsyncEngine
+    months_ahead: int = 2
+    retention_months: int = 0
+    directory: Path = Path('storage/archive')
+    clock: ClockInterface = field(default_factory=SystemClock)
+
+    async def maintain(self) -> None:
+        this_month = self.clock.now().date().replace(day=1)
+        for table in _FINAL_CHECKS:
+            for months in range(self.months_ahead + 1):
+                await self._create_partition(table, add_months(this_month, months))
+
+        if self.retention_months <= 0:
+            return
+
+        bets_cutoff = add_months(this_month, -self.retention_months)
+        # bets of a block started at the end of a month fall into the next month,
+        # so a month of blocks goes only after the month of bets that follows it
+        for table, cutoff in (('bets', bets_cutoff), ('blocks', add_months(bets_cutoff, -1))):
+            for partition, month in await self._partitions(table):
+                if add_months(month, 1) > cutoff:
+                    continue
+                await self._archive(table, partition, upper=add_months(month, 1))
+
+    async def _create_partition(self, table: str, month: date) -> None:
+        partition = f'{table}_p{month:%Y_%m}'
+        try:
+            async with self.engine.begin() as connection:
+                if await connection.scalar(text('SELECT to_regclass(:name)'), {'name': partition}):
+                    return
+                await connection.execute(text(
+                    f"CREATE TABLE {partition} PARTITION OF {table} "
+                    f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+                ))
+        except Exception:
+            # e.g. rows of that month already sit in the DEFAULT partition: move them by hand
+            logger.error('Could not create partition %s', partition, exc_info=True)
+            return
+        logger.info('Created partition %s', partition)
+
+    async def _partitions(self, table: str) -> list[tuple[str, date]]:
+        async with self.engine.connect() as connection:
+            names = (await connection.execute(
+                text(
+                    'SELECT child.relname FROM pg_inherits '
+                    'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+                    'JOIN pg_class parent ON parent.oid = pg_inherits.inhparent '
+                    'WHERE parent.relname = :table'
+                ),
+                {'table': table},
+            )).scalars().all()
+
+        partitions = []
+        for name in names:
+            match = _PARTITION_NAME.match(name)
+            if match:
+                partitions.append((name, date(int(match['year']), int(match['month']), 1)))
+        return sorted(partitions, key=lambda partition: partition[1])
+
+    async def _archive(self, table: str, partition: str, upper: date) -> None:
+        path = self.directory / f'{partition}.csv.gz'
+        constraint = f'{partition}_archived'
+        async with self.engine.begin() as connection:
+            # no writes into the month while it is exported; readers are not blocked
+            await connection.execute(text(f'LOCK TABLE {partition} IN SHARE ROW EXCLUSIVE MODE'))
+            is_final = await connection.scalar(
+                text(_FINAL_CHECKS[table].format(partition=partition)),
+                {'upper': upper},
+            )
+            if not is_final:
+                logger.info('Partition %s is past retention but still in use, kept', partition)
+                return
+
+            rows = await self._export(connection, partition, path)
+            # a row written into the month after the export would be dropped with it: reject such writes
+            is_frozen = await connection.scalar(
+                text('SELECT EXISTS (SELECT 1 FROM pg_constraint WHERE conrelid = to_regclass(:partition) '
+                     'AND conname = :constraint)'),
+                {'partition': partition, 'constraint': constraint},
+            )
+            if not is_frozen:
+                await connection.execute(text(
+                    f'ALTER TABLE {partition} ADD CONSTRAINT {constraint} CHECK (false) NOT VALID'
+                ))
+
+        # DETACH locks the parent, then the partition, in the order every statement on the table does.
+        # It must not run in the export transaction: a write that cannot prune partitions (UPDATE ... WHERE id)
+        # holds the parent and waits for the partition locked above, and the two would deadlock
+        async with self.engine.begin() as connection:
+            # a DETACH queued behind a long read would hold up every query on the table
+            await connection.execute(text(f"SET LOCAL lock_timeout = '{_DETACH_LOCK_TIMEOUT}'"))
+            await connection.execute(text(f'ALTER TABLE {table} DETACH PARTITION {partition}'))
+            await connection.execute(text(f'DROP TABLE {partition}'))
+        logger.info('Archived %s rows of %s to %s', rows, partition, path)
+
+    async def _export(self, connection: AsyncConnection, partition: str, path: Path) -> str:
+        await asyncio.to_thread(self.directory.mkdir, parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + '.tmp')
+        raw = await connection.get_raw_connection()
+        archive = await asyncio.to_thread(gzip.open, temporary, 'wb')
+        try:
+            async def write(chunk: bytes) -> None:
+                await asyncio.to_thread(archive.write, chunk)
+
+            status = await raw.driver_connection.copy_from_table(partition, output=write, format='csv', header=True)
+        finally:
+            await asyncio.to_thread(archive.close)
+        await asyncio.to_thread(os.replace, temporary, path)
+        # asyncpg returns the command tag, e.g. "COPY 1234"
+        return status.rpartition(' ')[2]
@@ -2,16 +2,18 @@ from datetime import datetime
 from typing import Optional, List
 from uuid import UUID as pyUUID
 
-from sqlalchemy import ForeignKey, Enum as SQLEnum, BigInteger, UUID
-from sqlalchemy import String, DateTime, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import ForeignKey, Enum as SQLEnum, BigInteger, UUID, Double, Index, Identity
+from sqlalchemy import String, DateTime, func, text, select
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy.orm import relationship, Mapped, mapped_column, column_property
 
 from domain.enums import BetStatus, TransactionType, WalletType
 from domain.enums.block_status import BlockStatus
+from domain.enums.candle import CandleResolution
 from domain.enums.chain_status import ChainStatus
 from domain.enums.deposit import DepositEntryStatus
+from domain.enums.leaderboard import LeaderboardPeriod
+from domain.enums.ledger import LedgerEntryType
 from domain.models.app_wallet import AppWalletVersion
 from domain.models.bet import BetVector
 
@@ -35,7 +37,7 @@ class User(AbstractBase):
     last_name: Mapped[Optional[str]] = mapped_column(String(255))
     last_activity: Mapped[Optional[datetime]]
 
-    balance: Mapped[float]
+    # balance: column_property over the ledger, see below
 
     wallet_address: Mapped[Optional[str]]
 
@@ -50,15 +52,38 @@ class Bet(AbstractBase):
     id: Mapped[pyUUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
     user_id: Mapped[pyUUID] = mapped_column(ForeignKey('users.id'))
     pair_id: Mapped[pyUUID] = mapped_column(ForeignKey('pairs.id'), index=True)
-    block_id: Mapped[pyUUID] = mapped_column(ForeignKey('blocks.id'), index=True)
+    # no foreign key: blocks is partitioned, its primary key is (id, created_at)
+    block_id: Mapped[pyUUID] = mapped_column(UUID(as_uuid=True), index=True)
     amount: Mapped[float]
-    vector: Mapped[BetVector] = mapped_column(JSONB)
+    predicted_price: Mapped[float] = mapped_column(Double)
+    predicted_tx_count: Mapped[float] = mapped_column(Double)
     status: Mapped[BetStatus] = mapped_column(SQLEnum(BetStatus), default=BetStatus.PENDING)
     reward: Mapped[Optional[float]]
     accuracy: Mapped[Optional[float]]
     user: Mapped['User'] = relationship("User", back_populates="bets")
     pair: Mapped['Pair'] = relationship("Pair", back_populates="bets")
-    block: Mapped['Block'] = relationship("Block", back_populates='bets')
+    block: Mapped['Block'] = relationship(
+        "Block",
+        back_populates='bets',
+        primaryjoin='Bet.block_id == Block.id',
+        foreign_keys=[block_id],
+    )
+
+    # monthly partitions; the primary key in the database is (id, created_at), see the migration
+    __table_args__ = (
+        Index('ix_bets_user_id_created_at', 'user_id', 'created_at'),
+        # pending bets are the bets of the current blocks: a small index whatever the history
+        Index('ix_bets_user_id_pending', 'user_id', postgresql_where=text("status = 'PENDING'")),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
+
+    @property
+    def vector(self) -> BetVector:
+        return self.predicted_price, self.predicted_tx_count
+
+    @vector.setter
+    def vector(self, value: BetVector) -> None:
+        self.predicted_price, self.predicted_tx_count = value
 
 
 class Transaction(AbstractBase):
@@ -121,14 +146,42 @@ class Block(AbstractBase):
     id: Mapped[pyUUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
     block_number: Mapped[int] = mapped_column()
     status: Mapped[BlockStatus] = mapped_column(SQLEnum(BlockStatus), default=BlockStatus.IN_PROGRESS)
-    result_vector: Mapped[Optional[BetVector]] = mapped_column(JSONB)
+    result_price: Mapped[Optional[float]] = mapped_column(Double)
+    result_tx_count: Mapped[Optional[float]] = mapped_column(Double)
 
     completed_at: Mapped[Optional[datetime]] = mapped_column()
 
     chain_id: Mapped[pyUUID] = mapped_column(ForeignKey('chains.id'))
 
     chain: Mapped['Chain'] = relationship("Chain", back_populates='blocks')
-    bets: Mapped[List["Bet"]] = relationship("Bet", back_populates='block')
+    bets: Mapped[List["Bet"]] = relationship(
+        "Bet",
+        back_populates='block',
+        primaryjoin='Block.id == Bet.block_id',
+        foreign_keys='Bet.block_id',
+    )
+
+    # monthly partitions like bets
+    __table_args__ = (
+        Index('ix_blocks_chain_id_created_at', 'chain_id', 'created_at'),
+        # /block/last_vectors reads the latest completed blocks with a non-zero result
+        Index(
+            'ix_blocks_chain_id_created_at_with_result',
+            'chain_id', 'created_at',
+            postgresql_where=text("status = 'COMPLETED' AND (result_price <> 0 OR result_tx_count <> 0)"),
+        ),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
+
+    @property
+    def result_vector(self) -> Optional[BetVector]:
+        if self.result_price is None:
+            return None
+        return self.result_price, self.result_tx_count
+
+    @result_vector.setter
+    def result_vector(self, value: Optional[BetVector]) -> None:
+        self.result_price, self.result_tx_count = value if value is not None else (None, None)
 
 
 class Chain(AbstractBase):
@@ -142,3 +195,118 @@ class Chain(AbstractBase):
 
     blocks: Mapped[List[Block]] = relationship("Block", back_populates='chain')
     pair: Mapped[Pair] = relationship("Pair")
+
+
+class _UserStatsColumns:
+    # maintained incrementally by UserStatsRepository.apply, see domain.models.user_stats
+    pending_stake: Mapped[float] = mapped_column(Double, default=0.0)
+    total_staked: Mapped[float] = mapped_column(Double, default=0.0)
+    total_reward: Mapped[float] = mapped_column(Double, default=0.0)
+    bet_count: Mapped[int] = mapped_column(default=0)
+    resolved_count: Mapped[int] = mapped_column(default=0)
+    accuracy: Mapped[Optional[float]] = mapped_column(Double)
+
+
+class UserStats(_UserStatsColumns, AbstractBase):
+    __tablename__ = 'user_stats'
+
+    user_id: Mapped[pyUUID] = mapped_column(ForeignKey('users.id'), primary_key=True)
+
+
+class UserPairStats(_UserStatsColumns, AbstractBase):
+    __tablename__ = 'user_pair_stats'
+
+    user_id: Mapped[pyUUID] = mapped_column(ForeignKey('users.id'), primary_key=True)
+    pair_id: Mapped[pyUUID] = mapped_column(ForeignKey('pairs.id'), primary_key=True)
+
+
+class Candle(Base):
+    """
+    Chart candle of a pair: one per completed block, rolled up into hours and days as blocks complete.
+    """
+    __tablename__ = 'candles'
+
+    pair_id: Mapped[pyUUID] = mapped_column(ForeignKey('pairs.id'), primary_key=True)
+    resolution: Mapped[CandleResolution] = mapped_column(SQLEnum(CandleResolution), primary_key=True)
+    start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    block_number: Mapped[int]
+    block_count: Mapped[int]
+    open: Mapped[Optional[float]] = mapped_column(Double)
+    close: Mapped[float] = mapped_column(Double)
+    high: Mapped[Optional[float]] = mapped_column(Double)
+    low: Mapped[Optional[float]] = mapped_column(Double)
+    volume: Mapped[float] = mapped_column(Double)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+
+class LeaderboardRow(Base):
+    """
+    Totals of a user on a pair over one period; the score indexes keep every board sorted.
+    """
+    __tablename__ = 'leaderboard_entries'
+
+    pair_id: Mapped[pyUUID] = mapped_column(ForeignKey('pairs.id'), primary_key=True)
+    period: Mapped[LeaderboardPeriod] = mapped_column(SQLEnum(LeaderboardPeriod), primary_key=True)
+    period_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    user_id: Mapped[pyUUID] = mapped_column(ForeignKey('users.id'), primary_key=True)
+    total_reward: Mapped[float] = mapped_column(Double)
+    accuracy_sum: Mapped[float] = mapped_column(Double)
+    resolved_count: Mapped[int]
+    accuracy: Mapped[float] = mapped_column(Double)  # accuracy_sum / resolved_count, stored to be indexed
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    __table_args__ = (
+        Index('ix_leaderboard_entries_reward', 'pair_id', 'period', 'period_start', text('total_reward DESC')),
+        Index('ix_leaderboard_entries_accuracy', 'pair_id', 'period', 'period_start', text('accuracy DESC')),
+    )
+
+
+class LedgerEntry(Base):
+    """
+    Append-only: balances change by inserting entries, never by updating a row.
+    """
+    __tablename__ = 'ledger_entries'
+
+    id: Mapped[pyUUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    # commit order is not insertion order: snapshots only fold entries up to a settled fence, see LedgerRepository
+    seq: Mapped[int] = mapped_column(BigInteger, Identity(), unique=True)
+    user_id: Mapped[pyUUID] = mapped_column(ForeignKey('users.id'))
+    type: Mapped[LedgerEntryType] = mapped_column(SQLEnum(LedgerEntryType))
+    amount: Mapped[float] = mapped_column(Double)
+    reference_id: Mapped[Optional[pyUUID]] = mapped_column(UUID(as_uuid=True))
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        Index('ix_ledger_entries_user_id_seq', 'user_id', 'seq'),
+    )
+
+
+class BalanceSnapshot(Base):
+    """
+    Sum of the ledger entries of a user up to and including `seq`.
+    """
+    __tablename__ = 'balance_snapshots'
+
+    user_id: Mapped[pyUUID] = mapped_column(ForeignKey('users.id'), primary_key=True)
+    seq: Mapped[int] = mapped_column(BigInteger)
+    balance: Mapped[float] = mapped_column(Double)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+
+def balance_of(user_id):
+    """
+    Balance of `user_id` (a column or a value): the snapshot plus the entries after it.
+    """
+    snapshots = select(BalanceSnapshot).where(BalanceSnapshot.user_id == user_id).correlate_except(BalanceSnapshot)
+    snapshot_seq = snapshots.with_only_columns(BalanceSnapshot.seq).scalar_subquery()
+    snapshot = snapshots.with_only_columns(BalanceSnapshot.balance).scalar_subquery()
+    tail = (
+        select(func.sum(LedgerEntry.amount))
+        .where(LedgerEntry.user_id == user_id, LedgerEntry.seq > func.coalesce(snapshot_seq, 0))
+        .correlate_except(LedgerEntry)
+        .scalar_subquery()
+    )
+    return func.coalesce(snapshot, 0.0) + func.coalesce(tail, 0.0)
+
+
+User.balance = column_property(balance_of(User.id))
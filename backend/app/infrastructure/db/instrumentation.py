@@ -0,0 +1,151 @@
+import inspect
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from domain.models.pool_usage import PoolUsage
+from infrastructure.metrics import DB_POOL_CHECKOUT_WAIT, DB_QUERY_DURATION
+
+logger = logging.getLogger(__name__)
+
+# name of the repository method issuing the current statements, e.g. "BetRepository.get_last_user_bet"
+db_operation: ContextVar[str] = ContextVar('db_operation', default='other')
+
+# expanded IN lists and literals differ between executions of the same query
+_PLACEHOLDER_LIST_RE = re.compile(r'\$\d+(?:\s*,\s*\$\d+)*')
+
+
+@dataclass
+class QueryStats:
+    """
+    Statements executed within one unit of work (an HTTP request or a scheduler job).
+    """
+    collect_shapes: bool = False
+    count: int = 0
+    duration: float = 0.0  # seconds
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        if self.collect_shapes:
+            self.shapes[_PLACEHOLDER_LIST_RE.sub('?', statement)] += 1
+
+    def get_repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar('query_stats', default=None)
+
+
+@contextmanager
+def track_queries(collect_shapes: bool = False) -> Iterator[QueryStats]:
+    """
+    Counts statements executed in the current context, including tasks spawned from it.
+    """
+    stats = QueryStats(collect_shapes=collect_shapes)
+    token = query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats.reset(token)
+
+
+def report_repeated_queries(scope: str, stats: QueryStats, threshold: int) -> None:
+    """
+    Warns about statement shapes executed `threshold` or more times: usually a query issued per item in a loop.
+    """
+    for shape, count in stats.get_repeated(threshold):
+        logger.warning(
+            f'Possible N+1 in {scope}: statement executed {count} times: {shape[:500]}',
+            extra={'db_scope': scope, 'db_repeated_count': count},
+        )
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that reports how long a checkout had to wait for a free (or new) connection
+    and how many checkouts are waiting right now.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            return super()._do_get()
+        finally:
+            self.waiting -= 1
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+    def usage(self) -> PoolUsage:
+        return PoolUsage(
+            checked_out=self.checkedout(),
+            waiting=self.waiting,
+            # a negative max_overflow means no limit: only the persistent connections are counted then
+            capacity=self.size() + max(self._max_overflow, 0),
+        )
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context.wp_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, 'after_cursor_execute')
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started_at = getattr(context, 'wp_started_at', None)
+        if started_at is None:
+            return
+
+        elapsed = time.perf_counter() - started_at
+        DB_QUERY_DURATION.labels(db_operation.get()).observe(elapsed)
+        if stats := query_stats.get():
+            stats.record(statement, elapsed)
+
+
+def track_db_operation(name: str, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Wraps a coroutine function so statements issued inside it are attributed to `name`.
+    """
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = db_operation.set(name)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            db_operation.reset(token)
+
+    wrapper.wp_db_operation = name  # noqa
+    return wrapper
+
+
+def instrument_repository_class(cls: type) -> None:
+    """
+    Attributes the statements of every public async method of a repository class to "<Class>.<method>".
+    """
+    for name, attr in inspect.getmembers(cls, inspect.iscoroutinefunction):
+        if name.startswith('_'):
+            continue
+        operation = f'{cls.__name__}.{name}'
+        wrapped_operation = getattr(attr, 'wp_db_operation', None)
+        if wrapped_operation == operation:
+            continue
+        # methods inherited from an already instrumented base are re-labelled with the subclass name
+        func = attr.__wrapped__ if wrapped_operation else attr
+        setattr(cls, name, track_db_operation(operation, func))
@@ -0,0 +1,80 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection
+
+from abstractions.services.leader_election import LeaderElectionInterface
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PostgresLeaderElection(LeaderElectionInterface):
+    """
+    Leader election via session-level Postgres advisory lock.
+    The lock lives as long as the dedicated connection does, so a crashed leader
+    releases it automatically and a standby takes over on its next attempt.
+    """
+    engine: AsyncEngine
+    lock_key: int
+
+    _connection: Optional[AsyncConnection] = field(default=None, init=False)
+    _is_leader: bool = field(default=False, init=False)
+
+    async def try_acquire(self) -> bool:
+        if self._is_leader:
+            return await self.is_leader()
+
+        try:
+            if self._connection is None:
+                connection = await self.engine.connect()
+                # autocommit: the lock must not keep the session "idle in transaction"
+                self._connection = await connection.execution_options(isolation_level='AUTOCOMMIT')
+
+            acquired = (await self._connection.execute(
+                select(func.pg_try_advisory_lock(self.lock_key))
+            )).scalar()
+        except Exception:
+            logger.error('Could not try advisory lock', exc_info=True)
+            await self._drop_connection()
+            return False
+
+        self._is_leader = bool(acquired)
+        return self._is_leader
+
+    async def is_leader(self) -> bool:
+        if not self._is_leader or self._connection is None:
+            return False
+
+        try:
+            await self._connection.execute(select(1))
+        except Exception:
+            logger.error('Advisory lock connection is lost', exc_info=True)
+            await self._drop_connection()
+            return False
+        return True
+
+    async def release(self) -> None:
+        if self._connection is None:
+            return
+
+        try:
+            if self._is_leader:
+                await self._connection.execute(select(func.pg_advisory_unlock(self.lock_key)))
+        except Exception:
+            logger.error('Could not release advisory lock', exc_info=True)
+        finally:
+            await self._drop_connection()
+
+    async def _drop_connection(self) -> None:
+        self._is_leader = False
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+
+        try:
+            await connection.close()
+        except Exception:
+            logger.warning('Could not close advisory lock connection', exc_info=True)
@@ -0,0 +1,219 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import Text, select, func
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, AsyncConnection
+
+from abstractions.services.events import EventPublisherInterface, EventListenerInterface
+from domain.enums.event import EventType
+from domain.models.events import Event, BlockStartedEvent, BlockCompletedEvent, BalancesChangedEvent, BetsChangedEvent
+from infrastructure.db.replica import ReplicaSessionMaker
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY payload is limited to 8000 bytes, ~40 bytes per serialized UUID
+MAX_USER_IDS_PER_NOTIFICATION = 150
+
+
+def encode_event(event: Event, lsn: Optional[str] = None) -> str:
+    """
+    `lsn` is the WAL position of the primary after the writes the event announces, see ReplicaSessionMaker.
+    """
+    match event:
+        case BlockStartedEvent():
+            payload = {
+                'chain_id': str(event.chain_id),
+                'pair_id': str(event.pair_id),
+                'block_id': str(event.block_id),
+                'block_number': event.block_number,
+                'created_at': event.created_at.isoformat(),
+                'ends_at': event.ends_at.isoformat(),
+            }
+        case BlockCompletedEvent():
+            payload = {
+                'chain_id': str(event.chain_id),
+                'pair_id': str(event.pair_id),
+                'block_id': str(event.block_id),
+                'block_number': event.block_number,
+                'result_vector': list(event.result_vector),
+                'completed_at': event.completed_at.isoformat(),
+            }
+        case BalancesChangedEvent() | BetsChangedEvent():
+            payload = {
+                'user_ids': [str(user_id) for user_id in event.user_ids],
+            }
+        case _:
+            raise ValueError(f'Unknown event {event}')
+
+    if lsn is not None:
+        payload['lsn'] = lsn
+    return json.dumps({'type': event.type.value, **payload})
+
+
+def decode_notification(raw: str) -> tuple[Event, Optional[str]]:
+    payload = json.loads(raw)
+    return _decode_payload(payload), payload.get('lsn')
+
+
+def _decode_payload(payload: dict) -> Event:
+    match EventType(payload['type']):
+        case EventType.BLOCK_STARTED:
+            return BlockStartedEvent(
+                chain_id=UUID(payload['chain_id']),
+                pair_id=UUID(payload['pair_id']),
+                block_id=UUID(payload['block_id']),
+                block_number=payload['block_number'],
+                created_at=datetime.fromisoformat(payload['created_at']),
+                ends_at=datetime.fromisoformat(payload['ends_at']),
+            )
+        case EventType.BLOCK_COMPLETED:
+            return BlockCompletedEvent(
+                chain_id=UUID(payload['chain_id']),
+                pair_id=UUID(payload['pair_id']),
+                block_id=UUID(payload['block_id']),
+                block_number=payload['block_number'],
+                result_vector=tuple(payload['result_vector']),
+                completed_at=datetime.fromisoformat(payload['completed_at']),
+            )
+        case EventType.BALANCES_CHANGED:
+            return BalancesChangedEvent(
+                user_ids=[UUID(user_id) for user_id in payload['user_ids']],
+            )
+        case EventType.BETS_CHANGED:
+            return BetsChangedEvent(
+                user_ids=[UUID(user_id) for user_id in payload['user_ids']],
+            )
+
+
+def split_event(event: Event) -> list[Event]:
+    if not isinstance(event, (BalancesChangedEvent, BetsChangedEvent)):
+        return [event]
+
+    step = MAX_USER_IDS_PER_NOTIFICATION
+    return [
+        type(event)(user_ids=event.user_ids[i:i + step])
+        for i in range(0, len(event.user_ids), step)
+    ]
+
+
+@dataclass
+class PostgresEventPublisher(EventPublisherInterface):
+    session_maker: async_sessionmaker
+    channel: str
+
+    async def publish(self, *events: Event) -> None:
+        parts = [part for event in events for part in split_event(event)]
+        if not parts:
+            return
+
+        async with self.session_maker() as session:
+            async with session.begin():
+                # the announced writes are committed by now, so their WAL records end before this position
+                lsn = await session.scalar(select(func.pg_current_wal_lsn().cast(Text)))
+                for payload in (encode_event(part, lsn) for part in parts):
+                    await session.execute(select(func.pg_notify(self.channel, payload)))
+
+
+@dataclass
+class PostgresEventListener(EventListenerInterface):
+    """
+    Listens to the events channel on a dedicated asyncpg connection.
+    Reconnects on connection loss and tells subscribers that events could have been missed.
+    """
+    engine: AsyncEngine
+    channel: str
+    reconnect_interval: float = 5.0
+    # told the WAL position of every event before its handlers run
+    replica: Optional[ReplicaSessionMaker] = None
+
+    _handlers: list[Callable[[Event], None]] = field(default_factory=list, init=False)
+    _connection_handlers: list[Callable[[bool], None]] = field(default_factory=list, init=False)
+    _task: Optional[asyncio.Task] = field(default=None, init=False)
+    _connection: Optional[AsyncConnection] = field(default=None, init=False)
+
+    def subscribe(self, handler: Callable[[Event], None]) -> None:
+        self._handlers.append(handler)
+
+    def on_connection_change(self, handler: Callable[[bool], None]) -> None:
+        self._connection_handlers.append(handler)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _listen_forever(self) -> None:
+        while True:
+            terminated = asyncio.Event()
+            try:
+                self._connection = await self.engine.connect()
+                raw_connection = await self._connection.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+
+                driver_connection.add_termination_listener(lambda _: terminated.set())
+                await driver_connection.add_listener(self.channel, self._on_notification)
+                if self.replica is not None:
+                    # events missed while disconnected are covered by the position at reconnect
+                    self.replica.require(await driver_connection.fetchval('SELECT pg_current_wal_lsn()::text'))
+                logger.info(f'Listening to {self.channel}')
+                self._notify_connection_change(True)
+
+                await terminated.wait()
+                logger.error(f'Connection listening to {self.channel} is lost')
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.error(f'Could not listen to {self.channel}', exc_info=True)
+            finally:
+                self._notify_connection_change(False)
+                await self._close_connection()
+
+            await asyncio.sleep(self.reconnect_interval)
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str) -> None:  # noqa
+        try:
+            event, lsn = decode_notification(payload)
+        except Exception:
+            logger.error(f'Could not decode notification {payload}', exc_info=True)
+            return
+
+        if lsn is not None and self.replica is not None:
+            self.replica.require(lsn)
+
+        for handler in self._handlers:
+            try:
+                handler(event)
+            except Exception:
+                logger.error(f'Event handler {handler} failed', exc_info=True)
+
+    def _notify_connection_change(self, connected: bool) -> None:
+        for handler in self._connection_handlers:
+            try:
+                handler(connected)
+            except Exception:
+                logger.error(f'Connection handler {handler} failed', exc_info=True)
+
+    async def _close_connection(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+
+        try:
+            await connection.close()
+        except Exception:
+            logger.warning('Could not close listener connection', exc_info=True)
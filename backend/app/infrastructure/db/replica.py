@@ -0,0 +1,65 @@
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncContextManager, AsyncIterator, Callable, Optional
+
+from sqlalchemy import Text, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# what repositories call to open a session: an async_sessionmaker or a ReplicaSessionMaker
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+def parse_lsn(lsn: str) -> int:
+    # pg_lsn is printed as two hex halves, "16/B374D848"
+    high, low = lsn.split('/')
+    return (int(high, 16) << 32) + int(low, 16)
+
+
+@dataclass
+class ReplicaSessionMaker:
+    """
+    Opens read sessions on the replica once it has replayed the primary's WAL up to the newest position
+    known to this process, and on the primary until then.
+
+    Events carry the primary's WAL position at the time they were published, after the writes they
+    announce, and the listener passes it to `require` before the handlers bump response versions or
+    drop caches. So a read served after an event never returns data older than that event: the
+    validators of a response and the caches filled after the event cannot pin a stale replica body.
+    """
+    primary: async_sessionmaker
+    replica: async_sessionmaker
+
+    _required: Optional[int] = field(default=None, init=False)
+    _replayed: Optional[int] = field(default=None, init=False)
+
+    def require(self, lsn: str) -> None:
+        position = parse_lsn(lsn)
+        if self._required is None or position > self._required:
+            self._required = position
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator[AsyncSession]:
+        async with self.replica() as session:
+            if await self._is_fresh(session):
+                yield session
+                return
+
+        async with self.primary() as session:
+            yield session
+
+    async def _is_fresh(self, session: AsyncSession) -> bool:
+        required = self._required
+        if required is None or (self._replayed is not None and self._replayed >= required):
+            return True
+
+        # NULL when the server is not a standby (anymore): it may not follow the primary, read the primary
+        replayed = await session.scalar(select(func.pg_last_wal_replay_lsn().cast(Text)))
+        if replayed is None:
+            logger.warning('Replica reports no replayed WAL position, reading from the primary')
+            return False
+        self._replayed = max(self._replayed or 0, parse_lsn(replayed))
+        return self._replayed >= required
+
@@ -10,6 +10,8 @@ from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import joinedload, InstrumentedAttribute
 
 from abstractions.repositories import CRUDRepositoryInterface
+from infrastructure.db.instrumentation import instrument_repository_class
+from infrastructure.db.replica import SessionFactory
 from infrastructure.db.repositories.exceptions import NotFoundException
 
 logger = logging.getLogger(__name__)
@@ -20,11 +22,19 @@ class AbstractSQLAlchemyRepository[Entity, Model, CreateDTO, UpdateDTO](
     CRUDRepositoryInterface[Model, CreateDTO, UpdateDTO]
 ):
     session_maker: async_sessionmaker
+    # pure reads of the API, no older than the last event seen; the primary when not given
+    read_session_maker: Optional[SessionFactory] = None
 
     joined_fields: dict[str, Optional[list[str]]] = field(default_factory=dict)
     options: list = field(default_factory=list)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_repository_class(cls)
+
     def __post_init__(self):
+        if self.read_session_maker is None:
+            self.read_session_maker = self.session_maker
         self.entity: Type[Entity] = self.__orig_bases__[0].__args__[0]  # noqa
         self._set_lazy_fields()
 
@@ -1,18 +1,22 @@
 from dataclasses import field, dataclass
+from math import isclose
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, insert, select, update
 
 from abstractions.repositories.bet import BetRepositoryInterface
 from domain.dto.bet import CreateBetDTO, UpdateBetDTO
+from domain.dto.ledger import CreateLedgerEntryDTO
 from domain.enums import BetStatus
 from domain.metaholder.responses import BetResponse
 from domain.models.bet import Bet as BetModel
 from domain.models.pair import Pair as PairModel
 from domain.models.user import User as UserModel
-from infrastructure.db.entities import Bet
+from infrastructure.db.entities import Bet, LedgerEntry, User, balance_of
 from infrastructure.db.repositories.AbstractRepository import AbstractSQLAlchemyRepository
+from infrastructure.db.repositories.LedgerRepository import ledger_rows
+from infrastructure.db.repositories.exceptions import ConflictException, NotFoundException
 
 
 @dataclass
@@ -44,6 +48,22 @@ class BetRepository(
             bet = res.unique().scalars().one_or_none()
         return self.entity_to_model(bet) if bet else None
 
+    async def get_pending_user_bets(self, user_id: UUID) -> list[BetModel]:
+        async with self.session_maker() as session:
+            res = await session.execute(
+                select(self.entity)
+                .where(
+                    self.entity.user_id == user_id,
+                    # the predicate of ix_bets_user_id_pending
+                    self.entity.status == BetStatus.PENDING,
+                )
+                .order_by(desc(self.entity.created_at, ))
+                .options(*self.options)
+            )
+
+            bets = res.unique().scalars().all()
+        return [self.entity_to_model(bet) for bet in bets]
+
     async def get_last_user_completed_bet(self, user_id: UUID) -> Bet:
         async with self.session_maker() as session:
             res = await session.execute(
@@ -60,6 +80,40 @@ class BetRepository(
             bet = res.unique().scalars().one_or_none()
         return self.entity_to_model(bet) if bet else None
 
+    async def place_batch(
+            self,
+            user_id: UUID,
+            balance: float,
+            bets: list[CreateBetDTO],
+            canceled_bet_ids: list[UUID],
+            entries: list[CreateLedgerEntryDTO],
+    ) -> None:
+        async with self.session_maker() as session:
+            async with session.begin():
+                # FOR NO KEY UPDATE: batches of the user queue here, while ledger inserts of the user
+                # elsewhere (their foreign key check takes KEY SHARE) do not wait for the batch
+                locked = await session.scalar(
+                    select(User.id).where(User.id == user_id).with_for_update(key_share=True)
+                )
+                if locked is None:
+                    raise NotFoundException(f'User {user_id} not found')
+
+                current = await session.scalar(select(balance_of(user_id)))
+                if not isclose(current, balance, rel_tol=1e-9, abs_tol=1e-9):
+                    raise ConflictException(f'Balance of {user_id} is {current}, the batch expected {balance}')
+
+                if canceled_bet_ids:
+                    canceled = await session.execute(
+                        update(self.entity)
+                        .where(self.entity.id.in_(canceled_bet_ids), self.entity.status == BetStatus.PENDING)
+                        .values(status=BetStatus.CANCELED)
+                    )
+                    if canceled.rowcount != len(canceled_bet_ids):
+                        raise ConflictException(f'Bets {canceled_bet_ids} are no longer all pending')
+
+                if entries:
+                    await session.execute(insert(LedgerEntry), ledger_rows(entries))
+                session.add_all([self.create_dto_to_entity(dto) for dto in bets])
 
     def create_dto_to_entity(self, dto: CreateBetDTO) -> Bet:
         return Bet(
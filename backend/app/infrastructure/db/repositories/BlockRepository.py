@@ -4,15 +4,16 @@ from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, desc, and_
+from sqlalchemy import select, desc, and_, or_, func
 from abstractions.repositories.block import BlockRepositoryInterface
 from domain.dto.block import CreateBlockDTO, UpdateBlockDTO
 from domain.enums.block_status import BlockStatus
 from domain.metaholder.responses.block_state import BlockStateResponse
 from domain.models.bet import Bet as BetModel
+from domain.models.bets_aggregate import BetsAggregate
 from domain.models.block import Block as BlockModel
 from domain.models.pair import Pair as PairModel
-from infrastructure.db.entities import Block, Pair, Chain
+from infrastructure.db.entities import Block, Pair, Chain, Bet
 from infrastructure.db.repositories.AbstractRepository import AbstractSQLAlchemyRepository
 from infrastructure.db.repositories.exceptions import NotFoundException
 
@@ -111,7 +112,7 @@ class BlockRepository(
         return self.entity_to_model(block) if block else None
 
     async def get_n_last_active_blocks_by_pair_id(self, n: int, pair_id: str) -> Optional[list[Block]]:
-        async with self.session_maker() as session:
+        async with self.read_session_maker() as session:
             chain_res = await session.execute(
                 select(Chain)
                 .where(Chain.pair_id == pair_id)
@@ -122,8 +123,9 @@ class BlockRepository(
                 select(self.entity)
                 .where(and_(
                     self.entity.chain_id == chain.id,
-                    self.entity.result_vector != [0.0, 0.0],
                     self.entity.status == BlockStatus.COMPLETED,
+                    # the predicate of ix_blocks_chain_id_created_at_with_result; NULL results are excluded
+                    or_(self.entity.result_price != 0, self.entity.result_tx_count != 0),
                     # self.entity.bets.any()
                 ))
                 .order_by(desc(self.entity.created_at, ))
@@ -185,6 +187,26 @@ class BlockRepository(
 
         return self.entity_to_model(block) if block else None
 
+    async def get_bets_aggregate(self, block_id: UUID) -> BetsAggregate:
+        async with self.session_maker() as session:
+            row = (await session.execute(
+                select(
+                    func.coalesce(func.sum(Bet.predicted_price * Bet.amount), 0.0),
+                    func.coalesce(func.sum(Bet.predicted_tx_count * Bet.amount), 0.0),
+                    func.coalesce(func.sum(Bet.amount), 0.0),
+                    func.count(),
+                )
+                .where(Bet.block_id == block_id)
+            )).one()
+
+        weighted_price, weighted_tx_count, total_stake, count = row
+        return BetsAggregate(
+            weighted_price=weighted_price,
+            weighted_tx_count=weighted_tx_count,
+            total_stake=total_stake,
+            count=count,
+        )
+
     def create_dto_to_entity(self, dto: CreateBlockDTO) -> Block:
         return Block(
             id=dto.id,
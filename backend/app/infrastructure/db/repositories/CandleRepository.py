@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from abstractions.repositories.candle import CandleRepositoryInterface
+from domain.dto.candle import BlockCandleDTO
+from domain.enums.candle import CandleResolution
+from domain.models.candle import Candle as CandleModel, candle_start
+from infrastructure.db.entities import Candle
+from infrastructure.db.instrumentation import instrument_repository_class
+from infrastructure.db.replica import SessionFactory
+
+
+@dataclass
+class CandleRepository(CandleRepositoryInterface):
+    """
+    Candles of every resolution in one table keyed by (pair_id, resolution, start):
+    a range of a chart is one scan of the primary key.
+    """
+    session_maker: async_sessionmaker
+    # ranges of a chart, no older than the last event seen; the primary when not given
+    read_session_maker: Optional[SessionFactory] = None
+
+    def __post_init__(self):
+        if self.read_session_maker is None:
+            self.read_session_maker = self.session_maker
+
+    async def record(self, candle: BlockCandleDTO) -> None:
+        now = datetime.now()
+        async with self.session_maker() as session:
+            async with session.begin():
+                open_price = await session.scalar(
+                    select(Candle.close)
+                    .where(and_(
+                        Candle.pair_id == candle.pair_id,
+                        Candle.resolution == CandleResolution.BLOCK,
+                        Candle.start < candle.created_at,
+                    ))
+                    .order_by(Candle.start.desc())
+                    .limit(1)
+                )
+                statement = insert(Candle).values([
+                    {
+                        'pair_id': candle.pair_id,
+                        'resolution': resolution,
+                        'start': candle_start(resolution, candle.created_at),
+                        'block_number': candle.block_number,
+                        'block_count': 1,
+                        'open': open_price,
+                        'close': candle.close,
+                        'high': candle.high,
+                        'low': candle.low,
+                        'volume': candle.volume,
+                        'updated_at': now,
+                    } for resolution in CandleResolution
+                ])
+                current, excluded = Candle.__table__.c, statement.excluded
+                # open and block_number stay those of the first block; greatest/least skip NULL
+                await session.execute(statement.on_conflict_do_update(
+                    index_elements=['pair_id', 'resolution', 'start'],
+                    set_={
+                        'block_count': current.block_count + 1,
+                        'close': excluded.close,
+                        'high': func.greatest(current.high, excluded.high),
+                        'low': func.least(current.low, excluded.low),
+                        'volume': current.volume + excluded.volume,
+                        'updated_at': excluded.updated_at,
+                    },
+                ))
+
+    async def get_range(
+            self,
+            pair_id: UUID,
+            resolution: CandleResolution,
+            n: int,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None,
+    ) -> list[CandleModel]:
+        conditions = [Candle.pair_id == pair_id, Candle.resolution == resolution]
+        if start is not None:
+            conditions.append(Candle.start >= start)
+        if end is not None:
+            conditions.append(Candle.start < end)
+        async with self.read_session_maker() as session:
+            entities = (await session.execute(
+                select(Candle)
+                .where(and_(*conditions))
+                .order_by(Candle.start.desc())
+                .limit(n)
+            )).scalars().all()
+        return [self._to_model(entity) for entity in entities]
+
+    @staticmethod
+    def _to_model(entity: Candle) -> CandleModel:
+        return CandleModel(
+            pair_id=entity.pair_id,
+            resolution=entity.resolution,
+            start=entity.start,
+            block_number=entity.block_number,
+            block_count=entity.block_count,
+            open=entity.open,
+            close=entity.close,
+            high=entity.high,
+            low=entity.low,
+            volume=entity.volume,
+        )
+
+
+instrument_repository_class(CandleRepository)
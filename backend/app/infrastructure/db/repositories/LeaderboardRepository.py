@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from abstractions.repositories.leaderboard import LeaderboardRepositoryInterface
+from domain.enums.leaderboard import LeaderboardMetric, LeaderboardPeriod
+from domain.models.leaderboard import LeaderboardEntry, period_start
+from domain.models.user_reward import UserReward
+from infrastructure.db.entities import LeaderboardRow
+from infrastructure.db.instrumentation import instrument_repository_class
+from infrastructure.db.replica import SessionFactory
+
+
+def _score(metric: LeaderboardMetric):
+    return LeaderboardRow.total_reward if metric == LeaderboardMetric.REWARD else LeaderboardRow.accuracy
+
+
+def _board(pair_id: UUID, period: LeaderboardPeriod, at: datetime):
+    return and_(
+        LeaderboardRow.pair_id == pair_id,
+        LeaderboardRow.period == period,
+        LeaderboardRow.period_start == period_start(period, at),
+    )
+
+
+@dataclass
+class LeaderboardRepository(LeaderboardRepositoryInterface):
+    """
+    One row per pair, period and user. A board is read in score order straight from its index,
+    a rank is one count over the users of the board with a better score.
+    """
+    session_maker: async_sessionmaker
+    # boards, no older than the last event seen; the primary when not given
+    read_session_maker: Optional[SessionFactory] = None
+
+    def __post_init__(self):
+        if self.read_session_maker is None:
+            self.read_session_maker = self.session_maker
+
+    async def record(self, pair_id: UUID, at: datetime, rewards: list[UserReward]) -> None:
+        if not rewards:
+            return
+        # ON CONFLICT DO UPDATE cannot touch a row twice: rewards of a user are merged first
+        totals: dict[UUID, list] = {}
+        for reward in rewards:
+            total = totals.setdefault(reward.user_id, [0.0, 0.0, 0])
+            total[0] += reward.reward
+            total[1] += reward.accuracy
+            total[2] += 1
+
+        now = datetime.now()
+        statement = insert(LeaderboardRow).values([
+            {
+                'pair_id': pair_id,
+                'period': period,
+                'period_start': period_start(period, at),
+                'user_id': user_id,
+                'total_reward': total_reward,
+                'accuracy_sum': accuracy_sum,
+                'resolved_count': resolved_count,
+                'accuracy': accuracy_sum / resolved_count,
+                'updated_at': now,
+            }
+            # sorted, so that concurrent settlements lock rows in one order
+            for period in LeaderboardPeriod
+            for user_id, (total_reward, accuracy_sum, resolved_count) in sorted(totals.items())
+        ])
+        current, excluded = LeaderboardRow.__table__.c, statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=['pair_id', 'period', 'period_start', 'user_id'],
+            set_={
+                'total_reward': current.total_reward + excluded.total_reward,
+                'accuracy_sum': current.accuracy_sum + excluded.accuracy_sum,
+                'resolved_count': current.resolved_count + excluded.resolved_count,
+                'accuracy': (
+                    (current.accuracy_sum + excluded.accuracy_sum)
+                    / (current.resolved_count + excluded.resolved_count)
+                ),
+                'updated_at': excluded.updated_at,
+            },
+        )
+        async with self.session_maker() as session:
+            async with session.begin():
+                await session.execute(statement)
+
+    async def get_top(
+            self,
+            pair_id: UUID,
+            period: LeaderboardPeriod,
+            metric: LeaderboardMetric,
+            at: datetime,
+            limit: int,
+    ) -> list[LeaderboardEntry]:
+        score = _score(metric)
+        rank = func.rank().over(order_by=score.desc())
+        async with self.read_session_maker() as session:
+            rows = (await session.execute(
+                select(LeaderboardRow, rank)
+                .where(_board(pair_id, period, at))
+                .order_by(score.desc(), LeaderboardRow.user_id)
+                .limit(limit)
+            )).all()
+        return [self._to_entry(entity, rank) for entity, rank in rows]
+
+    async def get_entry(
+            self,
+            pair_id: UUID,
+            period: LeaderboardPeriod,
+            metric: LeaderboardMetric,
+            at: datetime,
+            user_id: UUID,
+    ) -> Optional[LeaderboardEntry]:
+        score = _score(metric)
+        async with self.read_session_maker() as session:
+            entity = await session.get(LeaderboardRow, (pair_id, period, period_start(period, at), user_id))
+            if entity is None:
+                return None
+            better = await session.scalar(
+                select(func.count()).select_from(LeaderboardRow)
+                .where(_board(pair_id, period, at), score > getattr(entity, score.key))
+            )
+        return self._to_entry(entity, better + 1)
+
+    @staticmethod
+    def _to_entry(entity: LeaderboardRow, rank: int) -> LeaderboardEntry:
+        return LeaderboardEntry(
+            user_id=entity.user_id,
+            rank=rank,
+            total_reward=entity.total_reward,
+            accuracy=entity.accuracy,
+            resolved_count=entity.resolved_count,
+        )
+
+
+instrument_repository_class(LeaderboardRepository)
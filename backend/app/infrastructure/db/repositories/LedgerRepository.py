@@ -0,0 +1,129 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from abstractions.repositories.ledger import LedgerRepositoryInterface
+from domain.dto.ledger import CreateLedgerEntryDTO
+from infrastructure.db.entities import LedgerEntry, balance_of
+from infrastructure.db.instrumentation import instrument_repository_class
+
+logger = logging.getLogger(__name__)
+
+_COPY_COLUMNS = ('id', 'user_id', 'type', 'amount', 'reference_id')
+
+# the last sequence number handed out, whether its entry is committed or not
+_LAST_SEQ = text("""
+    SELECT coalesce(pg_sequence_last_value(pg_get_serial_sequence('ledger_entries', 'seq')::regclass), 0)
+""")
+
+# a separate statement, so the time is read after the sequence
+_FENCE_TIME = text('SELECT clock_timestamp()')
+
+# whether every other transaction of the database open at the time has ended
+_ENDED_BEFORE = text("""
+    SELECT NOT EXISTS (
+        SELECT 1
+        FROM pg_stat_activity
+        WHERE datname = current_database() AND pid <> pg_backend_pid() AND xact_start <= :at
+    )
+""")
+
+# entries of a user after its snapshot, up to the cutoff, are added to the snapshot
+_TAKE_SNAPSHOTS = text("""
+    WITH tail AS (
+        SELECT entries.user_id, max(entries.seq) AS seq, sum(entries.amount) AS amount
+        FROM ledger_entries entries
+        LEFT JOIN balance_snapshots snapshots ON snapshots.user_id = entries.user_id
+        WHERE entries.seq > coalesce(snapshots.seq, 0) AND entries.seq <= :cutoff
+        GROUP BY entries.user_id
+    )
+    INSERT INTO balance_snapshots (user_id, seq, balance, created_at)
+    SELECT user_id, seq, amount, now() FROM tail
+    ON CONFLICT (user_id) DO UPDATE SET
+        seq = excluded.seq,
+        balance = balance_snapshots.balance + excluded.balance,
+        created_at = excluded.created_at
+""")
+
+
+def ledger_rows(entries: list[CreateLedgerEntryDTO]) -> list[dict]:
+    """
+    Parameters of an executemany insert into ledger_entries.
+    """
+    return [
+        {
+            'id': entry.id,
+            'user_id': entry.user_id,
+            'type': entry.type,
+            'amount': entry.amount,
+            'reference_id': entry.reference_id,
+        } for entry in entries
+    ]
+
+
+@dataclass
+class LedgerRepository(LedgerRepositoryInterface):
+    """
+    Entries are inserted, never updated, so writers of the same user do not wait for each other.
+    Batches of `copy_threshold` entries and more go through COPY.
+
+    A snapshot covers the entries up to a sequence number. Identity values are handed out before
+    commit, so an entry may become visible after a larger one. Each run therefore records a fence:
+    the last sequence number handed out and the time after it was read. The next run folds entries
+    up to the fence only once no transaction open at that time is left, so none of them can still
+    commit. Open transactions are seen in pg_stat_activity: the role must see the sessions
+    appending to the ledger (the same role or pg_read_all_stats).
+    """
+    session_maker: async_sessionmaker
+    copy_threshold: int = 100
+
+    _fence: Optional[tuple[int, datetime]] = field(default=None, init=False)
+
+    async def append(self, entries: list[CreateLedgerEntryDTO]) -> None:
+        if not entries:
+            return
+        async with self.session_maker() as session:
+            async with session.begin():
+                if len(entries) < self.copy_threshold:
+                    await session.execute(insert(LedgerEntry), ledger_rows(entries))
+                    return
+
+                connection = await (await session.connection()).get_raw_connection()
+                await connection.driver_connection.copy_records_to_table(
+                    LedgerEntry.__tablename__,
+                    records=[
+                        # enums are stored by name, as SQLAlchemy does
+                        (entry.id, entry.user_id, entry.type.name, entry.amount, entry.reference_id)
+                        for entry in entries
+                    ],
+                    columns=_COPY_COLUMNS,
+                )
+
+    async def get_balance(self, user_id: UUID) -> float:
+        async with self.session_maker() as session:
+            return (await session.execute(select(balance_of(user_id)))).scalar_one()
+
+    async def take_snapshots(self) -> int:
+        updated = 0
+        async with self.session_maker() as session:
+            async with session.begin():
+                if self._fence is not None:
+                    cutoff, fenced_at = self._fence
+                    if (await session.execute(_ENDED_BEFORE, {'at': fenced_at})).scalar_one():
+                        updated = (await session.execute(_TAKE_SNAPSHOTS, {'cutoff': cutoff})).rowcount
+                        self._fence = None
+                    else:
+                        logger.info('Balance snapshots postponed: a transaction open since %s is not over', fenced_at)
+                if self._fence is None:
+                    last_seq = (await session.execute(_LAST_SEQ)).scalar_one()
+                    self._fence = (last_seq, (await session.execute(_FENCE_TIME)).scalar_one())
+        logger.debug('Balance snapshots updated: %s', updated)
+        return updated
+
+
+instrument_repository_class(LedgerRepository)
@@ -3,7 +3,7 @@ from dataclasses import field, dataclass
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import exists, select
 
 from abstractions.repositories.user import UserRepositoryInterface
 from domain.dto.user import CreateUserDTO, UpdateUserDTO
@@ -13,6 +13,7 @@ from domain.models.transaction import Transaction as TransactionModel
 from domain.models.user import User as UserModel
 from infrastructure.db.entities import User, Bet
 from infrastructure.db.repositories.AbstractRepository import AbstractSQLAlchemyRepository
+from infrastructure.db.repositories.exceptions import NotFoundException
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +35,6 @@ class UserRepository(
         return User(
             id=dto.id,
             wallet_address=dto.wallet_address,
-            balance=0,
             username=dto.username,
             first_name=dto.first_name,
             last_name=dto.last_name,
@@ -98,11 +98,18 @@ class UserRepository(
             user = res.unique().scalars().one_or_none()
         return self.entity_to_model(user) if user else None
 
-    async def fund_user(self, user_id: UUID, amount: float) -> None:  # amount could be < 0
+    async def exists(self, user_id: UUID) -> bool:
         async with self.session_maker() as session:
-            async with session.begin():
-                user = await session.get(self.entity, user_id)
-                logger.info(f"user is {user.id}")
-                logger.info(user.balance)
-                user.balance += amount
-                logger.info(f'добавили денег {user.balance}')
+            return (await session.execute(select(exists().where(self.entity.id == user_id)))).scalar()
+
+    async def get_history(self, user_id: UUID) -> UserModel:
+        async with self.read_session_maker() as session:
+            res = await session.execute(
+                select(User)
+                .where(self.entity.id == user_id)
+                .options(*self.options)
+            )
+            user = res.unique().scalars().one_or_none()
+        if user is None:
+            raise NotFoundException
+        return self.entity_to_model(user)
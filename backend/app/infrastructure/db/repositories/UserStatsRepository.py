@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Hashable, Optional
+from uuid import UUID
+
+from sqlalchemy import case, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from abstractions.repositories.user_stats import UserStatsRepositoryInterface
+from domain.dto.user_stats import UserStatsDeltaDTO
+from domain.models.user_stats import UserStats as UserStatsModel
+from infrastructure.db.entities import UserPairStats, UserStats
+from infrastructure.db.instrumentation import instrument_repository_class
+
+
+def _rounds(deltas: list[UserStatsDeltaDTO], key: Callable[[UserStatsDeltaDTO], Hashable]) -> list[list]:
+    """
+    Splits the deltas so that a key occurs once per round: ON CONFLICT DO UPDATE cannot touch a row twice.
+    Rounds keep the order of the deltas of a key and are sorted by key, so concurrent upserts lock rows in one order.
+    """
+    rounds: list[dict] = []
+    for delta in deltas:
+        for keyed in rounds:
+            if key(delta) not in keyed:
+                keyed[key(delta)] = delta
+                break
+        else:
+            rounds.append({key(delta): delta})
+    return [[keyed[k] for k in sorted(keyed)] for keyed in rounds]
+
+
+@dataclass
+class UserStatsRepository(UserStatsRepositoryInterface):
+    """
+    One row per user and one per user and pair, updated by upserts that add the deltas in place.
+    """
+    session_maker: async_sessionmaker
+    accuracy_alpha: float = 0.1
+
+    async def apply(self, deltas: list[UserStatsDeltaDTO]) -> None:
+        if not deltas:
+            return
+        now = datetime.now()
+        async with self.session_maker() as session:
+            async with session.begin():
+                for entity, key in (
+                        (UserStats, lambda delta: (delta.user_id,)),
+                        (UserPairStats, lambda delta: (delta.user_id, delta.pair_id)),
+                ):
+                    for deltas_round in _rounds(deltas, key):
+                        await session.execute(self._upsert(entity, deltas_round, now))
+
+    def _upsert(self, entity, deltas: list[UserStatsDeltaDTO], now: datetime):
+        keys = [column.name for column in entity.__table__.primary_key]
+        statement = insert(entity).values([
+            {
+                **{name: getattr(delta, name) for name in keys},
+                'pending_stake': delta.pending_stake,
+                'total_staked': delta.staked,
+                'total_reward': delta.reward,
+                'bet_count': delta.bets,
+                'resolved_count': delta.resolved,
+                'accuracy': delta.accuracy,
+                'created_at': now,
+                'updated_at': now,
+            } for delta in deltas
+        ])
+        current, excluded = entity.__table__.c, statement.excluded
+        return statement.on_conflict_do_update(
+            index_elements=keys,
+            set_={
+                'pending_stake': current.pending_stake + excluded.pending_stake,
+                'total_staked': current.total_staked + excluded.total_staked,
+                'total_reward': current.total_reward + excluded.total_reward,
+                'bet_count': current.bet_count + excluded.bet_count,
+                'resolved_count': current.resolved_count + excluded.resolved_count,
+                'accuracy': case(
+                    (excluded.accuracy.is_(None), current.accuracy),
+                    (current.accuracy.is_(None), excluded.accuracy),
+                    else_=self.accuracy_alpha * excluded.accuracy + (1 - self.accuracy_alpha) * current.accuracy,
+                ),
+                'updated_at': excluded.updated_at,
+            },
+        )
+
+    async def get(self, user_id: UUID) -> Optional[UserStatsModel]:
+        async with self.session_maker() as session:
+            entity = await session.get(UserStats, user_id)
+        return self._to_model(entity) if entity else None
+
+    async def get_by_pairs(self, user_id: UUID) -> list[UserStatsModel]:
+        async with self.session_maker() as session:
+            entities = (await session.execute(
+                select(UserPairStats).where(UserPairStats.user_id == user_id)
+            )).scalars().all()
+        return [self._to_model(entity) for entity in entities]
+
+    @staticmethod
+    def _to_model(entity: UserStats | UserPairStats) -> UserStatsModel:
+        return UserStatsModel(
+            user_id=entity.user_id,
+            pair_id=getattr(entity, 'pair_id', None),
+            pending_stake=entity.pending_stake,
+            total_staked=entity.total_staked,
+            total_reward=entity.total_reward,
+            bet_count=entity.bet_count,
+            resolved_count=entity.resolved_count,
+            accuracy=entity.accuracy,
+        )
+
+
+instrument_repository_class(UserStatsRepository)
@@ -1,2 +1,8 @@
 class NotFoundException(Exception):
     ...
+
+
+class ConflictException(Exception):
+    """
+    The rows a write was planned on changed before it was committed; nothing was written.
+    """
@@ -0,0 +1,157 @@
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, TextIO
+
+from settings import LoggingSettings
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# attributes every LogRecord has; anything else was passed via `extra=` and goes to the JSON output
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload['exc_info'] = record.exc_text
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+def _match_logger(name: str, limits: dict[str, float]) -> Optional[float]:
+    # the most specific configured prefix wins, like logger hierarchy levels
+    while True:
+        if name in limits:
+            return limits[name]
+        if '.' not in name:
+            return None
+        name = name.rsplit('.', 1)[0]
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Passes only a share of records below WARNING for the configured loggers.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = _match_logger(record.name, self.rates)
+        return rate is None or random.random() < rate
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Token bucket per (logger, message template) below WARNING: at most `rate` records per second.
+    The first record after a suppressed series carries the number of dropped records in `suppressed`.
+    """
+
+    def __init__(self, rates: dict[str, float], burst: int = 10):
+        super().__init__()
+        self.rates = rates
+        self.burst = burst
+        # (logger, msg) -> [tokens, last refill, suppressed]
+        self._buckets: dict[tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = _match_logger(record.name, self.rates)
+        if rate is None:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(key, [float(self.burst), now, 0])
+            bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1
+            if bucket[2]:
+                record.suppressed = bucket[2]
+                bucket[2] = 0
+        return True
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread without formatting them on the event loop.
+    Only the message itself is rendered here, because its args may be mutated after the call returns.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # tracebacks keep frames alive, render them while they are still accurate
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def setup_logging(
+        config: LoggingSettings,
+        level: int,
+        stream: Optional[TextIO] = None,
+) -> Optional[QueueListener]:
+    """
+    Configures the root logger. With `config.queue` the stream handler runs in a background thread
+    and the returned listener must be stopped on shutdown to flush pending records.
+    """
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if config.json_format else logging.Formatter(TEXT_FORMAT))
+
+    filters = []
+    if config.sample_rates:
+        filters.append(SamplingFilter(config.sample_rates))
+    if config.rate_limits:
+        filters.append(RateLimitFilter(config.rate_limits, burst=config.rate_limit_burst))
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.setLevel(level)
+
+    listener = None
+    if config.queue:
+        listener = QueueListener(queue.SimpleQueue(), handler, respect_handler_level=True)
+        front = LazyQueueHandler(listener.queue)
+        listener.start()
+    else:
+        front = handler
+
+    for log_filter in filters:
+        front.addFilter(log_filter)
+    root.addHandler(front)
+
+    for name, logger_level in config.levels.items():
+        logging.getLogger(name).setLevel(logger_level)
+
+    return listener
@@ -0,0 +1,5 @@
+from .store import InMemoryStore
+
+__all__ = [
+    "InMemoryStore",
+]
@@ -0,0 +1,24 @@
+from collections import UserList
+from typing import Callable
+
+
+class LazyList[T](UserList[T]):
+    """
+    List that is built on first use, like a lazy-loaded relationship.
+    Unbounded relations (all bets of a user) would otherwise be mapped on every `get`,
+    although most callers only read scalar fields.
+    """
+
+    def __init__(self, load: Callable[[], list[T]]):  # noqa: UserList.__init__ would assign data
+        self._load = load
+        self._data = None
+
+    @property
+    def data(self) -> list[T]:
+        if self._data is None:
+            self._data = self._load()
+        return self._data
+
+    @data.setter
+    def data(self, value: list[T]) -> None:
+        self._data = value
@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+
+from abstractions.services.leader_election import LeaderElectionInterface
+
+
+@dataclass
+class InMemoryLeaderElection(LeaderElectionInterface):
+    """
+    Leadership of the only process that sees the in-memory store: always granted until released.
+    """
+    _is_leader: bool = field(default=False, init=False)
+
+    async def try_acquire(self) -> bool:
+        self._is_leader = True
+        return True
+
+    async def is_leader(self) -> bool:
+        return self._is_leader
+
+    async def release(self) -> None:
+        self._is_leader = False
@@ -0,0 +1,91 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+from uuid import UUID
+
+from abstractions.repositories import CRUDRepositoryInterface
+from infrastructure.db.repositories.exceptions import NotFoundException
+from infrastructure.memory.store import InMemoryStore, as_key
+
+
+@dataclass
+class AbstractInMemoryRepository[Row, Model, CreateDTO, UpdateDTO](
+    CRUDRepositoryInterface[Model, CreateDTO, UpdateDTO],
+):
+    """
+    CRUD over one table of an InMemoryStore with the semantics of AbstractSQLAlchemyRepository.
+    Subclasses maintain their secondary indexes in `index`/`unindex`.
+    """
+    store: InMemoryStore
+
+    # updates touching these fields move the row between secondary indexes
+    indexed_fields = frozenset()
+
+    @property
+    @abstractmethod
+    def table(self) -> dict[UUID, Row]:
+        ...
+
+    @abstractmethod
+    def create_dto_to_row(self, dto: CreateDTO) -> Row:
+        ...
+
+    @abstractmethod
+    def row_to_model(self, row: Row) -> Model:
+        ...
+
+    def index(self, row: Row) -> None:
+        pass
+
+    def unindex(self, row: Row) -> None:
+        pass
+
+    async def create(self, obj: CreateDTO) -> None:
+        self.add_row(self.create_dto_to_row(obj))
+
+    def add_row(self, row: Row) -> None:
+        """
+        Inserts a ready row, e.g. a seeded one with its own timestamps.
+        """
+        self.table[row.id] = row
+        self.index(row)
+
+    async def get(self, obj_id: UUID) -> Model:
+        return self.row_to_model(self.get_row(obj_id))
+
+    async def update(self, obj_id: UUID, obj: UpdateDTO) -> None:
+        row = self.get_row(obj_id)
+        values = obj.model_dump(exclude_unset=True)
+        reindex = not self.indexed_fields.isdisjoint(values)
+        if reindex:
+            self.unindex(row)
+        for key, value in values.items():
+            setattr(row, key, self._to_stored(value))
+        row.updated_at = self.store.now()
+        if reindex:
+            self.index(row)
+
+    async def delete(self, obj_id: UUID) -> None:
+        row = self.table.pop(as_key(obj_id), None)
+        if row is not None:
+            self.unindex(row)
+
+    async def get_all(self, limit: int = 100, offset: int = 0, joined: bool = True) -> list[Model]:
+        return [
+            self.row_to_model(row)
+            for row in islice(self.table.values(), offset, offset + limit)
+        ]
+
+    def get_row(self, obj_id: UUID) -> Row:
+        row = self.table.get(as_key(obj_id))
+        if row is None:
+            raise NotFoundException
+        return row
+
+    @staticmethod
+    def _to_stored(value: Any) -> Any:
+        # vectors come back from their two typed columns as tuples, whatever sequence was written
+        if isinstance(value, list):
+            return tuple(value)
+        return value
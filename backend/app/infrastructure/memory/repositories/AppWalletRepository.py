@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from abstractions.repositories.app_wallet import AppWalletRepositoryInterface
+from domain.dto.app_wallet import CreateAppWalletDTO, UpdateAppWalletDTO
+from domain.models.app_wallet import AppWallet as AppWalletModel
+from infrastructure.memory.repositories.AbstractRepository import AbstractInMemoryRepository
+from infrastructure.memory.store import AppWalletRow
+
+
+@dataclass
+class InMemoryAppWalletRepository(
+    AbstractInMemoryRepository[AppWalletRow, AppWalletModel, CreateAppWalletDTO, UpdateAppWalletDTO],
+    AppWalletRepositoryInterface,
+):
+    @property
+    def table(self) -> dict[UUID, AppWalletRow]:
+        return self.store.app_wallets
+
+    def create_dto_to_row(self, dto: CreateAppWalletDTO) -> AppWalletRow:
+        now = self.store.now()
+        return AppWalletRow(
+            id=dto.id,
+            address=dto.address,
+            wallet_type=dto.wallet_type,
+            wallet_version=dto.wallet_version,
+            balance=dto.balance,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def row_to_model(self, row: AppWalletRow) -> AppWalletModel:
+        return AppWalletModel(
+            id=row.id,
+            address=row.address,
+            wallet_version=row.wallet_version,
+            wallet_type=row.wallet_type,
+            balance=row.balance,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
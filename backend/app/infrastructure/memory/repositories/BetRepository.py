@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+from math import isclose
+from typing import Optional
+from uuid import UUID
+
+from abstractions.repositories.bet import BetRepositoryInterface
+from domain.dto.bet import CreateBetDTO, UpdateBetDTO
+from domain.dto.ledger import CreateLedgerEntryDTO
+from domain.enums import BetStatus
+from domain.models.bet import Bet as BetModel
+from domain.models.pair import Pair as PairModel
+from domain.models.user import User as UserModel
+from infrastructure.db.repositories.exceptions import ConflictException, NotFoundException
+from infrastructure.memory.repositories.AbstractRepository import AbstractInMemoryRepository
+from infrastructure.memory.repositories.LedgerRepository import InMemoryLedgerRepository
+from infrastructure.memory.store import BetRow, as_key
+
+
+@dataclass
+class InMemoryBetRepository(
+    AbstractInMemoryRepository[BetRow, BetModel, CreateBetDTO, UpdateBetDTO],
+    BetRepositoryInterface,
+):
+    @property
+    def table(self) -> dict[UUID, BetRow]:
+        return self.store.bets
+
+    def index(self, row: BetRow) -> None:
+        self.store.add_sorted(self.store.bets_by_block, row.block_id, row)
+        self.store.add_sorted(self.store.bets_by_user, row.user_id, row)
+
+    def unindex(self, row: BetRow) -> None:
+        self.store.remove_from(self.store.bets_by_block, row.block_id, row)
+        self.store.remove_from(self.store.bets_by_user, row.user_id, row)
+
+    async def get_last_user_bet(self, user_id: UUID, pair_id: UUID) -> Optional[BetModel]:
+        pair_id = as_key(pair_id)
+        bet = next(
+            (row for row in reversed(self.store.bets_by_user.get(as_key(user_id), ())) if row.pair_id == pair_id),
+            None,
+        )
+        return self.row_to_model(bet) if bet else None
+
+    async def get_last_user_completed_bet(self, user_id: UUID) -> Optional[BetModel]:
+        bet = next(
+            (row for row in reversed(self.store.bets_by_user.get(as_key(user_id), ()))
+             if row.status == BetStatus.RESOLVED),
+            None,
+        )
+        return self.row_to_model(bet) if bet else None
+
+    async def get_pending_user_bets(self, user_id: UUID) -> list[BetModel]:
+        return [
+            self.row_to_model(row) for row in reversed(self.store.bets_by_user.get(as_key(user_id), ()))
+            if row.status == BetStatus.PENDING
+        ]
+
+    async def place_batch(
+            self,
+            user_id: UUID,
+            balance: float,
+            bets: list[CreateBetDTO],
+            canceled_bet_ids: list[UUID],
+            entries: list[CreateLedgerEntryDTO],
+    ) -> None:
+        # everything is checked before the first change, so a failed batch leaves the store as it was
+        user = self.store.users.get(as_key(user_id))
+        if user is None:
+            raise NotFoundException(f'User {user_id} not found')
+        if not isclose(user.balance, balance, rel_tol=1e-9, abs_tol=1e-9):
+            raise ConflictException(f'Balance of {user_id} is {user.balance}, the batch expected {balance}')
+        canceled = [self.get_row(bet_id) for bet_id in canceled_bet_ids]
+        if any(row.status != BetStatus.PENDING for row in canceled):
+            raise ConflictException(f'Bets {canceled_bet_ids} are no longer all pending')
+
+        now = self.store.now()
+        for row in canceled:
+            row.status = BetStatus.CANCELED
+            row.updated_at = now
+        await InMemoryLedgerRepository(store=self.store).append(entries)
+        for dto in bets:
+            self.add_row(self.create_dto_to_row(dto))
+
+    def create_dto_to_row(self, dto: CreateBetDTO) -> BetRow:
+        now = self.store.now()
+        return BetRow(
+            id=dto.id,
+            user_id=dto.user_id,
+            pair_id=dto.pair_id,
+            block_id=dto.block_id,
+            amount=dto.amount,
+            vector=self._to_stored(dto.vector),
+            status=dto.status,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def row_to_model(self, row: BetRow) -> BetModel:
+        user = self.store.users[row.user_id]
+        pair = self.store.pairs[row.pair_id]
+        return BetModel(
+            id=row.id,
+            user=UserModel(
+                id=user.id,
+                telegram_id=user.telegram_id,
+                username=user.username,
+                wallet_address=user.wallet_address,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+            ),
+            pair=PairModel(
+                id=pair.id,
+                name=pair.name,
+                contract_address=pair.contract_address,
+                last_ratio=pair.last_ratio,
+                created_at=pair.created_at,
+                updated_at=pair.updated_at
+            ),
+            amount=row.amount,
+            block_number=self.store.blocks[row.block_id].block_number,
+            vector=row.vector,
+            status=row.status,
+            reward=row.reward,
+            accuracy=row.accuracy,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
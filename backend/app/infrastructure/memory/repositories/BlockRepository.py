@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Iterator, Optional
+from uuid import UUID
+
+from abstractions.repositories.block import BlockRepositoryInterface
+from domain.dto.block import CreateBlockDTO, UpdateBlockDTO
+from domain.enums.block_status import BlockStatus
+from domain.metaholder.responses.block_state import BlockStateResponse
+from domain.models.bet import Bet as BetModel
+from domain.models.bets_aggregate import BetsAggregate
+from domain.models.block import Block as BlockModel
+from domain.models.pair import Pair as PairModel
+from infrastructure.db.repositories.exceptions import NotFoundException
+from infrastructure.memory.repositories.AbstractRepository import AbstractInMemoryRepository
+from infrastructure.memory.store import BlockRow, ChainRow, as_key
+
+
+@dataclass
+class InMemoryBlockRepository(
+    AbstractInMemoryRepository[BlockRow, BlockModel, CreateBlockDTO, UpdateBlockDTO],
+    BlockRepositoryInterface,
+):
+    block_generation_interval: timedelta = timedelta(minutes=10)
+
+    @property
+    def table(self) -> dict[UUID, BlockRow]:
+        return self.store.blocks
+
+    def index(self, row: BlockRow) -> None:
+        self.store.add_sorted(self.store.blocks_by_chain, row.chain_id, row)
+
+    def unindex(self, row: BlockRow) -> None:
+        self.store.remove_from(self.store.blocks_by_chain, row.chain_id, row)
+
+    def _latest(self, chain_id: UUID) -> Iterator[BlockRow]:
+        return reversed(self.store.blocks_by_chain.get(as_key(chain_id), ()))
+
+    def _latest_completed(self, chain_id: UUID) -> Iterator[BlockRow]:
+        return (row for row in self._latest(chain_id) if row.status == BlockStatus.COMPLETED)
+
+    def _chain_by_pair_id(self, pair_id: UUID) -> ChainRow:
+        # the SQL version selects the pair and the chain with .one()
+        pair_id = as_key(pair_id)
+        if pair_id not in self.store.pairs:
+            raise NotFoundException
+        chain = self.store.chains_by_pair.get(pair_id)
+        if chain is None:
+            raise NotFoundException
+        return chain
+
+    def _first_model(self, rows: Iterator[BlockRow]) -> Optional[BlockModel]:
+        row = next(rows, None)
+        return self.row_to_model(row) if row else None
+
+    async def get_last_block_by_contract_address(self, contract_address: str) -> Optional[BlockModel]:
+        pair = self.store.pairs_by_contract_address.get(contract_address)
+        if pair is None:
+            raise NotFoundException
+        chain = self._chain_by_pair_id(pair.id)
+        return self._first_model(self._latest_completed(chain.id))
+
+    async def get_previous_block(self, block: BlockModel) -> BlockModel:
+        previous = next(
+            (row for row in self._latest_completed(block.chain_id) if row.block_number < block.block_number),
+            None,
+        )
+        if previous is None:
+            raise NotFoundException
+        return self.row_to_model(previous)
+
+    async def get_last_completed_block(self, chain_id: UUID) -> Optional[BlockModel]:
+        return self._first_model(self._latest_completed(chain_id))
+
+    async def get_last_block(self, chain_id: UUID) -> Optional[BlockModel]:
+        return self._first_model(self._latest(chain_id))
+
+    async def get_n_last_active_blocks_by_pair_id(self, n: int, pair_id: UUID) -> Optional[list[BlockModel]]:
+        chain = self.store.chains_by_pair.get(as_key(pair_id))
+        if chain is None:
+            raise NotFoundException
+
+        blocks = []
+        for row in self._latest_completed(chain.id):
+            if len(blocks) >= n:
+                break
+            # `result_price <> 0 OR result_tx_count <> 0` is NULL, hence false, for blocks without a result
+            if row.result_vector is not None and (row.result_vector[0] != 0 or row.result_vector[1] != 0):
+                blocks.append(self.row_to_model(row))
+        return blocks or None
+
+    async def get_last_block_by_pair_id(self, pair_id: UUID) -> Optional[BlockModel]:
+        chain = self._chain_by_pair_id(pair_id)
+        return self._first_model(self._latest(chain.id))
+
+    async def get_last_completed_block_by_pair_id(self, pair_id: UUID) -> Optional[BlockModel]:
+        chain = self._chain_by_pair_id(pair_id)
+        return self._first_model(self._latest_completed(chain.id))
+
+    async def get_current_block_state(self, pair_id: UUID) -> BlockStateResponse:
+        last_block = await self.get_last_block_by_pair_id(pair_id)
+        if not last_block:
+            raise NotFoundException
+        now = self.store.now()
+        elapsed_time = (now - last_block.created_at).total_seconds()
+        remaining_time = max(0.0, self.block_generation_interval.total_seconds() - elapsed_time)
+
+        return BlockStateResponse(
+            block_id=last_block.id,
+            server_time=str(now),
+            current_block=last_block.block_number,
+            remaining_time_in_block=int(remaining_time),
+        )
+
+    async def get_bets_aggregate(self, block_id: UUID) -> BetsAggregate:
+        weighted_price = weighted_tx_count = total_stake = 0.0
+        bets = self.store.bets_by_block.get(as_key(block_id), ())
+        for bet in bets:
+            weighted_price += bet.vector[0] * bet.amount
+            weighted_tx_count += bet.vector[1] * bet.amount
+            total_stake += bet.amount
+        return BetsAggregate(
+            weighted_price=weighted_price,
+            weighted_tx_count=weighted_tx_count,
+            total_stake=total_stake,
+            count=len(bets),
+        )
+
+    def create_dto_to_row(self, dto: CreateBlockDTO) -> BlockRow:
+        now = self.store.now()
+        return BlockRow(
+            id=dto.id,
+            block_number=dto.block_number,
+            status=dto.status,
+            chain_id=dto.chain_id,
+            result_vector=self._to_stored(dto.result_vector),
+            created_at=dto.created_at or now,
+            completed_at=dto.completed_at,
+            updated_at=now,
+        )
+
+    def row_to_model(self, row: BlockRow) -> BlockModel:
+        pairs = self.store.pairs
+        return BlockModel(
+            id=row.id,
+            block_number=row.block_number,
+            chain_id=row.chain_id,
+            status=row.status,
+            result_vector=row.result_vector,
+            created_at=row.created_at,
+            bets=[BetModel(
+                id=bet.id,
+                status=bet.status,
+                vector=bet.vector,
+                amount=bet.amount,
+                block_number=row.block_number,
+                user_id=bet.user_id,
+                reward=bet.reward,
+                accuracy=bet.accuracy,
+                created_at=bet.created_at,
+                updated_at=bet.updated_at,
+                pair=PairModel(
+                    id=bet.pair_id,
+                    name=pairs[bet.pair_id].name,
+                    created_at=pairs[bet.pair_id].created_at,
+                    updated_at=pairs[bet.pair_id].updated_at,
+                )
+            ) for bet in self.store.bets_by_block.get(row.id, ())],
+            completed_at=row.completed_at,
+            updated_at=row.updated_at,
+        )
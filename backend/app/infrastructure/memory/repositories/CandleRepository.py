@@ -0,0 +1,83 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from abstractions.repositories.candle import CandleRepositoryInterface
+from domain.dto.candle import BlockCandleDTO
+from domain.enums.candle import CandleResolution
+from domain.models.candle import Candle as CandleModel, candle_start
+from infrastructure.memory.store import CandleRow, InMemoryStore, as_key
+
+
+def _by_start(row: CandleRow) -> datetime:
+    return row.start
+
+
+def _extreme(function, current: Optional[float], new: Optional[float]) -> Optional[float]:
+    # greatest() and least() of Postgres skip NULL
+    if current is None or new is None:
+        return new if current is None else current
+    return function(current, new)
+
+
+@dataclass
+class InMemoryCandleRepository(CandleRepositoryInterface):
+    store: InMemoryStore
+
+    async def record(self, candle: BlockCandleDTO) -> None:
+        pair_id = as_key(candle.pair_id)
+        blocks = self.store.candles.get((pair_id, CandleResolution.BLOCK), [])
+        previous = bisect_left(blocks, candle.created_at, key=_by_start)
+        open_price = blocks[previous - 1].close if previous else None
+
+        for resolution in CandleResolution:
+            series = self.store.candles.setdefault((pair_id, resolution), [])
+            start = candle_start(resolution, candle.created_at)
+            i = bisect_left(series, start, key=_by_start)
+            if i < len(series) and series[i].start == start:
+                row = series[i]
+                row.block_count += 1
+                row.close = candle.close
+                row.high = _extreme(max, row.high, candle.high)
+                row.low = _extreme(min, row.low, candle.low)
+                row.volume += candle.volume
+            else:
+                series.insert(i, CandleRow(
+                    start=start,
+                    block_number=candle.block_number,
+                    block_count=1,
+                    open=open_price,
+                    close=candle.close,
+                    high=candle.high,
+                    low=candle.low,
+                    volume=candle.volume,
+                ))
+
+    async def get_range(
+            self,
+            pair_id: UUID,
+            resolution: CandleResolution,
+            n: int,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None,
+    ) -> list[CandleModel]:
+        pair_id = as_key(pair_id)
+        series = self.store.candles.get((pair_id, resolution), [])
+        first = bisect_left(series, start, key=_by_start) if start is not None else 0
+        last = bisect_left(series, end, key=_by_start) if end is not None else len(series)
+        return [
+            CandleModel(
+                pair_id=pair_id,
+                resolution=resolution,
+                start=row.start,
+                block_number=row.block_number,
+                block_count=row.block_count,
+                open=row.open,
+                close=row.close,
+                high=row.high,
+                low=row.low,
+                volume=row.volume,
+            ) for row in reversed(series[max(first, last - n):last])
+        ]
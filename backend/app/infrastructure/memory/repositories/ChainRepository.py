@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from abstractions.repositories.chain import ChainRepositoryInterface
+from domain.dto.chain import CreateChainDTO, UpdateChainDTO
+from domain.models.chain import Chain as ChainModel
+from domain.models.pair import Pair as PairModel
+from infrastructure.memory.repositories.AbstractRepository import AbstractInMemoryRepository
+from infrastructure.memory.store import ChainRow, as_key
+
+
+@dataclass
+class InMemoryChainRepository(
+    AbstractInMemoryRepository[ChainRow, ChainModel, CreateChainDTO, UpdateChainDTO],
+    ChainRepositoryInterface,
+):
+    @property
+    def table(self) -> dict[UUID, ChainRow]:
+        return self.store.chains
+
+    def index(self, row: ChainRow) -> None:
+        self.store.chains_by_pair[row.pair_id] = row
+
+    def unindex(self, row: ChainRow) -> None:
+        self.store.chains_by_pair.pop(row.pair_id, None)
+
+    async def get_by_pair_id(self, pair_id: UUID) -> Optional[ChainModel]:
+        row = self.store.chains_by_pair.get(as_key(pair_id))
+        return self.row_to_model(row) if row else None
+
+    def create_dto_to_row(self, dto: CreateChainDTO) -> ChainRow:
+        now = self.store.now()
+        return ChainRow(
+            id=dto.id,
+            pair_id=dto.pair_id,
+            current_block=dto.current_block,
+            status=dto.status,
+            last_update=dto.last_update,
+            created_at=dto.created_at or now,
+            updated_at=now,
+        )
+
+    def row_to_model(self, row: ChainRow) -> ChainModel:
+        pair = self.store.pairs[row.pair_id]
+        return ChainModel(
+            id=row.id,
+            current_block=row.current_block,
+            pair_id=row.pair_id,
+            pair=PairModel(
+                id=pair.id,
+                name=pair.name,
+                contract_address=pair.contract_address,
+                created_at=pair.created_at,
+                updated_at=pair.updated_at,
+            ),
+            created_at=row.created_at,
+            status=row.status,
+            updated_at=row.updated_at,
+        )
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from abstractions.repositories.deposit import DepositRepositoryInterface
+from domain.dto.deposit import DepositEntryCreateDTO, DepositEntryUpdateDTO
+from domain.models.deposit import DepositEntry as DepositEntryModel
+from infrastructure.memory.repositories.AbstractRepository import AbstractInMemoryRepository
+from infrastructure.memory.store import DepositRow
+
+
+@dataclass
+class InMemoryDepositRepository(
+    AbstractInMemoryRepository[DepositRow, DepositEntryModel, DepositEntryCreateDTO, DepositEntryUpdateDTO],
+    DepositRepositoryInterface,
+):
+    @property
+    def table(self) -> dict[UUID, DepositRow]:
+        return self.store.deposits
+
+    async def update(self, obj_id: UUID, obj: DepositEntryUpdateDTO) -> None:
+        # amount and tx_id of the DTO are not columns: the SQL repository sets them on the entity and they are lost
+        row = self.get_row(obj_id)
+        if 'status' in obj.model_fields_set:
+            row.status = obj.status
+        row.updated_at = self.store.now()
+
+    def create_dto_to_row(self, dto: DepositEntryCreateDTO) -> DepositRow:
+        now = self.store.now()
+        return DepositRow(
+            id=dto.id,
+            app_wallet_id=dto.app_wallet_id,
+            user_id=dto.user_id,
+            status=dto.status,
+            transaction_id=dto.tx_id,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def row_to_model(self, row: DepositRow) -> DepositEntryModel:
+        transaction = self.store.transactions.get(row.transaction_id) if row.transaction_id else None
+        return DepositEntryModel(
+            id=row.id,
+            status=row.status,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            user_id=row.user_id,
+            amount=transaction.amount if transaction else None,
+            app_wallet_id=row.app_wallet_id,
+            tx_id=transaction.id if transaction else None,
+        )
@@ -0,0 +1,84 @@
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from abstractions.repositories.leaderboard import LeaderboardRepositoryInterface
+from domain.enums.leaderboard import LeaderboardMetric, LeaderboardPeriod
+from domain.models.leaderboard import LeaderboardEntry, period_start
+from domain.models.user_reward import UserReward
+from infrastructure.memory.store import InMemoryStore, LeaderboardBoard, LeaderboardRow, as_key
+
+
+def _sorted_keys(board: LeaderboardBoard, metric: LeaderboardMetric) -> list[tuple[float, UUID]]:
+    return board.by_reward if metric == LeaderboardMetric.REWARD else board.by_accuracy
+
+
+def _score(row: LeaderboardRow, metric: LeaderboardMetric) -> float:
+    return row.total_reward if metric == LeaderboardMetric.REWARD else row.accuracy
+
+
+@dataclass
+class InMemoryLeaderboardRepository(LeaderboardRepositoryInterface):
+    store: InMemoryStore
+
+    async def record(self, pair_id: UUID, at: datetime, rewards: list[UserReward]) -> None:
+        pair_id = as_key(pair_id)
+        for period in LeaderboardPeriod:
+            board = self.store.leaderboards.setdefault((pair_id, period, period_start(period, at)), LeaderboardBoard())
+            for reward in rewards:
+                user_id = as_key(reward.user_id)
+                row = board.rows.get(user_id)
+                if row is None:
+                    row = board.rows[user_id] = LeaderboardRow(user_id=user_id)
+                else:
+                    for metric in LeaderboardMetric:
+                        keys = _sorted_keys(board, metric)
+                        del keys[bisect_left(keys, (-_score(row, metric), user_id))]
+                row.total_reward += reward.reward
+                row.accuracy_sum += reward.accuracy
+                row.resolved_count += 1
+                for metric in LeaderboardMetric:
+                    insort(_sorted_keys(board, metric), (-_score(row, metric), user_id))
+
+    async def get_top(
+            self,
+            pair_id: UUID,
+            period: LeaderboardPeriod,
+            metric: LeaderboardMetric,
+            at: datetime,
+            limit: int,
+    ) -> list[LeaderboardEntry]:
+        board = self._board(pair_id, period, at)
+        if board is None:
+            return []
+        keys = _sorted_keys(board, metric)
+        return [self._to_entry(board, metric, board.rows[user_id]) for _, user_id in keys[:limit]]
+
+    async def get_entry(
+            self,
+            pair_id: UUID,
+            period: LeaderboardPeriod,
+            metric: LeaderboardMetric,
+            at: datetime,
+            user_id: UUID,
+    ) -> Optional[LeaderboardEntry]:
+        board = self._board(pair_id, period, at)
+        row = board.rows.get(as_key(user_id)) if board else None
+        return self._to_entry(board, metric, row) if row else None
+
+    def _board(self, pair_id: UUID, period: LeaderboardPeriod, at: datetime) -> Optional[LeaderboardBoard]:
+        return self.store.leaderboards.get((as_key(pair_id), period, period_start(period, at)))
+
+    @staticmethod
+    def _to_entry(board: LeaderboardBoard, metric: LeaderboardMetric, row: LeaderboardRow) -> LeaderboardEntry:
+        # (-score,) sorts before every (-score, user_id): the index is the number of strictly better scores
+        better = bisect_left(_sorted_keys(board, metric), (-_score(row, metric),))
+        return LeaderboardEntry(
+            user_id=row.user_id,
+            rank=better + 1,
+            total_reward=row.total_reward,
+            accuracy=row.accuracy,
+            resolved_count=row.resolved_count,
+        )
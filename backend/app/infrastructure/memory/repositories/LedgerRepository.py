@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+
+from abstractions.repositories.ledger import LedgerRepositoryInterface
+from domain.dto.ledger import CreateLedgerEntryDTO
+from infrastructure.memory.store import InMemoryStore, LedgerRow, as_key
+
+
+@dataclass
+class InMemoryLedgerRepository(LedgerRepositoryInterface):
+    """
+    Entries are kept for auditing; the balance is summed up on the user row as they are appended,
+    which is what a snapshot taken after every entry would give.
+    """
+    store: InMemoryStore
+
+    async def append(self, entries: list[CreateLedgerEntryDTO]) -> None:
+        # all or nothing, like the single transaction of the SQL repository
+        for entry in entries:
+            if as_key(entry.user_id) not in self.store.users:
+                raise IntegrityError('INSERT INTO ledger_entries', {'user_id': entry.user_id}, Exception('no such user'))
+
+        now = self.store.now()
+        for entry in entries:
+            user = self.store.users[as_key(entry.user_id)]
+            self.store.ledger[entry.id] = LedgerRow(
+                id=entry.id,
+                seq=len(self.store.ledger) + 1,
+                user_id=user.id,
+                type=entry.type,
+                amount=entry.amount,
+                reference_id=entry.reference_id,
+                created_at=now,
+            )
+            user.balance += entry.amount
+
+    async def get_balance(self, user_id: UUID) -> float:
+        user = self.store.users.get(as_key(user_id))
+        return user.balance if user else 0.0
+
+    async def take_snapshots(self) -> int:
+        return 0
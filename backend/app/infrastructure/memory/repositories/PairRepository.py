@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from abstractions.repositories.pair import PairRepositoryInterface
+from domain.dto.pair import CreatePairDTO, UpdatePairDTO
+from domain.models.pair import Pair as PairModel
+from infrastructure.memory.repositories.AbstractRepository import AbstractInMemoryRepository
+from infrastructure.memory.store import PairRow
+
+
+@dataclass
+class InMemoryPairRepository(
+    AbstractInMemoryRepository[PairRow, PairModel, CreatePairDTO, UpdatePairDTO],
+    PairRepositoryInterface,
+):
+    indexed_fields = frozenset({'contract_address'})
+
+    @property
+    def table(self) -> dict[UUID, PairRow]:
+        return self.store.pairs
+
+    def index(self, row: PairRow) -> None:
+        if row.contract_address is not None:
+            self.store.pairs_by_contract_address[row.contract_address] = row
+
+    def unindex(self, row: PairRow) -> None:
+        self.store.pairs_by_contract_address.pop(row.contract_address, None)
+
+    def create_dto_to_row(self, dto: CreatePairDTO) -> PairRow:
+        now = self.store.now()
+        return PairRow(
+            id=dto.id,
+            name=dto.name,
+            contract_address=dto.contract_address,
+            last_ratio=dto.last_ratio,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def row_to_model(self, row: PairRow) -> PairModel:
+        return PairModel(
+            id=row.id,
+            name=row.name,
+            last_ratio=row.last_ratio,
+            contract_address=row.contract_address,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
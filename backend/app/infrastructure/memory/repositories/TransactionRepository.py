@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+
+from abstractions.repositories.transaction import TransactionRepositoryInterface
+from domain.dto.transaction import CreateTransactionDTO, UpdateTransactionDTO
+from domain.models.transaction import Transaction as TransactionModel
+from infrastructure.memory.repositories.AbstractRepository import AbstractInMemoryRepository
+from infrastructure.memory.store import TransactionRow
+
+
+@dataclass
+class InMemoryTransactionRepository(
+    AbstractInMemoryRepository[TransactionRow, TransactionModel, CreateTransactionDTO, UpdateTransactionDTO],
+    TransactionRepositoryInterface,
+):
+    indexed_fields = frozenset({'tx_id'})
+
+    @property
+    def table(self) -> dict[UUID, TransactionRow]:
+        return self.store.transactions
+
+    async def create(self, obj: CreateTransactionDTO) -> None:
+        # transactions.tx_id is unique: a deposit seen twice must fail the same way as in Postgres
+        if obj.tx_id is not None and obj.tx_id in self.store.transactions_by_tx_id:
+            raise IntegrityError('INSERT INTO transactions', {'tx_id': obj.tx_id}, Exception('duplicate tx_id'))
+        await super().create(obj)
+
+    def index(self, row: TransactionRow) -> None:
+        if row.tx_id is not None:
+            self.store.transactions_by_tx_id[row.tx_id] = row
+        if row.user_id is not None:
+            self.store.add_sorted(self.store.transactions_by_user, row.user_id, row)
+
+    def unindex(self, row: TransactionRow) -> None:
+        self.store.transactions_by_tx_id.pop(row.tx_id, None)
+        if row.user_id is not None:
+            self.store.remove_from(self.store.transactions_by_user, row.user_id, row)
+
+    def create_dto_to_row(self, dto: CreateTransactionDTO) -> TransactionRow:
+        now = self.store.now()
+        return TransactionRow(
+            id=dto.id,
+            user_id=dto.user_id,
+            type=dto.type,
+            amount=dto.amount,
+            tx_id=dto.tx_id,
+            recipient=dto.recipient,
+            sender=dto.sender,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def row_to_model(self, row: TransactionRow) -> TransactionModel:
+        return TransactionModel(
+            id=row.id,
+            type=row.type,
+            amount=row.amount,
+            tx_id=row.tx_id,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            sender=row.sender,
+            recipient=row.recipient,
+        )
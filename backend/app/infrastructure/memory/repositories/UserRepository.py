@@ -0,0 +1,111 @@
+import logging
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from abstractions.repositories.user import UserRepositoryInterface
+from domain.dto.user import CreateUserDTO, UpdateUserDTO
+from domain.models.bet import Bet as BetModel
+from domain.models.pair import Pair as PairModel
+from domain.models.transaction import Transaction as TransactionModel
+from domain.models.user import User as UserModel
+from infrastructure.memory.lazy import LazyList
+from infrastructure.memory.repositories.AbstractRepository import AbstractInMemoryRepository
+from infrastructure.memory.store import UserRow, as_key
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InMemoryUserRepository(
+    AbstractInMemoryRepository[UserRow, UserModel, CreateUserDTO, UpdateUserDTO],
+    UserRepositoryInterface,
+):
+    indexed_fields = frozenset({'wallet_address'})
+
+    @property
+    def table(self) -> dict[UUID, UserRow]:
+        return self.store.users
+
+    def index(self, row: UserRow) -> None:
+        self.store.users_by_wallet[row.wallet_address] = row
+
+    def unindex(self, row: UserRow) -> None:
+        self.store.users_by_wallet.pop(row.wallet_address, None)
+
+    async def get_by_wallet(self, wallet_address: str) -> Optional[UserModel]:
+        row = self.store.users_by_wallet.get(wallet_address)
+        return self.row_to_model(row) if row else None
+
+    async def exists(self, user_id: UUID) -> bool:
+        return as_key(user_id) in self.store.users
+
+    async def get_history(self, user_id: UUID) -> UserModel:
+        return await self.get(user_id)
+
+    def create_dto_to_row(self, dto: CreateUserDTO) -> UserRow:
+        now = self.store.now()
+        return UserRow(
+            id=dto.id,
+            wallet_address=dto.wallet_address,
+            balance=0,
+            telegram_id=dto.telegram_id,
+            username=dto.username,
+            first_name=dto.first_name,
+            last_name=dto.last_name,
+            last_activity=dto.last_activity,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def row_to_model(self, row: UserRow) -> UserModel:
+        return UserModel(
+            id=row.id,
+            telegram_id=row.telegram_id,
+            username=row.username,
+            first_name=row.first_name,
+            last_name=row.last_name,
+            last_activity=row.last_activity,
+            wallet_address=row.wallet_address,
+            balance=row.balance,
+            bets=LazyList(lambda: self._bets_of(row.id)),
+            transactions=LazyList(lambda: self._transactions_of(row.id)),
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    def _bets_of(self, user_id: UUID) -> list[BetModel]:
+        pairs, blocks = self.store.pairs, self.store.blocks
+        return [BetModel(
+            id=b.id,
+            pair=PairModel(
+                id=b.pair_id,
+                name=pairs[b.pair_id].name,
+                contract_address=pairs[b.pair_id].contract_address,
+                last_ratio=pairs[b.pair_id].last_ratio,
+                created_at=pairs[b.pair_id].created_at,
+                updated_at=pairs[b.pair_id].updated_at,
+            ),
+            block_number=blocks[b.block_id].block_number,
+            user=None,
+            amount=b.amount,
+            vector=b.vector,
+            status=b.status,
+            reward=b.reward,
+            accuracy=b.accuracy,
+            created_at=b.created_at,
+            updated_at=b.updated_at,
+        ) for b in self.store.bets_by_user.get(user_id, ())]
+
+    def _transactions_of(self, user_id: UUID) -> list[TransactionModel]:
+        return [TransactionModel(
+            id=t.id,
+            type=t.type,
+            amount=t.amount,
+            sender=t.sender,
+            recipient=t.recipient,
+            tx_id=t.tx_id,
+            user=None,
+            created_at=t.created_at,
+            updated_at=t.updated_at
+        ) for t in self.store.transactions_by_user.get(user_id, ())]
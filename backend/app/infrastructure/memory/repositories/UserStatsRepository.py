@@ -0,0 +1,45 @@
+from dataclasses import asdict, dataclass
+from typing import Optional
+from uuid import UUID
+
+from abstractions.repositories.user_stats import UserStatsRepositoryInterface
+from domain.dto.user_stats import UserStatsDeltaDTO
+from domain.models.user_stats import UserStats as UserStatsModel
+from infrastructure.memory.store import InMemoryStore, UserStatsRow, as_key
+
+
+@dataclass
+class InMemoryUserStatsRepository(UserStatsRepositoryInterface):
+    store: InMemoryStore
+    accuracy_alpha: float = 0.1
+
+    async def apply(self, deltas: list[UserStatsDeltaDTO]) -> None:
+        for delta in deltas:
+            user_id, pair_id = as_key(delta.user_id), as_key(delta.pair_id)
+            totals = self.store.user_stats.get(user_id)
+            if totals is None:
+                totals = self.store.user_stats[user_id] = UserStatsRow(user_id=user_id)
+            pairs = self.store.user_pair_stats.setdefault(user_id, {})
+            by_pair = pairs.get(pair_id)
+            if by_pair is None:
+                by_pair = pairs[pair_id] = UserStatsRow(user_id=user_id, pair_id=pair_id)
+            self._add(totals, delta)
+            self._add(by_pair, delta)
+
+    def _add(self, row: UserStatsRow, delta: UserStatsDeltaDTO) -> None:
+        row.pending_stake += delta.pending_stake
+        row.total_staked += delta.staked
+        row.total_reward += delta.reward
+        row.bet_count += delta.bets
+        row.resolved_count += delta.resolved
+        if delta.accuracy is not None:
+            row.accuracy = delta.accuracy if row.accuracy is None else (
+                self.accuracy_alpha * delta.accuracy + (1 - self.accuracy_alpha) * row.accuracy
+            )
+
+    async def get(self, user_id: UUID) -> Optional[UserStatsModel]:
+        row = self.store.user_stats.get(as_key(user_id))
+        return UserStatsModel(**asdict(row)) if row else None
+
+    async def get_by_pairs(self, user_id: UUID) -> list[UserStatsModel]:
+        return [UserStatsModel(**asdict(row)) for row in self.store.user_pair_stats.get(as_key(user_id), {}).values()]
@@ -0,0 +1,29 @@
+from .AbstractRepository import AbstractInMemoryRepository
+from .AppWalletRepository import InMemoryAppWalletRepository
+from .BetRepository import InMemoryBetRepository
+from .BlockRepository import InMemoryBlockRepository
+from .CandleRepository import InMemoryCandleRepository
+from .ChainRepository import InMemoryChainRepository
+from .DepositRepository import InMemoryDepositRepository
+from .LeaderboardRepository import InMemoryLeaderboardRepository
+from .LedgerRepository import InMemoryLedgerRepository
+from .PairRepository import InMemoryPairRepository
+from .TransactionRepository import InMemoryTransactionRepository
+from .UserRepository import InMemoryUserRepository
+from .UserStatsRepository import InMemoryUserStatsRepository
+
+__all__ = [
+    "AbstractInMemoryRepository",
+    "InMemoryAppWalletRepository",
+    "InMemoryBetRepository",
+    "InMemoryBlockRepository",
+    "InMemoryCandleRepository",
+    "InMemoryChainRepository",
+    "InMemoryDepositRepository",
+    "InMemoryLeaderboardRepository",
+    "InMemoryLedgerRepository",
+    "InMemoryPairRepository",
+    "InMemoryTransactionRepository",
+    "InMemoryUserRepository",
+    "InMemoryUserStatsRepository",
+]
@@ -0,0 +1,245 @@
+from bisect import insort
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from abstractions.services.clock import ClockInterface
+from domain.enums import BetStatus, TransactionType, WalletType
+from domain.enums.block_status import BlockStatus
+from domain.enums.candle import CandleResolution
+from domain.enums.chain_status import ChainStatus
+from domain.enums.deposit import DepositEntryStatus
+from domain.enums.leaderboard import LeaderboardPeriod
+from domain.enums.ledger import LedgerEntryType
+from domain.models.app_wallet import AppWalletVersion
+from domain.models.bet import BetVector
+from services.clock import SystemClock
+
+
+@dataclass(slots=True, kw_only=True)
+class UserRow:
+    id: UUID
+    wallet_address: str
+    # running sum of the ledger entries of the user, in place of the snapshots of the SQL ledger
+    balance: float = 0.0
+    telegram_id: Optional[int] = None
+    username: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    last_activity: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True, kw_only=True)
+class PairRow:
+    id: UUID
+    name: str
+    contract_address: Optional[str] = None
+    last_ratio: Optional[float] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True, kw_only=True)
+class ChainRow:
+    id: UUID
+    pair_id: UUID
+    current_block: int
+    status: ChainStatus
+    last_update: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True, kw_only=True)
+class BlockRow:
+    id: UUID
+    chain_id: UUID
+    block_number: int
+    status: BlockStatus
+    result_vector: Optional[BetVector] = None
+    completed_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True, kw_only=True)
+class BetRow:
+    id: UUID
+    user_id: UUID
+    pair_id: UUID
+    block_id: UUID
+    amount: float
+    vector: BetVector
+    status: BetStatus
+    reward: Optional[float] = None
+    accuracy: Optional[float] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True, kw_only=True)
+class TransactionRow:
+    id: UUID
+    type: TransactionType
+    amount: float
+    sender: str
+    recipient: str
+    tx_id: Optional[str] = None
+    user_id: Optional[UUID] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True, kw_only=True)
+class DepositRow:
+    id: UUID
+    app_wallet_id: UUID
+    user_id: UUID
+    status: DepositEntryStatus
+    transaction_id: Optional[UUID] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True, kw_only=True)
+class AppWalletRow:
+    id: UUID
+    address: str
+    wallet_version: AppWalletVersion
+    wallet_type: WalletType
+    balance: float
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True, kw_only=True)
+class LedgerRow:
+    id: UUID
+    seq: int
+    user_id: UUID
+    type: LedgerEntryType
+    amount: float
+    reference_id: Optional[UUID] = None
+    created_at: datetime
+
+
+@dataclass(slots=True, kw_only=True)
+class UserStatsRow:
+    user_id: UUID
+    pair_id: Optional[UUID] = None
+    pending_stake: float = 0.0
+    total_staked: float = 0.0
+    total_reward: float = 0.0
+    bet_count: int = 0
+    resolved_count: int = 0
+    accuracy: Optional[float] = None
+
+
+@dataclass(slots=True, kw_only=True)
+class CandleRow:
+    start: datetime
+    block_number: int
+    block_count: int
+    open: Optional[float]
+    close: float
+    high: Optional[float]
+    low: Optional[float]
+    volume: float
+
+
+@dataclass(slots=True, kw_only=True)
+class LeaderboardRow:
+    user_id: UUID
+    total_reward: float = 0.0
+    accuracy_sum: float = 0.0
+    resolved_count: int = 0
+
+    @property
+    def accuracy(self) -> float:
+        return self.accuracy_sum / self.resolved_count if self.resolved_count else 0.0
+
+
+@dataclass(slots=True)
+class LeaderboardBoard:
+    """
+    Rows of one pair and period plus a list of (-score, user_id) per metric kept sorted,
+    the in-memory counterpart of the score indexes of leaderboard_entries.
+    """
+    rows: dict[UUID, LeaderboardRow] = field(default_factory=dict)
+    by_reward: list[tuple[float, UUID]] = field(default_factory=list)
+    by_accuracy: list[tuple[float, UUID]] = field(default_factory=list)
+
+
+def as_key(value) -> UUID:
+    """
+    Postgres casts string ids of route parameters to uuid, dict lookups do not.
+    """
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _by_created_at(row) -> datetime:
+    return row.created_at
+
+
+@dataclass
+class InMemoryStore:
+    """
+    Tables and secondary indexes shared by the in-memory repositories.
+
+    Rows are plain mutable records; repositories map them to fresh domain models on every read,
+    so callers can mutate returned models exactly as they can with the SQLAlchemy repositories.
+    Per-parent lists are kept sorted by created_at (ties in insertion order), which is what
+    the `ORDER BY created_at DESC LIMIT 1` queries of the SQL repositories rely on.
+    """
+    clock: ClockInterface = field(default_factory=SystemClock)
+
+    users: dict[UUID, UserRow] = field(default_factory=dict)
+    pairs: dict[UUID, PairRow] = field(default_factory=dict)
+    chains: dict[UUID, ChainRow] = field(default_factory=dict)
+    blocks: dict[UUID, BlockRow] = field(default_factory=dict)
+    bets: dict[UUID, BetRow] = field(default_factory=dict)
+    transactions: dict[UUID, TransactionRow] = field(default_factory=dict)
+    deposits: dict[UUID, DepositRow] = field(default_factory=dict)
+    app_wallets: dict[UUID, AppWalletRow] = field(default_factory=dict)
+    ledger: dict[UUID, LedgerRow] = field(default_factory=dict)
+    user_stats: dict[UUID, UserStatsRow] = field(default_factory=dict)
+    user_pair_stats: dict[UUID, dict[UUID, UserStatsRow]] = field(default_factory=dict)  # user_id -> pair_id -> row
+    leaderboards: dict[tuple[UUID, LeaderboardPeriod, datetime], LeaderboardBoard] = field(default_factory=dict)
+    candles: dict[tuple[UUID, CandleResolution], list[CandleRow]] = field(default_factory=dict)  # sorted by start
+
+    users_by_wallet: dict[str, UserRow] = field(default_factory=dict)
+    pairs_by_contract_address: dict[str, PairRow] = field(default_factory=dict)
+    chains_by_pair: dict[UUID, ChainRow] = field(default_factory=dict)
+    blocks_by_chain: dict[UUID, list[BlockRow]] = field(default_factory=dict)
+    bets_by_block: dict[UUID, list[BetRow]] = field(default_factory=dict)
+    bets_by_user: dict[UUID, list[BetRow]] = field(default_factory=dict)
+    transactions_by_user: dict[UUID, list[TransactionRow]] = field(default_factory=dict)
+    transactions_by_tx_id: dict[str, TransactionRow] = field(default_factory=dict)
+
+    def now(self) -> datetime:
+        return self.clock.now()
+
+    @staticmethod
+    def add_sorted(index: dict, key, row) -> None:
+        rows = index.setdefault(key, [])
+        if not rows or rows[-1].created_at <= row.created_at:
+            rows.append(row)
+        else:
+            insort(rows, row, key=_by_created_at)
+
+    @staticmethod
+    def remove_from(index: dict, key, row) -> None:
+        rows = index.get(key)
+        if rows is None:
+            return
+        rows.remove(row)
+        if not rows:
+            del index[key]
+
+    def clear(self) -> None:
+        for value in vars(self).values():
+            if isinstance(value, dict):
+                value.clear()
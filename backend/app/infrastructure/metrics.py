@@ -0,0 +1,120 @@
+import os
+
+from prometheus_client import Counter, Gauge, Histogram, multiprocess
+
+# API processes write their samples into this directory and metrics_exporter.py serves them together,
+# so any number of uvicorn workers can run. Gauges declare how their per-process values combine
+MULTIPROCESS_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+
+JOB_DURATION = Histogram(
+    'scheduler_job_duration_seconds',
+    'Scheduler job execution time',
+    ['job'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+
+JOB_LAG = Histogram(
+    'scheduler_job_lag_seconds',
+    'Delay between the scheduled run time and the actual start of a job',
+    ['job'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60),
+)
+
+JOB_RUNS = Counter(
+    'scheduler_job_runs_total',
+    'Scheduler job runs by outcome',
+    ['job', 'outcome'],
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by route template',
+    ['method', 'route', 'status'],
+)
+
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight',
+    'HTTP requests currently being processed',
+    ['method', 'route'],
+    multiprocess_mode='livesum',
+)
+
+DB_QUERY_DURATION = Histogram(
+    'db_query_duration_seconds',
+    'Database statement execution time by repository method',
+    ['operation'],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent waiting for a connection from the pool',
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+
+BLOCK_SETTLEMENT_DURATION = Histogram(
+    'block_settlement_duration_seconds',
+    'Total time to settle a completed block',
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+
+SETTLEMENT_STAGE_DURATION = Histogram(
+    'block_settlement_stage_duration_seconds',
+    'Block settlement time by stage',
+    ['stage'],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+
+TON_CALL_DURATION = Histogram(
+    'ton_client_call_duration_seconds',
+    'TON client call latency',
+    ['method', 'outcome'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+COALESCED_READS = Counter(
+    'coalesced_reads_total',
+    'Shared API reads by outcome: loaded from the database, joined an in-flight load or served from cache',
+    ['read', 'outcome'],
+)
+
+DB_POOL_CONNECTIONS = Gauge(
+    'db_pool_connections',
+    'Connections of the database pool: checked out, waited for and the most that can be open',
+    ['pool', 'state'],
+    multiprocess_mode='livesum',
+)
+
+DB_POOL_UTILIZATION = Gauge(
+    'db_pool_utilization',
+    'Checked out and waited for connections per connection available to API requests',
+    ['pool'],
+    multiprocess_mode='livemax',
+)
+
+EVENT_LOOP_LAG = Gauge(
+    'event_loop_lag_seconds',
+    'How late the event loop ran a timer, decaying peak',
+    multiprocess_mode='livemax',
+)
+
+ADMISSION_SHEDDING = Gauge(
+    'admission_shedding',
+    'Whether requests of a priority are currently rejected',
+    ['priority'],
+    multiprocess_mode='livemax',
+)
+
+ADMISSION_REJECTED = Counter(
+    'admission_rejected_total',
+    'Requests rejected with 503 before running, by priority and the overloaded resource',
+    ['priority', 'reason'],
+)
+
+
+def mark_process_dead() -> None:
+    """
+    Drops the live gauges of this process from the multiprocess directory, if it writes to one.
+    """
+    if os.environ.get(MULTIPROCESS_DIR_ENV):
+        multiprocess.mark_process_dead(os.getpid())
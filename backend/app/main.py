@@ -9,10 +9,12 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
-# from prometheus_client import Counter, Histogram, generate_latest
+from dependencies.services.admission import get_admission_controller
 from dependencies.services.chain import get_chain_service
-from middlewares import check_for_auth
+from dependencies.services.events import get_event_listener
+from middlewares import admit_requests, check_for_auth, collect_metrics, compress_responses, count_queries
 from routes import (
     bet_router,
     block_router,
@@ -21,13 +23,32 @@ from routes import (
     chain_router,
     auth_router,
     candle_router,
+    events_router,
+    leaderboard_router,
 )
+from infrastructure.log import setup_logging
+from infrastructure.metrics import mark_process_dead
 from settings import settings
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    subprocess.call(["alembic", "upgrade", "head"])
+    if settings.repositories.backend == 'sql':
+        subprocess.call(["alembic", "upgrade", "head"])
+
+    listener = get_event_listener()
+    await listener.start()
+    admission = get_admission_controller()
+    await admission.start()
+
+    # block generation lives in worker.py unless explicitly embedded
+    if not settings.worker.embedded:
+        yield
+        await admission.stop()
+        await listener.stop()
+        mark_process_dead()
+        _stop_log_listener()
+        return
 
     chain = get_chain_service()
     await chain.start_block_generation()
@@ -35,21 +56,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     await chain.stop_block_generation()
+    await admission.stop()
+    await listener.stop()
+    mark_process_dead()
     logger.info('chains stopped, exiting...')
+    _stop_log_listener()
+
+
+def _stop_log_listener() -> None:
+    # flushes records still waiting in the logging queue
+    if log_listener:
+        log_listener.stop()
 
 
 app = FastAPI(lifespan=lifespan)
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.DEBUG if settings.debug else logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
-
-logging.getLogger('urllib3').setLevel(logging.INFO)
-logging.getLogger('httpcore').setLevel(logging.INFO)
-logging.getLogger('apscheduler').setLevel(logging.DEBUG)
-logging.getLogger('LiteClient').setLevel(logging.WARN)
+log_listener = setup_logging(settings.logging, logging.DEBUG if settings.debug else logging.INFO)
 
 de = load_dotenv(dotenv_path='./.env')
 
@@ -57,35 +80,6 @@ de = load_dotenv(dotenv_path='./.env')
 # logger.info(de)
 # logger.info(os.environ.keys())
 
-# Метрика количества запросов
-# REQUEST_COUNT = Counter(
-#     "http_requests_total", "Total HTTP requests",
-#     ["method", "endpoint"]
-# )
-#
-# # Метрика времени обработки запросов
-# REQUEST_LATENCY = Histogram(
-#     "http_request_latency_seconds", "HTTP request latency",
-#     ["method", "endpoint"]
-# )
-
-# class MetricsMiddleware(BaseHTTPMiddleware):
-#     async def dispatch(self, request, call_next):
-#         method = request.method
-#         endpoint = request.url.path
-#         REQUEST_COUNT.labels(method=method, endpoint=endpoint).inc()
-#         start_time = time.time()
-#         response = await call_next(request)
-#         latency = time.time() - start_time
-#         REQUEST_LATENCY.labels(method=method, endpoint=endpoint).observe(latency)
-#         return response
-#
-# app.add_middleware(MetricsMiddleware)
-#
-# @app.get("/metrics")
-# def metrics():
-#     return generate_latest()
-
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
@@ -98,9 +92,27 @@ async def validation_exception_handler(
     return JSONResponse(content=content, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
 
 
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_exception_handler(
+        request: Request,
+        exc: PoolTimeoutError,
+):
+    # admitted, but no connection got free within pool_timeout
+    logger.error(f"{request.method} {request.url.path}: {exc}")
+    return JSONResponse(
+        content={'detail': 'Server is overloaded, retry later'},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={'Retry-After': str(settings.admission.retry_after)},
+    )
+
+
 # FastAPI.middleware is a decorator to add function-based middlewares,
 # but I guess it's quite ugly in terms of architecture - outers shouldn't be coupled with inners (right?)
 app.middleware('http')(check_for_auth)
+app.middleware('http')(count_queries)
+app.middleware('http')(compress_responses)
+# before authentication, which already takes a connection; inside CORS, so browsers can read the 503
+app.middleware('http')(admit_requests)
 
 app.add_middleware(
     CORSMiddleware,
@@ -108,8 +120,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["X-DB-Query-Count", "X-DB-Query-Time", "Retry-After"],
 )
 
+# outermost, so rejected and preflight requests are measured too
+app.middleware('http')(collect_metrics)
+
 app.include_router(bet_router)
 app.include_router(block_router)
 app.include_router(pair_router)
@@ -117,6 +133,8 @@ app.include_router(user_router)
 app.include_router(chain_router)
 app.include_router(auth_router)
 app.include_router(candle_router)
+app.include_router(events_router)
+app.include_router(leaderboard_router)
 
 
 def custom_openapi():
@@ -0,0 +1,38 @@
+"""
+Prometheus endpoint of the API processes.
+
+    PROMETHEUS_MULTIPROC_DIR=/var/lib/api-metrics python metrics_exporter.py
+
+Every uvicorn worker writes its samples into PROMETHEUS_MULTIPROC_DIR; this process merges them and serves
+them on metrics.port, away from the public API port. The directory must be emptied before the API starts.
+"""
+import logging
+import os
+import signal
+
+from prometheus_client import CollectorRegistry, start_http_server
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from infrastructure.metrics import MULTIPROCESS_DIR_ENV
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    if not os.environ.get(MULTIPROCESS_DIR_ENV):
+        raise SystemExit(f'{MULTIPROCESS_DIR_ENV} is not set: the API processes do not share their metrics')
+
+    stop_signals = {signal.SIGINT, signal.SIGTERM}
+    # blocked before the server thread starts, so only sigwait receives them
+    signal.pthread_sigmask(signal.SIG_BLOCK, stop_signals)
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    start_http_server(settings.metrics.port, registry=registry)
+    logger.info('serving API metrics from %s on port %s', os.environ[MULTIPROCESS_DIR_ENV], settings.metrics.port)
+    signal.sigwait(stop_signals)
+
+
+if __name__ == '__main__':
+    main()
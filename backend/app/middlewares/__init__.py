@@ -1 +1,5 @@
+from .admission_middleware import admit_requests
 from .auth_middleware import check_for_auth
+from .compression_middleware import compress_responses
+from .metrics_middleware import collect_metrics
+from .query_stats_middleware import count_queries
@@ -0,0 +1,40 @@
+import math
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from dependencies.services.admission import get_admission_controller
+from domain.enums.request_priority import RequestPriority
+from settings import settings
+
+# documentation and preflight requests are always admitted
+_EXEMPT_PATHS = ('/docs', '/openapi')
+
+
+def _get_priority(path: str) -> RequestPriority:
+    if path.startswith(tuple(settings.admission.low_priority_paths)):
+        return RequestPriority.LOW
+    if path.startswith(tuple(settings.admission.high_priority_paths)):
+        return RequestPriority.HIGH
+    return RequestPriority.NORMAL
+
+
+async def admit_requests(
+        request: Request,
+        call_next,
+):
+    path = request.url.path
+    if not settings.admission.enabled or path.startswith(_EXEMPT_PATHS) or request.method == 'OPTIONS':
+        return await call_next(request)
+
+    retry_after = get_admission_controller().admit(
+        _get_priority(path),
+        replica=path.startswith(tuple(settings.admission.replica_paths)),
+    )
+    if retry_after is not None:
+        return JSONResponse(
+            status_code=503,
+            content={'detail': 'Server is overloaded, retry later'},
+            headers={'Retry-After': str(math.ceil(retry_after.total_seconds()))},
+        )
+    return await call_next(request)
@@ -0,0 +1,65 @@
+import gzip
+
+import brotli
+from fastapi import Request
+from fastapi.responses import Response
+
+from settings import settings
+
+_COMPRESSIBLE_TYPES = ('application/json', 'text/plain', 'text/html')
+
+
+def _accepted_encoding(accept_encoding: str) -> str | None:
+    accepted = {}
+    for part in accept_encoding.lower().split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        accepted[name.strip()] = quality
+    return next((encoding for encoding in ('br', 'gzip') if accepted.get(encoding, 0) > 0), None)
+
+
+def _is_compressible(response: Response) -> bool:
+    # streams (server-sent events) have no length and must reach the client chunk by chunk
+    length = response.headers.get('content-length')
+    return (
+        length is not None
+        and int(length) >= settings.compression.minimum_size
+        and 'content-encoding' not in response.headers
+        and response.headers.get('content-type', '').startswith(_COMPRESSIBLE_TYPES)
+    )
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=settings.compression.brotli_quality)
+    return gzip.compress(body, compresslevel=settings.compression.gzip_level)
+
+
+async def compress_responses(
+        request: Request,
+        call_next,
+):
+    response = await call_next(request)
+    if not _is_compressible(response):
+        return response
+
+    response.headers.add_vary_header('Accept-Encoding')
+    encoding = _accepted_encoding(request.headers.get('accept-encoding', ''))
+    if encoding is None:
+        return response
+
+    body = b''.join([chunk async for chunk in response.body_iterator])
+    compressed = _compress(body, encoding)
+    raw_headers = [(name, value) for name, value in response.raw_headers if name != b'content-length']
+    if len(compressed) < len(body):
+        body = compressed
+        raw_headers.append((b'content-encoding', encoding.encode()))
+
+    result = Response(body, status_code=response.status_code)
+    result.raw_headers = [*raw_headers, (b'content-length', str(len(body)).encode())]
+    return result
@@ -0,0 +1,35 @@
+import time
+
+from fastapi import Request
+from starlette.routing import Match
+
+from infrastructure.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+
+
+def _get_route_template(request: Request) -> str:
+    # route templates instead of raw paths keep label cardinality bounded
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+    return 'unmatched'
+
+
+async def collect_metrics(
+        request: Request,
+        call_next,
+):
+    method = request.method
+    route = _get_route_template(request)
+    in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method, route)
+
+    in_flight.inc()
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        in_flight.dec()
+        HTTP_REQUEST_DURATION.labels(method, route, str(status_code)).observe(time.perf_counter() - started)
@@ -0,0 +1,27 @@
+import logging
+
+from fastapi import Request
+
+from infrastructure.db.instrumentation import report_repeated_queries, track_queries
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def count_queries(
+        request: Request,
+        call_next,
+):
+    with track_queries(collect_shapes=settings.debug) as stats:
+        response = await call_next(request)
+
+    db_time_ms = round(stats.duration * 1000, 2)
+    response.headers['X-DB-Query-Count'] = str(stats.count)
+    response.headers['X-DB-Query-Time'] = str(db_time_ms)
+    logger.debug(
+        f'{request.method} {request.url.path}: {stats.count} queries, {db_time_ms} ms in DB',
+        extra={'db_query_count': stats.count, 'db_time_ms': db_time_ms},
+    )
+    if settings.debug:
+        report_repeated_queries(f'{request.method} {request.url.path}', stats, settings.db.repeated_query_threshold)
+    return response
@@ -0,0 +1,75 @@
+"""leaderboards
+
+Revision ID: a8c5e2f7d3b9
+Revises: f3a9d6b1c8e4
+Create Date: 2026-10-19 16:00:00.000000
+
+leaderboard_entries keeps the reward and accuracy totals of a user on a pair per day, per week
+(from Monday) and for all time (period_start 1970-01-01), updated at every block settlement.
+Boards are filled from the resolved bets, each bet counting at the completion time of its block.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c5e2f7d3b9'
+down_revision: Union[str, None] = 'f3a9d6b1c8e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_PERIOD_STARTS = {
+    'DAY': "date_trunc('day', blocks.completed_at)",
+    'WEEK': "date_trunc('week', blocks.completed_at)",
+    'ALL_TIME': "timestamp '1970-01-01'",
+}
+
+
+def upgrade() -> None:
+    period = sa.Enum('DAY', 'WEEK', 'ALL_TIME', name='leaderboardperiod')
+    op.create_table(
+        'leaderboard_entries',
+        sa.Column('pair_id', sa.UUID(), nullable=False),
+        sa.Column('period', period, nullable=False),
+        sa.Column('period_start', sa.DateTime(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('total_reward', sa.Double(), nullable=False),
+        sa.Column('accuracy_sum', sa.Double(), nullable=False),
+        sa.Column('resolved_count', sa.Integer(), nullable=False),
+        sa.Column('accuracy', sa.Double(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['pair_id'], ['pairs.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('pair_id', 'period', 'period_start', 'user_id'),
+    )
+    op.create_index(
+        'ix_leaderboard_entries_reward',
+        'leaderboard_entries',
+        ['pair_id', 'period', 'period_start', sa.text('total_reward DESC')],
+    )
+    op.create_index(
+        'ix_leaderboard_entries_accuracy',
+        'leaderboard_entries',
+        ['pair_id', 'period', 'period_start', sa.text('accuracy DESC')],
+    )
+
+    for name, start in _PERIOD_STARTS.items():
+        op.execute(f"""
+            INSERT INTO leaderboard_entries (
+                pair_id, period, period_start, user_id,
+                total_reward, accuracy_sum, resolved_count, accuracy, updated_at
+            )
+            SELECT bets.pair_id, '{name}', {start}, bets.user_id,
+                   sum(bets.reward), sum(bets.accuracy), count(*), avg(bets.accuracy), now()
+            FROM bets JOIN blocks ON blocks.id = bets.block_id
+            WHERE bets.status = 'RESOLVED' AND bets.reward IS NOT NULL AND blocks.completed_at IS NOT NULL
+            GROUP BY 1, 3, 4
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leaderboard_entries_accuracy', table_name='leaderboard_entries')
+    op.drop_index('ix_leaderboard_entries_reward', table_name='leaderboard_entries')
+    op.drop_table('leaderboard_entries')
+    sa.Enum(name='leaderboardperiod').drop(op.get_bind())
@@ -0,0 +1,81 @@
+"""candles
+
+Revision ID: b2d6f9a4c1e7
+Revises: a8c5e2f7d3b9
+Create Date: 2026-10-19 17:00:00.000000
+
+candles keeps one candle per completed block with a result and its hour and day rollups, updated
+as blocks complete. They are filled from the blocks still in the database: months archived before
+this migration are not charted.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d6f9a4c1e7'
+down_revision: Union[str, None] = 'a8c5e2f7d3b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BLOCK_CANDLES = """
+    INSERT INTO candles (
+        pair_id, resolution, start, block_number, block_count, open, close, high, low, volume, updated_at
+    )
+    SELECT pair_id, 'BLOCK', created_at, block_number, 1,
+           lag(result_price) OVER (PARTITION BY chain_id ORDER BY created_at),
+           result_price, high, low, volume, now()
+    FROM (
+        SELECT chains.pair_id, blocks.chain_id, blocks.created_at, blocks.block_number, blocks.result_price,
+               max(bets.predicted_price) AS high, min(bets.predicted_price) AS low,
+               coalesce(sum(bets.amount), 0) AS volume
+        FROM blocks
+        JOIN chains ON chains.id = blocks.chain_id
+        LEFT JOIN bets ON bets.block_id = blocks.id
+        WHERE blocks.status = 'COMPLETED' AND (blocks.result_price <> 0 OR blocks.result_tx_count <> 0)
+        GROUP BY chains.pair_id, blocks.chain_id, blocks.id, blocks.created_at, blocks.block_number,
+                 blocks.result_price
+    ) AS block_candles
+"""
+
+_ROLLUP = """
+    INSERT INTO candles (
+        pair_id, resolution, start, block_number, block_count, open, close, high, low, volume, updated_at
+    )
+    SELECT pair_id, '{name}', date_trunc('{unit}', start), min(block_number), count(*),
+           (array_agg(open ORDER BY start))[1], (array_agg(close ORDER BY start DESC))[1],
+           max(high), min(low), sum(volume), now()
+    FROM candles
+    WHERE resolution = 'BLOCK'
+    GROUP BY pair_id, date_trunc('{unit}', start)
+"""
+
+
+def upgrade() -> None:
+    resolution = sa.Enum('BLOCK', 'HOUR', 'DAY', name='candleresolution')
+    op.create_table(
+        'candles',
+        sa.Column('pair_id', sa.UUID(), nullable=False),
+        sa.Column('resolution', resolution, nullable=False),
+        sa.Column('start', sa.DateTime(), nullable=False),
+        sa.Column('block_number', sa.Integer(), nullable=False),
+        sa.Column('block_count', sa.Integer(), nullable=False),
+        sa.Column('open', sa.Double(), nullable=True),
+        sa.Column('close', sa.Double(), nullable=False),
+        sa.Column('high', sa.Double(), nullable=True),
+        sa.Column('low', sa.Double(), nullable=True),
+        sa.Column('volume', sa.Double(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['pair_id'], ['pairs.id']),
+        sa.PrimaryKeyConstraint('pair_id', 'resolution', 'start'),
+    )
+
+    op.execute(_BLOCK_CANDLES)
+    op.execute(_ROLLUP.format(name='HOUR', unit='hour'))
+    op.execute(_ROLLUP.format(name='DAY', unit='day'))
+
+
+def downgrade() -> None:
+    op.drop_table('candles')
+    sa.Enum(name='candleresolution').drop(op.get_bind())
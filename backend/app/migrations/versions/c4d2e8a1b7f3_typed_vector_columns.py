@@ -0,0 +1,63 @@
+"""typed vector columns
+
+Revision ID: c4d2e8a1b7f3
+Revises: 7527d0d58d5e
+Create Date: 2026-10-19 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d2e8a1b7f3'
+down_revision: Union[str, None] = '7527d0d58d5e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('bets', sa.Column('predicted_price', sa.Double(), nullable=True))
+    op.add_column('bets', sa.Column('predicted_tx_count', sa.Double(), nullable=True))
+    op.execute(
+        "UPDATE bets SET predicted_price = (vector->>0)::double precision, "
+        "predicted_tx_count = (vector->>1)::double precision"
+    )
+    op.alter_column('bets', 'predicted_price', nullable=False)
+    op.alter_column('bets', 'predicted_tx_count', nullable=False)
+    op.drop_column('bets', 'vector')
+
+    op.add_column('blocks', sa.Column('result_price', sa.Double(), nullable=True))
+    op.add_column('blocks', sa.Column('result_tx_count', sa.Double(), nullable=True))
+    op.execute(
+        "UPDATE blocks SET result_price = (result_vector->>0)::double precision, "
+        "result_tx_count = (result_vector->>1)::double precision "
+        "WHERE jsonb_typeof(result_vector) = 'array'"
+    )
+    op.drop_column('blocks', 'result_vector')
+    op.create_index(
+        'ix_blocks_chain_id_created_at_with_result',
+        'blocks',
+        ['chain_id', 'created_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'COMPLETED' AND (result_price <> 0 OR result_tx_count <> 0)"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blocks_chain_id_created_at_with_result', table_name='blocks')
+    op.add_column('blocks', sa.Column('result_vector', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.execute(
+        "UPDATE blocks SET result_vector = jsonb_build_array(result_price, result_tx_count) "
+        "WHERE result_price IS NOT NULL"
+    )
+    op.drop_column('blocks', 'result_tx_count')
+    op.drop_column('blocks', 'result_price')
+
+    op.add_column('bets', sa.Column('vector', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.execute("UPDATE bets SET vector = jsonb_build_array(predicted_price, predicted_tx_count)")
+    op.alter_column('bets', 'vector', nullable=False)
+    op.drop_column('bets', 'predicted_tx_count')
+    op.drop_column('bets', 'predicted_price')
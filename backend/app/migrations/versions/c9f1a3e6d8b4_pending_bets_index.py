@@ -0,0 +1,32 @@
+"""index the pending bets of a user
+
+Revision ID: c9f1a3e6d8b4
+Revises: b2d6f9a4c1e7
+Create Date: 2026-10-19 18:00:00.000000
+
+/chain/state looks up the bets of the caller in the current blocks on every call; the partial
+index holds only pending bets, so its size does not grow with the history.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9f1a3e6d8b4'
+down_revision: Union[str, None] = 'b2d6f9a4c1e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_bets_user_id_pending',
+        'bets',
+        ['user_id'],
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bets_user_id_pending', table_name='bets')
@@ -0,0 +1,126 @@
+"""partition bets and blocks by month
+
+Revision ID: d7a3f1c9e5b2
+Revises: c4d2e8a1b7f3
+Create Date: 2026-10-19 13:00:00.000000
+
+bets and blocks become RANGE (created_at) partitioned tables with one partition per month,
+from the month of the oldest row up to MONTHS_AHEAD months ahead, plus a DEFAULT partition.
+Newer months are created by the partition maintenance job of the worker.
+
+A primary key or unique constraint of a partitioned table must include the partition key, so
+the primary keys become (id, created_at) and bets.block_id can no longer reference blocks.id:
+that foreign key is dropped, the relationship stays in the ORM.
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3f1c9e5b2'
+down_revision: Union[str, None] = 'c4d2e8a1b7f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 2
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _create_partitions(table: str) -> None:
+    oldest = op.get_bind().execute(sa.text(f'SELECT min(created_at) FROM {table}_unpartitioned')).scalar()
+    today = datetime.now().date()
+    month = (oldest.date() if oldest else today).replace(day=1)
+    last = today.replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+
+    while month <= last:
+        upper = _next_month(month)
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+    op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+
+def _partition(table: str, indexes: list[str]) -> None:
+    op.execute(f'ALTER TABLE {table} RENAME TO {table}_unpartitioned')
+    op.execute(f'ALTER INDEX {table}_pkey RENAME TO {table}_unpartitioned_pkey')
+    for index in indexes:
+        op.execute(f'DROP INDEX {index}')
+
+    op.execute(
+        f'CREATE TABLE {table} (LIKE {table}_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        f'PARTITION BY RANGE (created_at)'
+    )
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)')
+    _create_partitions(table)
+
+
+def _copy_and_drop_unpartitioned(table: str) -> None:
+    op.execute(f'INSERT INTO {table} SELECT * FROM {table}_unpartitioned')
+    op.execute(f'DROP TABLE {table}_unpartitioned')
+
+
+def upgrade() -> None:
+    op.drop_constraint('bets_block_id_fkey', 'bets', type_='foreignkey')
+
+    _partition('blocks', ['ix_blocks_chain_id_created_at_with_result'])
+    op.create_foreign_key('blocks_chain_id_fkey', 'blocks', 'chains', ['chain_id'], ['id'])
+    op.create_index('ix_blocks_chain_id_created_at', 'blocks', ['chain_id', 'created_at'])
+    op.create_index(
+        'ix_blocks_chain_id_created_at_with_result',
+        'blocks',
+        ['chain_id', 'created_at'],
+        postgresql_where=sa.text("status = 'COMPLETED' AND (result_price <> 0 OR result_tx_count <> 0)"),
+    )
+    _copy_and_drop_unpartitioned('blocks')
+
+    _partition('bets', ['ix_bets_block_id', 'ix_bets_pair_id'])
+    op.create_foreign_key('bets_user_id_fkey', 'bets', 'users', ['user_id'], ['id'])
+    op.create_foreign_key('bets_pair_id_fkey', 'bets', 'pairs', ['pair_id'], ['id'])
+    op.create_index('ix_bets_block_id', 'bets', ['block_id'])
+    op.create_index('ix_bets_pair_id', 'bets', ['pair_id'])
+    op.create_index('ix_bets_user_id_created_at', 'bets', ['user_id', 'created_at'])
+    _copy_and_drop_unpartitioned('bets')
+
+
+def _unpartition(table: str, foreign_keys: list[tuple[str, str, str]]) -> None:
+    op.execute(f'ALTER TABLE {table} RENAME TO {table}_partitioned')
+    op.execute(f'ALTER INDEX {table}_pkey RENAME TO {table}_partitioned_pkey')
+    for name, column, target in foreign_keys:
+        op.drop_constraint(name, f'{table}_partitioned', type_='foreignkey')
+    op.execute(f'CREATE TABLE {table} (LIKE {table}_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)')
+    op.execute(f'INSERT INTO {table} SELECT * FROM {table}_partitioned')
+    op.execute(f'DROP TABLE {table}_partitioned')
+    for name, column, target in foreign_keys:
+        op.create_foreign_key(name, table, target, [column], ['id'])
+
+
+def downgrade() -> None:
+    # archived months are not restored: they live in the archive files only
+    op.drop_index('ix_bets_user_id_created_at', table_name='bets')
+    op.drop_index('ix_bets_pair_id', table_name='bets')
+    op.drop_index('ix_bets_block_id', table_name='bets')
+    _unpartition('bets', [('bets_user_id_fkey', 'user_id', 'users'), ('bets_pair_id_fkey', 'pair_id', 'pairs')])
+    op.create_index('ix_bets_block_id', 'bets', ['block_id'])
+    op.create_index('ix_bets_pair_id', 'bets', ['pair_id'])
+
+    op.drop_index('ix_blocks_chain_id_created_at_with_result', table_name='blocks')
+    op.drop_index('ix_blocks_chain_id_created_at', table_name='blocks')
+    _unpartition('blocks', [('blocks_chain_id_fkey', 'chain_id', 'chains')])
+    op.create_index(
+        'ix_blocks_chain_id_created_at_with_result',
+        'blocks',
+        ['chain_id', 'created_at'],
+        postgresql_where=sa.text("status = 'COMPLETED' AND (result_price <> 0 OR result_tx_count <> 0)"),
+    )
+
+    op.create_foreign_key('bets_block_id_fkey', 'bets', 'blocks', ['block_id'], ['id'])
@@ -0,0 +1,70 @@
+"""balance ledger
+
+Revision ID: e1b4c7d2a9f6
+Revises: d7a3f1c9e5b2
+Create Date: 2026-10-19 14:00:00.000000
+
+users.balance is replaced by the append-only ledger_entries table and per-user balance_snapshots.
+Every non-zero balance is carried over as an OPENING entry.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1b4c7d2a9f6'
+down_revision: Union[str, None] = 'd7a3f1c9e5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ledger_entry_type = sa.Enum(
+    'OPENING', 'DEPOSIT', 'WITHDRAWAL', 'BET', 'REFUND', 'REWARD',
+    name='ledgerentrytype',
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ledger_entries',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('seq', sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('type', ledger_entry_type, nullable=False),
+        sa.Column('amount', sa.Double(), nullable=False),
+        sa.Column('reference_id', sa.UUID(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('seq'),
+    )
+    op.create_index('ix_ledger_entries_user_id_seq', 'ledger_entries', ['user_id', 'seq'])
+    op.create_table(
+        'balance_snapshots',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('seq', sa.BigInteger(), nullable=False),
+        sa.Column('balance', sa.Double(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+
+    op.execute(
+        "INSERT INTO ledger_entries (id, user_id, type, amount) "
+        "SELECT gen_random_uuid(), id, 'OPENING', balance FROM users WHERE balance <> 0"
+    )
+    op.drop_column('users', 'balance')
+
+
+def downgrade() -> None:
+    op.add_column('users', sa.Column('balance', sa.Float(), server_default='0', nullable=False))
+    op.alter_column('users', 'balance', server_default=None)
+    op.execute(
+        "UPDATE users SET balance = totals.balance "
+        "FROM (SELECT user_id, sum(amount) AS balance FROM ledger_entries GROUP BY user_id) totals "
+        "WHERE totals.user_id = users.id"
+    )
+    op.drop_table('balance_snapshots')
+    op.drop_index('ix_ledger_entries_user_id_seq', table_name='ledger_entries')
+    op.drop_table('ledger_entries')
+    ledger_entry_type.drop(op.get_bind())
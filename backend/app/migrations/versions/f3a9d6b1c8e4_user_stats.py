@@ -0,0 +1,77 @@
+"""user stats
+
+Revision ID: f3a9d6b1c8e4
+Revises: e1b4c7d2a9f6
+Create Date: 2026-10-19 15:00:00.000000
+
+user_stats and user_pair_stats keep running totals of the bets of a user, updated with every bet.
+They are filled from the existing bets; the accuracy of a user starts as the plain mean of the
+accuracy of the resolved bets rather than the exponentially weighted one.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9d6b1c8e4'
+down_revision: Union[str, None] = 'e1b4c7d2a9f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_STATS_COLUMNS = """
+    coalesce(sum(amount) FILTER (WHERE status = 'PENDING'), 0),
+    coalesce(sum(amount) FILTER (WHERE status <> 'CANCELED'), 0),
+    coalesce(sum(reward) FILTER (WHERE status = 'RESOLVED'), 0),
+    count(*) FILTER (WHERE status <> 'CANCELED'),
+    count(*) FILTER (WHERE status = 'RESOLVED'),
+    avg(accuracy) FILTER (WHERE status = 'RESOLVED'),
+    now(),
+    now()
+"""
+_INSERT_COLUMNS = (
+    'pending_stake, total_staked, total_reward, bet_count, resolved_count, accuracy, created_at, updated_at'
+)
+
+
+def _stats_columns() -> list[sa.Column]:
+    return [
+        sa.Column('pending_stake', sa.Double(), nullable=False),
+        sa.Column('total_staked', sa.Double(), nullable=False),
+        sa.Column('total_reward', sa.Double(), nullable=False),
+        sa.Column('bet_count', sa.Integer(), nullable=False),
+        sa.Column('resolved_count', sa.Integer(), nullable=False),
+        sa.Column('accuracy', sa.Double(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_stats',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        *_stats_columns(),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+    op.create_table(
+        'user_pair_stats',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('pair_id', sa.UUID(), nullable=False),
+        *_stats_columns(),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['pair_id'], ['pairs.id']),
+        sa.PrimaryKeyConstraint('user_id', 'pair_id'),
+    )
+
+    op.execute(f"INSERT INTO user_stats (user_id, {_INSERT_COLUMNS}) SELECT user_id, {_STATS_COLUMNS} FROM bets GROUP BY user_id")
+    op.execute(
+        f"INSERT INTO user_pair_stats (user_id, pair_id, {_INSERT_COLUMNS}) "
+        f"SELECT user_id, pair_id, {_STATS_COLUMNS} FROM bets GROUP BY user_id, pair_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_pair_stats')
+    op.drop_table('user_stats')
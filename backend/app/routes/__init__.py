@@ -3,5 +3,7 @@ from .bet import router as bet_router
 from .block import router as block_router
 from .candle import router as candle_router
 from .chain import router as chain_router
+from .events import router as events_router
+from .leaderboard import router as leaderboard_router
 from .pair import router as pair_router
 from .user import router as user_router
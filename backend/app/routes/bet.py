@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Request, HTTPException
 
 from dependencies.services.bet import get_bet_service
-from domain.metaholder.requests.bet import PlaceBetRequest, CancelBetRequest
+from domain.metaholder.requests.bet import PlaceBetRequest, PlaceBetsRequest, CancelBetRequest
+from infrastructure.db.repositories.exceptions import ConflictException
 from routes.helpers import get_user_id_from_request
 from services.exceptions import NotEnoughMoney
+from settings import settings
 
 router = APIRouter(
     prefix="/bets",
@@ -24,6 +26,29 @@ async def place_bet(bet: PlaceBetRequest, request: Request) -> None:
         )
 
 
+@router.post('/batch')
+async def place_bets(bets: PlaceBetsRequest, request: Request) -> None:
+    if len(bets.bets) > settings.bets.batch_max_size:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {settings.bets.batch_max_size} bets per batch",
+        )
+    try:
+        service = get_bet_service()
+        user_id = get_user_id_from_request(request)
+        return await service.create_bets(bets.bets, user_id)
+    except NotEnoughMoney:
+        raise HTTPException(
+            status_code=503,
+            detail=f"No money bro",
+        )
+    except ConflictException:
+        raise HTTPException(
+            status_code=409,
+            detail="Balance changed while placing the bets, try again",
+        )
+
+
 @router.post('/cancel')
 async def cancel_bet(bet: CancelBetRequest) -> None:
     service = get_bet_service()
@@ -2,9 +2,12 @@ import logging
 from typing import Tuple
 from uuid import UUID
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from pydantic import TypeAdapter
 
 from dependencies.services.block import get_block_service
+from dependencies.services.versions import get_version_registry
+from routes.conditional import PUBLIC, is_not_modified, json_response, not_modified
 
 router = APIRouter(
     prefix='/block',
@@ -13,20 +16,26 @@ router = APIRouter(
 
 logger = logging.getLogger(__name__)
 
+_VECTORS = TypeAdapter(list[Tuple[float, float]])
+
 
 @router.get('/last_vector')
 async def get_last_vector(pair_id: UUID) -> Tuple[float, float]:
     service = get_block_service()
-    block = await service.get_last_completed_block_by_pair_id(pair_id)
-    vector = block.result_vector
+    vector = await service.get_last_result_vector(pair_id)
     logger.info('ебаный вектор')
     logger.info(vector)
     return vector
 
 
 @router.get('/last_vectors')
-async def get_last_vectors(pair_id: UUID, count: int) -> list[Tuple[float, float]]:
+async def get_last_vectors(request: Request, pair_id: UUID, count: int) -> list[Tuple[float, float]]:
+    version = get_version_registry().get_pair_version(pair_id)
+    if is_not_modified(request, version):
+        return not_modified(version, PUBLIC)
+
     service = get_block_service()
     blocks = await service.get_n_last_active_blocks_by_pair_id(pair_id=pair_id, n=count)
     vectors = [block.result_vector for block in blocks[::-1]]
-    return vectors
+    # векторы из БД приходят списками: проверка приводит их к парам float, как делал бы FastAPI
+    return json_response(_VECTORS.dump_json(_VECTORS.validate_python(vectors)), version, PUBLIC)
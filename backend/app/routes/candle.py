@@ -1,11 +1,17 @@
 import logging
+from datetime import datetime
 from typing import Optional
+from uuid import UUID
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request
+from pydantic import TypeAdapter
 
 from dependencies.services.candle import get_candle_service
+from dependencies.services.versions import get_version_registry
+from domain.enums.candle import CandleResolution
 from domain.metaholder.responses.candle import Candle
-from domain.models.block import Block
+from routes.conditional import PUBLIC, is_not_modified, json_response, not_modified
+from settings import settings
 
 router = APIRouter(
     prefix="/candles",
@@ -13,45 +19,24 @@ router = APIRouter(
 )
 logger = logging.getLogger(__name__)
 
+_CANDLES = TypeAdapter(list[Candle])
 
-@router.get('')
-async def get_candles(pair_id: str, n: int) -> Optional[list[Candle]]:
-    service = get_candle_service()
-    blocks = await service.get_n_last_blocks_by_pair_id(pair_id=pair_id, n=n)
-    logger.info("blocks!!!")
-    logger.info(blocks)
-    candles = []
-    prev_block: Optional[Block] = None
-    for block in blocks:
-        logger.info(f"Block ID: {block.id}")
-        volume = sum([bet.amount for bet in block.bets])
-        logger.info("[bet.amount for bet in block.bets]")
-        logger.info([bet.amount for bet in block.bets])
-        logger.info("volume")
-        logger.info(volume)
-        bet_prices = [bet.vector[0] for bet in block.bets]
-        logger.info("bet_prices")
-        logger.info(bet_prices)
-        logger.info("[bet.vector[0] for bet in block.bets]")
-        logger.info([bet.vector[0] for bet in block.bets])
-        if not bet_prices and volume == 0:
-            low_price = 0
-            high_price = 0
-        else:
-            low_price = min(bet_prices)
-            high_price = max(bet_prices)
 
-        candle = Candle(
-            opening_price=prev_block.result_vector[0] if prev_block else 7,
-            closing_price=block.result_vector[0] if block.result_vector[0]!= 0 else 11,
-            high_price=high_price,
-            low_price=low_price,
-            volume=volume,
-            block_number=block.block_number,
-        )
-        candles.append(candle)
-        prev_block = block
+@router.get('')
+async def get_candles(
+        request: Request,
+        pair_id: UUID,
+        n: int = Query(100, ge=1, le=settings.candles.max_count),
+        resolution: CandleResolution = CandleResolution.BLOCK,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+) -> Optional[list[Candle]]:
+    # версия берётся до чтения: ответ не может оказаться новее своей версии
+    version = get_version_registry().get_pair_version(pair_id)
+    if is_not_modified(request, version):
+        return not_modified(version, PUBLIC)
 
-    logger.info("candles")
-    logger.info(candles)
-    return candles
+    service = get_candle_service()
+    candles = await service.get_candles(pair_id=pair_id, resolution=resolution, n=n, start=start, end=end)
+    logger.debug('%s %s candles for pair %s', len(candles), resolution.value, pair_id)
+    return json_response(_CANDLES.dump_json(candles), version, PUBLIC)
@@ -1,10 +1,15 @@
 import logging
+from typing import Optional
+from uuid import UUID
 
 from fastapi import APIRouter, HTTPException
+from starlette.requests import Request
 
-from dependencies.repositories.chain import get_chain_repository
 from dependencies.services.block import get_block_service
+from dependencies.services.pair_state import get_pair_state_service
 from domain.metaholder.responses.block_state import BlockStateResponse
+from domain.metaholder.responses.pair_state import PairsStateResponse
+from routes.helpers import get_user_id_from_request
 from services.exceptions import NotFoundException
 
 router = APIRouter(
@@ -17,15 +22,16 @@ logger = logging.getLogger(__name__)
 
 @router.get('/time')
 async def get_time(
+        pair_id: Optional[UUID] = None,
 ) -> BlockStateResponse:
     service = get_block_service()
-    repository = get_chain_repository()
     # todo: может стоит сделать TimeResponse как часть метахолдера?
     #  ну хз как будто уже пиздец бойлерплейт,
     #  но с другой стороны по сути ни один сервис не должен отдавать напрямую модели метахолдера короче хз наверное пох
     try:
-        chains = await repository.get_all()
-        res = await service.get_current_block_state(chains[0].pair_id)
+        if pair_id is None:
+            pair_id = await service.get_default_pair_id()
+        res = await service.get_current_block_state(pair_id)
         logger.info(f"res: {res}")
         return res
     except NotFoundException:
@@ -33,3 +39,14 @@ async def get_time(
             status_code=503,
             detail=f"No one block bro",
         )
+
+
+@router.get('/state')
+async def get_state(
+        request: Request,
+) -> PairsStateResponse:
+    """
+    Состояние всех активных пар и ставки пользователя в их текущих блоках одним запросом.
+    """
+    service = get_pair_state_service()
+    return await service.get_pairs_state(user_id=get_user_id_from_request(request))
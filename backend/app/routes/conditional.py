@@ -0,0 +1,61 @@
+"""
+Conditional GET: validators from a Version and 304 without a body while the client's copy is current.
+"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+from domain.models.version import Version
+
+# pair data is the same for everyone, user data must not be stored by shared caches
+PUBLIC = 'no-cache'
+PRIVATE = 'private, no-cache'
+
+
+def _http_date(at: datetime) -> datetime:
+    return at.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _validators(version: Version, cache_control: str) -> dict[str, str]:
+    headers = {'ETag': f'W/"{version.tag}"', 'Cache-Control': cache_control}
+    modified = _http_date(version.modified_at)
+    # dates have whole seconds: a date of the current second would hide a change later in it
+    if modified + timedelta(seconds=1) <= datetime.now(timezone.utc):
+        headers['Last-Modified'] = format_datetime(modified, usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, version: Optional[Version]) -> bool:
+    if version is None:
+        return False
+
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+        return '*' in tags or f'"{version.tag}"' in tags
+
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return _http_date(version.modified_at) <= since
+
+
+def not_modified(version: Version, cache_control: str) -> Response:
+    return Response(status_code=304, headers=_validators(version, cache_control))
+
+
+def json_response(body: bytes | str, version: Optional[Version], cache_control: str) -> Response:
+    """
+    Body serialized by pydantic-core: returning it as is skips the validation and encoding
+    FastAPI applies to a returned model, which dominates on long lists.
+    """
+    headers = _validators(version, cache_control) if version else None
+    return Response(body, media_type='application/json', headers=headers)
@@ -0,0 +1,39 @@
+import asyncio
+import logging
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from dependencies.services.events import get_event_broadcaster
+from infrastructure.db.notifications import encode_event
+from routes.helpers import get_user_id_from_request
+
+router = APIRouter(
+    prefix='/events',
+    tags=['events/'],
+)
+
+logger = logging.getLogger(__name__)
+
+KEEPALIVE_INTERVAL = 15  # seconds
+
+
+@router.get('')
+async def stream_events(request: Request) -> StreamingResponse:
+    user_id = get_user_id_from_request(request)
+    broadcaster = get_event_broadcaster()
+
+    async def event_stream():
+        queue = broadcaster.subscribe(user_id)
+        try:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ': keepalive\n\n'
+                    continue
+                yield f'event: {event.type.value}\ndata: {encode_event(event)}\n\n'
+        finally:
+            broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(event_stream(), media_type='text/event-stream')
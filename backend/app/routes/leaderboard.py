@@ -0,0 +1,36 @@
+import logging
+from uuid import UUID
+
+from fastapi import APIRouter, Query
+from starlette.requests import Request
+
+from dependencies.services.leaderboard import get_leaderboard_service
+from domain.enums.leaderboard import LeaderboardMetric, LeaderboardPeriod
+from domain.metaholder.responses.leaderboard import LeaderboardResponse
+from routes.helpers import get_user_id_from_request
+from settings import settings
+
+router = APIRouter(
+    prefix='/leaderboard',
+    tags=['Leaderboard'],
+)
+
+logger = logging.getLogger(__name__)
+
+
+@router.get('/{pair_id}')
+async def get_leaderboard(
+        request: Request,
+        pair_id: UUID,
+        period: LeaderboardPeriod = LeaderboardPeriod.DAY,
+        metric: LeaderboardMetric = LeaderboardMetric.REWARD,
+        limit: int = Query(10, ge=1, le=settings.leaderboard.max_limit),
+) -> LeaderboardResponse:
+    service = get_leaderboard_service()
+    return await service.get_leaderboard(
+        pair_id=pair_id,
+        period=period,
+        metric=metric,
+        limit=limit,
+        user_id=get_user_id_from_request(request),
+    )
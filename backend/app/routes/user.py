@@ -7,12 +7,18 @@ from starlette.requests import Request
 from dependencies.services.bet import get_bet_service
 from dependencies.services.inner_token import get_inner_token_service
 from dependencies.services.user import get_user_service
-from domain.enums import BetStatus
+from dependencies.services.versions import get_version_registry
 from domain.metaholder.requests.pair import GetUserLastBetRequest
 from domain.metaholder.requests.wallet import WithdrawToExternalWalletRequest
 from domain.metaholder.responses import BetResponse
 from domain.metaholder.responses.bet_result import BetResult
-from domain.metaholder.responses.user import UserHistoryResponse, UserBetsResponse, UserInfoResponse
+from domain.metaholder.responses.user import (
+    UserHistoryResponse,
+    UserBetsResponse,
+    UserInfoResponse,
+    UserStatsResponse,
+)
+from routes.conditional import PRIVATE, is_not_modified, json_response, not_modified
 from routes.helpers import get_user_id_from_request
 from services.exceptions import NotFoundException
 
@@ -33,12 +39,25 @@ async def get_user_info(
     user_service = get_user_service()
 
     try:
-        user = await user_service.get_user(user_id)
-        return UserInfoResponse(
-            user_id=user.id,
-            balance=user.balance,
-            at_risk=sum([x.amount for x in user.bets if x.status == BetStatus.PENDING]),
+        return await user_service.get_user_info(user_id)
+    except NotFoundException:
+        logger.error(f"No user with ID {user_id}", exc_info=True)
+        raise HTTPException(
+            status_code=404,
+            detail=f"No user with ID {user_id}",
         )
+
+
+@router.get('/stats')
+async def get_user_stats(
+        request: Request,
+) -> UserStatsResponse:
+    user_id = get_user_id_from_request(request)
+
+    user_service = get_user_service()
+
+    try:
+        return await user_service.get_user_stats(user_id)
     except NotFoundException:
         logger.error(f"No user with ID {user_id}", exc_info=True)
         raise HTTPException(
@@ -52,11 +71,15 @@ async def get_user_bets(
         request: Request,
 ) -> UserBetsResponse:
     user_id = get_user_id_from_request(request)
+    version = get_version_registry().get_user_version(user_id)
+    if is_not_modified(request, version):
+        return not_modified(version, PRIVATE)
 
     users = get_user_service()
 
     try:
-        return await users.get_user_bets(user_id)
+        bets = await users.get_user_bets(user_id)
+        return json_response(bets.model_dump_json(), version, PRIVATE)
     except NotFoundException:
         logger.error(f"No user with ID {user_id}", exc_info=True)
         raise HTTPException(
@@ -129,11 +152,15 @@ async def get_user_history(
         request: Request,
 ) -> UserHistoryResponse:
     user_id = get_user_id_from_request(request)
+    version = get_version_registry().get_user_version(user_id)
+    if is_not_modified(request, version):
+        return not_modified(version, PRIVATE)
 
     users = get_user_service()
 
     try:
-        return await users.get_user_history(user_id)
+        history = await users.get_user_history(user_id)
+        return json_response(history.model_dump_json(), version, PRIVATE)
     except NotFoundException:
         logger.error(f"No user with ID {user_id}", exc_info=True)
         raise HTTPException(
@@ -5,13 +5,21 @@ from uuid import UUID
 
 from abstractions.repositories.bet import BetRepositoryInterface
 from abstractions.repositories.block import BlockRepositoryInterface
-from abstractions.repositories.user import UserRepositoryInterface
+from abstractions.repositories.ledger import LedgerRepositoryInterface
+from abstractions.repositories.user_stats import UserStatsRepositoryInterface
 from abstractions.services.bet import BetServiceInterface
+from abstractions.services.events import EventPublisherInterface
+from abstractions.services.versions import VersionRegistryInterface
 from domain.dto.bet import CreateBetDTO, UpdateBetDTO
-from domain.dto.user import UpdateUserDTO
+from domain.dto.ledger import CreateLedgerEntryDTO
+from domain.dto.user_stats import UserStatsDeltaDTO
 from domain.enums import BetStatus
+from domain.enums.ledger import LedgerEntryType
 from domain.metaholder.requests.bet import PlaceBetRequest
+from domain.models.bet import Bet as BetModel
+from domain.models.events import BetsChangedEvent
 from infrastructure.db.entities import Bet
+from infrastructure.db.repositories.exceptions import ConflictException
 from services.exceptions import NotEnoughMoney
 
 logger = logging.getLogger(__name__)
@@ -20,17 +28,20 @@ logger = logging.getLogger(__name__)
 @dataclass
 class BetService(BetServiceInterface):
     bet_repository: BetRepositoryInterface
-    user_repository: UserRepositoryInterface
+    ledger_repository: LedgerRepositoryInterface
     block_repository: BlockRepositoryInterface
+    user_stats_repository: UserStatsRepositoryInterface
+    batch_attempts: int = 3
+    event_publisher: Optional[EventPublisherInterface] = None
+    version_registry: Optional[VersionRegistryInterface] = None
 
     # NEWBET
     async def create_bet(self, create_dto: PlaceBetRequest, user_id: UUID) -> None:
         block = await self.block_repository.get_last_completed_block_by_pair_id(pair_id=create_dto.pair_id)
         current_block = await self.block_repository.get_current_block_state(pair_id=create_dto.pair_id)
-        user = await self.user_repository.get(user_id)
 
         current_price = block.result_vector[0]
-        deposit = user.balance
+        deposit = await self.ledger_repository.get_balance(user_id)
         logger.info("deposit")
         logger.info(deposit)
         trend_attack = abs(current_price - create_dto.predicted_vector[0]) / current_price
@@ -60,31 +71,162 @@ class BetService(BetServiceInterface):
             pair_id=dto.pair_id,
         )
         if current_pair_bet and current_pair_bet.status == BetStatus.PENDING:
-            await self.cancel_bet(current_pair_bet.id)
+            await self._cancel_bet(current_pair_bet.id)
 
-        await self.user_repository.fund_user(user_id=dto.user_id, amount=dto.amount * -1)
-        return await self.bet_repository.create(dto)
+        await self.ledger_repository.append([CreateLedgerEntryDTO(
+            user_id=dto.user_id,
+            type=LedgerEntryType.BET,
+            amount=dto.amount * -1,
+            reference_id=dto.id,
+        )])
+        await self.bet_repository.create(dto)
+        await self.user_stats_repository.apply([UserStatsDeltaDTO(
+            user_id=dto.user_id,
+            pair_id=dto.pair_id,
+            pending_stake=dto.amount,
+            staked=dto.amount,
+            bets=1,
+        )])
+        await self._publish_bets_changed(user_id)
+
+    async def create_bets(self, create_dtos: list[PlaceBetRequest], user_id: UUID) -> None:
+        for attempt in range(1, self.batch_attempts + 1):
+            balance = await self.ledger_repository.get_balance(user_id)
+            bets, canceled, entries = await self._plan_batch(create_dtos, user_id, balance)
+            try:
+                await self.bet_repository.place_batch(
+                    user_id=user_id,
+                    balance=balance,
+                    bets=bets,
+                    canceled_bet_ids=[bet.id for bet in canceled],
+                    entries=entries,
+                )
+                break
+            except ConflictException:
+                # баланс изменился между планом и транзакцией: план строится заново
+                if attempt == self.batch_attempts:
+                    raise
+                logger.info('Batch of %s bets of user %s conflicted, attempt %s', len(bets), user_id, attempt)
+
+        # статистика не входит в транзакцию пакета, как и у одиночной ставки
+        await self.user_stats_repository.apply([
+            *(UserStatsDeltaDTO(
+                user_id=user_id,
+                pair_id=bet.pair.id,
+                pending_stake=-bet.amount,
+                staked=-bet.amount,
+                bets=-1,
+            ) for bet in canceled),
+            *(UserStatsDeltaDTO(
+                user_id=user_id,
+                pair_id=dto.pair_id,
+                pending_stake=dto.amount,
+                staked=dto.amount,
+                bets=1,
+            ) for dto in bets),
+        ])
+        await self._publish_bets_changed(user_id)
+
+    async def _plan_batch(
+            self,
+            create_dtos: list[PlaceBetRequest],
+            user_id: UUID,
+            balance: float,
+    ) -> tuple[list[CreateBetDTO], list[BetModel], list[CreateLedgerEntryDTO]]:
+        """
+        Ставки, отменяемые ставки и записи журнала пакета. Суммы считаются так же, как при
+        последовательных create_bet: от баланса после предыдущих ставок пакета, без возврата
+        заменяемой ставки той же пары.
+        """
+        pending = {}
+        for bet in await self.bet_repository.get_pending_user_bets(user_id):
+            pending.setdefault(bet.pair.id, bet)  # от новых к старым
+
+        bets, canceled, entries = [], [], []
+        for create_dto in create_dtos:
+            block = await self.block_repository.get_last_completed_block_by_pair_id(pair_id=create_dto.pair_id)
+            current_block = await self.block_repository.get_current_block_state(pair_id=create_dto.pair_id)
+
+            current_price = block.result_vector[0]
+            trend_attack = abs(current_price - create_dto.predicted_vector[0]) / current_price
+            bet_amount = balance * trend_attack
+            if balance < bet_amount:
+                raise NotEnoughMoney
+
+            dto = CreateBetDTO(
+                user_id=user_id,
+                pair_id=create_dto.pair_id,
+                amount=bet_amount,
+                block_id=current_block.block_id,
+                vector=create_dto.predicted_vector,
+                status=BetStatus.PENDING,
+            )
+            replaced = pending.get(create_dto.pair_id)
+            if replaced:
+                canceled.append(replaced)
+                entries.append(CreateLedgerEntryDTO(
+                    user_id=user_id,
+                    type=LedgerEntryType.REFUND,
+                    amount=replaced.amount,
+                    reference_id=replaced.id,
+                ))
+                balance += replaced.amount
+            entries.append(CreateLedgerEntryDTO(
+                user_id=user_id,
+                type=LedgerEntryType.BET,
+                amount=dto.amount * -1,
+                reference_id=dto.id,
+            ))
+            balance -= dto.amount
+            bets.append(dto)
+        return bets, canceled, entries
 
     async def cancel_bet(self, bet_id: UUID) -> None:
+        bet = await self._cancel_bet(bet_id)
+        if bet:
+            await self._publish_bets_changed(bet.user.id)
+
+    async def _cancel_bet(self, bet_id: UUID) -> Optional[BetModel]:
         bet = await self.bet_repository.get(bet_id)
-        user = await self.user_repository.get(bet.user.id)
 
         if bet.status == BetStatus.CANCELED:
-            return
+            return None
 
         if bet.status == BetStatus.RESOLVED:
-            return
-
-        update_user = UpdateUserDTO(
-            balance=user.balance + bet.amount,
-        )
+            return None
 
-        await self.user_repository.update(obj_id=user.id, obj=update_user)
+        await self.ledger_repository.append([CreateLedgerEntryDTO(
+            user_id=bet.user.id,
+            type=LedgerEntryType.REFUND,
+            amount=bet.amount,
+            reference_id=bet.id,
+        )])
 
         update_bet = UpdateBetDTO(
             status=BetStatus.CANCELED
         )
         await self.bet_repository.update(bet.id, update_bet)
+        # отменённая ставка не считается сделанной
+        await self.user_stats_repository.apply([UserStatsDeltaDTO(
+            user_id=bet.user.id,
+            pair_id=bet.pair.id,
+            pending_stake=-bet.amount,
+            staked=-bet.amount,
+            bets=-1,
+        )])
+        return bet
+
+    async def _publish_bets_changed(self, user_id: UUID) -> None:
+        if self.version_registry is not None:
+            # не дожидаясь события: его публикация может не удаться
+            self.version_registry.touch_users([user_id])
+        if self.event_publisher is None:
+            return
+        # ставка уже сделана: уведомление не должно её ломать
+        try:
+            await self.event_publisher.publish(BetsChangedEvent(user_ids=[user_id]))
+        except Exception:
+            logger.error('Could not publish changed bets', exc_info=True)
 
     async def get_last_user_bet(self, user_id: UUID, pair_id: UUID) -> Optional[Bet]:
         logger.info('мяу!')
@@ -1,6 +1,5 @@
 import logging
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
 from typing import Optional
 from uuid import UUID
 
@@ -8,20 +7,36 @@ from fastapi import HTTPException
 
 from abstractions.repositories.bet import BetRepositoryInterface
 from abstractions.repositories.block import BlockRepositoryInterface
+from abstractions.repositories.candle import CandleRepositoryInterface
 from abstractions.repositories.chain import ChainRepositoryInterface
-from abstractions.repositories.user import UserRepositoryInterface
+from abstractions.repositories.leaderboard import LeaderboardRepositoryInterface
+from abstractions.repositories.ledger import LedgerRepositoryInterface
+from abstractions.repositories.user_stats import UserStatsRepositoryInterface
 from abstractions.services.bet import BetServiceInterface
+from abstractions.services.block_clock import BlockClockRegistryInterface
+from abstractions.services.block_state_cache import BlockStateCacheInterface
 from abstractions.services.block import BlockServiceInterface
+from abstractions.services.clock import ClockInterface
 from abstractions.services.math.aggregate_bets import AggregateBetsServiceInterface
+from abstractions.services.read_coalescer import ReadCoalescerInterface
 from domain.dto.bet import UpdateBetDTO
 from domain.dto.block import UpdateBlockDTO, CreateBlockDTO
+from domain.dto.candle import BlockCandleDTO
+from domain.dto.ledger import CreateLedgerEntryDTO
+from domain.dto.user_stats import UserStatsDeltaDTO
 from domain.enums import BetStatus
 from domain.enums.block_status import BlockStatus
+from domain.enums.ledger import LedgerEntryType
 from domain.metaholder.requests.bet import PlaceBetRequest
 from domain.metaholder.responses.block_state import BlockStateResponse
+from domain.models.bet import Bet, BetVector
 from domain.models.block import Block
+from domain.models.block_state import CachedBlockState
+from domain.models.user_reward import UserReward
 from domain.models.reward_model import Rewards
 from infrastructure.db.repositories.exceptions import NotFoundException as RepositoryNotFoundException
+from infrastructure.metrics import SETTLEMENT_STAGE_DURATION
+from services.clock import SystemClock
 from services.exceptions import NotFoundException, NotEnoughMoney
 
 logger = logging.getLogger(__name__)
@@ -32,16 +47,25 @@ class BlockService(BlockServiceInterface):
     block_repository: BlockRepositoryInterface
     aggregate_bets_service: AggregateBetsServiceInterface
     chain_repository: ChainRepositoryInterface
-    user_repository: UserRepositoryInterface
+    ledger_repository: LedgerRepositoryInterface
+    user_stats_repository: UserStatsRepositoryInterface
+    leaderboard_repository: LeaderboardRepositoryInterface
+    candle_repository: CandleRepositoryInterface
     bet_repository: BetRepositoryInterface
     bet_service: BetServiceInterface
+    block_state_cache: BlockStateCacheInterface
+    block_clocks: BlockClockRegistryInterface
+    read_coalescer: ReadCoalescerInterface
+    clock: ClockInterface = field(default_factory=SystemClock)
 
     async def get_last_block(self, chain_id: UUID) -> Optional[Block]:
         last_block = await self.block_repository.get_last_block(chain_id)
         return last_block
 
     async def get_n_last_active_blocks_by_pair_id(self, n: int, pair_id: UUID) -> Optional[list[Block]]:
-        last_blocks = await self.block_repository.get_n_last_active_blocks_by_pair_id(n, pair_id)
+        last_blocks = await self.read_coalescer.run(
+            'last_blocks', pair_id, n, lambda: self.block_repository.get_n_last_active_blocks_by_pair_id(n, pair_id),
+        )
         return last_blocks
 
     async def get_last_block_by_pair_id(self, pair_id: UUID) -> Optional[Block]:
@@ -76,7 +100,7 @@ class BlockService(BlockServiceInterface):
                 status=BlockStatus.IN_PROGRESS,
                 result_vector=None,
                 chain_id=chain_id,
-                created_at=datetime.now(),
+                created_at=self.clock.now(),
             )
         else:
             block = CreateBlockDTO(
@@ -84,14 +108,14 @@ class BlockService(BlockServiceInterface):
                 status=BlockStatus.IN_PROGRESS,
                 result_vector=None,
                 chain_id=chain_id,
-                created_at=datetime.now(),
+                created_at=self.clock.now(),
             )
 
         await self.block_repository.create(block)
         block = await self.block_repository.get(block.id)
         return block
 
-    async def complete_block(self, block_id: UUID) -> None:
+    async def complete_block(self, block_id: UUID) -> Block:
         block = await self.get_block(block_id)
         result_vector = await self.aggregate_bets_service.aggregate_bets(block_id)
         if result_vector[0] == .0:
@@ -101,29 +125,99 @@ class BlockService(BlockServiceInterface):
             UpdateBlockDTO(
                 status=BlockStatus.COMPLETED,
                 result_vector=result_vector,
-                completed_at=datetime.now(),
+                completed_at=self.clock.now(),
             )
         )
         block.status = BlockStatus.COMPLETED
-        block.completed_at = datetime.now()
+        block.completed_at = update_block.completed_at
+        block.result_vector = result_vector
         await self.block_repository.update(block_id, update_block)
+        # блоки без результата не попадают на график, как и в get_n_last_active_blocks_by_pair_id
+        if result_vector is not None and (result_vector[0] != 0 or result_vector[1] != 0):
+            await self._record_candle(block)
+        return block
+
+    async def _record_candle(self, block: Block) -> None:
+        chain = await self.chain_repository.get(block.chain_id)
+        prices = [bet.vector[0] for bet in block.bets]
+        await self.candle_repository.record(
+            BlockCandleDTO(
+                pair_id=chain.pair_id,
+                block_number=block.block_number,
+                created_at=block.created_at,
+                close=block.result_vector[0],
+                high=max(prices, default=None),
+                low=min(prices, default=None),
+                volume=sum(bet.amount for bet in block.bets),
+            )
+        )
 
     async def process_completed_block(self, block: Block, rewards: Rewards, new_block_id: UUID) -> None:
         rewards_by_user_id = {
             reward.user_id: reward.reward for reward in rewards.user_rewards
         }
-        for bet in block.bets:
-            if bet.status != BetStatus.PENDING:
-                continue
+        accuracy_by_user_id = {
+            reward.user_id: reward.accuracy for reward in rewards.user_rewards
+        }
+        pending_bets = [bet for bet in block.bets if bet.status == BetStatus.PENDING]
+        with SETTLEMENT_STAGE_DURATION.labels('resolve').time():
+            await self._resolve_bets(pending_bets, rewards_by_user_id)
+        with SETTLEMENT_STAGE_DURATION.labels('stats').time():
+            await self._record_stats(block, pending_bets, rewards_by_user_id, accuracy_by_user_id)
+        with SETTLEMENT_STAGE_DURATION.labels('rebets').time():
+            await self._place_rebets(pending_bets, rewards_by_user_id)
 
+    async def _resolve_bets(self, pending_bets: list[Bet], rewards_by_user_id: dict[UUID, float]) -> None:
+        for bet in pending_bets:
             # todo: refactor to Bet/User service?
             update_dto = UpdateBetDTO(
                 status=BetStatus.RESOLVED
             )
             await self.bet_repository.update(obj_id=bet.id, obj=update_dto)
-            # NEWBET
-            await self.user_repository.fund_user(user_id=bet.user_id, amount=bet.amount + rewards_by_user_id[bet.user_id])
 
+        # NEWBET: ставка возвращается вместе с наградой; проводки всего блока пишутся одной пачкой
+        # до повторных ставок, которые читают баланс
+        await self.ledger_repository.append([
+            CreateLedgerEntryDTO(
+                user_id=bet.user_id,
+                type=LedgerEntryType.REWARD,
+                amount=bet.amount + rewards_by_user_id[bet.user_id],
+                reference_id=bet.id,
+            ) for bet in pending_bets
+        ])
+
+    async def _record_stats(
+            self,
+            block: Block,
+            pending_bets: list[Bet],
+            rewards_by_user_id: dict[UUID, float],
+            accuracy_by_user_id: dict[UUID, float],
+    ) -> None:
+        await self.user_stats_repository.apply([
+            UserStatsDeltaDTO(
+                user_id=bet.user_id,
+                pair_id=bet.pair.id,
+                pending_stake=-bet.amount,
+                reward=rewards_by_user_id[bet.user_id],
+                resolved=1,
+                accuracy=accuracy_by_user_id[bet.user_id],
+            ) for bet in pending_bets
+        ])
+        if pending_bets:
+            await self.leaderboard_repository.record(
+                pair_id=pending_bets[0].pair.id,
+                at=block.completed_at or self.clock.now(),
+                rewards=[
+                    UserReward(
+                        user_id=bet.user_id,
+                        reward=rewards_by_user_id[bet.user_id],
+                        accuracy=accuracy_by_user_id[bet.user_id],
+                    ) for bet in pending_bets
+                ],
+            )
+
+    async def _place_rebets(self, pending_bets: list[Bet], rewards_by_user_id: dict[UUID, float]) -> None:
+        for bet in pending_bets:
             new_bet_amount = bet.amount + rewards_by_user_id[bet.user_id]
             if new_bet_amount > 0:
                 new_bet = PlaceBetRequest(
@@ -131,7 +225,7 @@ class BlockService(BlockServiceInterface):
                     amount=new_bet_amount,
                     predicted_vector=bet.vector,
                 )
-                logger.info(f'Повторная ставка: {new_bet}')
+                logger.debug('Повторная ставка: %s', new_bet)
                 try:
                     await self.bet_service.create_bet(create_dto=new_bet, user_id=bet.user_id)
                 except NotEnoughMoney:
@@ -150,9 +244,54 @@ class BlockService(BlockServiceInterface):
         return block
 
     async def get_current_block_state(self, pair_id: UUID) -> BlockStateResponse:
-        try:
-            block = await self.block_repository.get_current_block_state(pair_id)
-        except RepositoryNotFoundException:
+        cached = self.block_state_cache.get_current_block(pair_id)
+        if not cached:
+            generation = self.block_state_cache.get_generation(pair_id)
+            cached = await self.read_coalescer.run(
+                'current_block', pair_id, None, lambda: self._load_current_block(pair_id),
+            )
+            self.block_state_cache.set_current_block(pair_id, cached, generation)
+
+        now = self.clock.now()
+        return BlockStateResponse(
+            block_id=cached.block_id,
+            server_time=now,
+            current_block=cached.block_number,
+            remaining_time_in_block=int(max(0.0, (cached.ends_at - now).total_seconds())),
+        )
+
+    async def _load_current_block(self, pair_id: UUID) -> CachedBlockState:
+        last_block = await self.block_repository.get_last_block_by_pair_id(pair_id)
+        if not last_block:
             raise NotFoundException(f"Current block not found")
-        return block
+
+        clock = await self.block_clocks.get_by_pair_id(pair_id)
+        return CachedBlockState(
+            block_id=last_block.id,
+            block_number=last_block.block_number,
+            ends_at=clock.boundary_after(last_block.created_at),
+        )
+
+    async def get_last_result_vector(self, pair_id: UUID) -> Optional[BetVector]:
+        vector = self.block_state_cache.get_last_result_vector(pair_id)
+        if vector:
+            return vector
+
+        generation = self.block_state_cache.get_generation(pair_id)
+        vector = await self.read_coalescer.run(
+            'last_vector', pair_id, None, lambda: self._load_last_result_vector(pair_id),
+        )
+        if vector:
+            self.block_state_cache.set_last_result_vector(pair_id, vector, generation)
+        return vector
+
+    async def _load_last_result_vector(self, pair_id: UUID) -> Optional[BetVector]:
+        block = await self.block_repository.get_last_completed_block_by_pair_id(pair_id)
+        return block.result_vector if block else None
+
+    async def get_default_pair_id(self) -> UUID:
+        chains = await self.read_coalescer.run('chains', None, None, self.chain_repository.get_all)
+        if not chains:
+            raise NotFoundException("No chains")
+        return chains[0].pair_id
 
@@ -1,20 +1,27 @@
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from typing import Optional
 from uuid import UUID
 
-from apscheduler.schedulers.base import BaseScheduler
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from pytoniq_core import Address
 
 from abstractions.repositories.chain import ChainRepositoryInterface
+from abstractions.repositories.ledger import LedgerRepositoryInterface
 from abstractions.repositories.pair import PairRepositoryInterface
 from abstractions.services.app_wallet import AppWalletServiceInterface
+from abstractions.services.archive import ArchiveServiceInterface
 from abstractions.services.block import BlockServiceInterface
+from abstractions.services.block_clock import BlockClockRegistryInterface
 from abstractions.services.chain import ChainServiceInterface
+from abstractions.services.clock import ClockInterface
 from abstractions.services.deposit import DepositServiceInterface
+from abstractions.services.events import EventPublisherInterface
 from abstractions.services.inner_token import InnerTokenInterface
+from abstractions.services.job_runner import JobRunnerInterface
 from abstractions.services.liquidity_management import LiquidityManagerInterface
 from abstractions.services.math.pool_service import PoolServiceInterface
 from abstractions.services.orchestrator import OrchestratorServiceInterface
@@ -23,10 +30,14 @@ from domain.dto.chain import CreateChainDTO, UpdateChainDTO
 from domain.enums.chain_status import ChainStatus
 from domain.enums.liquidity_action import LiquidityActionType
 from domain.models.block import Block
+from domain.models.block_clock import BlockClock
 from domain.models.chain import Chain
+from domain.models.events import Event, BlockStartedEvent, BlockCompletedEvent, BalancesChangedEvent
 from domain.models.reward_model import Rewards
+from infrastructure.metrics import BLOCK_SETTLEMENT_DURATION
 from infrastructure.db.entities import BlockStatus
 from services import SingletonMeta
+from services.clock import SystemClock
 from services.exceptions import StopPairProcessingException
 from services.ton.client.base import AbstractBaseTonClient
 from settings import InnerTokenSettings
@@ -39,7 +50,7 @@ class ChainService(
     ChainServiceInterface,
     metaclass=SingletonMeta,
 ):
-    scheduler: BaseScheduler
+    job_runner: JobRunnerInterface
     block_service: BlockServiceInterface
     chain_repository: ChainRepositoryInterface
     pair_repository: PairRepositoryInterface
@@ -52,47 +63,83 @@ class ChainService(
     pool_service: PoolServiceInterface
     inner_token_service: InnerTokenInterface
     inner_token_symbol: str
+    event_publisher: EventPublisherInterface
+    block_clocks: BlockClockRegistryInterface
     block_generation_interval: timedelta = timedelta(minutes=10)
     transaction_check_interval: timedelta = timedelta(minutes=0.5)
+    transaction_check_timeout: timedelta = timedelta(seconds=25)
     connect_pool_interval: timedelta = timedelta(minutes=4)  # hours=6
+    resume_blocks: bool = True
+    archive_service: Optional[ArchiveServiceInterface] = None
+    archive_interval: timedelta = timedelta(hours=6)
+    ledger_repository: Optional[LedgerRepositoryInterface] = None
+    snapshot_interval: timedelta = timedelta(minutes=10)
+    clock: ClockInterface = field(default_factory=SystemClock)
+
+    # chain_id -> момент, когда текущий блок цепочки должен быть закрыт
+    _block_deadlines: dict[UUID, datetime] = field(default_factory=dict, init=False)
 
     async def start_block_generation(self):
         """
         Запускает процесс генерации блоков каждые 10 минут.
         """
+        self._block_deadlines.clear()
         await self._start_chains()
-        self.scheduler.start()
-        self._add_generation_job()
+        self.job_runner.start()
+        self._add_generation_job(self._next_generation_run())
         self._add_transaction_check_job()
+        self._add_archive_job()
+        self._add_snapshot_job()
         # self._add_pool_job()
         logger.info("Сервис генерации блоков запущен.")
 
-    def _add_generation_job(self):
-        self.scheduler.add_job(
+    def _add_generation_job(self, run_date: Optional[datetime] = None):
+        min_run_date = self.clock.now() + timedelta(seconds=1)
+        if run_date is None:
+            run_date = self.clock.now() + self.block_generation_interval
+        # без таймаута: отмена посреди расчёта оставит блок частично обработанным
+        self.job_runner.add_job(
+            "block_generation",
             self._generate_new_blocks,
-            trigger=DateTrigger(run_date=datetime.now() + timedelta(seconds=self.block_generation_interval.seconds)),
-            id="block_generation",
-            replace_existing=True,
-            misfire_grace_time=None,  # noqa
+            trigger=DateTrigger(run_date=max(run_date, min_run_date)),
         )
 
     def _add_pool_job(self):
-        self.scheduler.add_job(
+        self.job_runner.add_job(
+            "connect_pool",
             self._connect_pool,
-            trigger=IntervalTrigger(seconds=self.connect_pool_interval.seconds),
-            id="connect_pool",
-            replace_existing=True,
-            misfire_grace_time=None,  # noqa
+            trigger=IntervalTrigger(seconds=self.connect_pool_interval.total_seconds()),
         )
 
     def _add_transaction_check_job(self):
         logger.info('start transaction check')
-        self.scheduler.add_job(
+        self.job_runner.add_job(
+            "transaction_check",
             self.deposit_service.check_users_transactions,
-            trigger=IntervalTrigger(seconds=self.transaction_check_interval.seconds),
-            misfire_grace_time=None,  # noqa
-            id="transaction_check",
-            replace_existing=True,
+            trigger=IntervalTrigger(seconds=self.transaction_check_interval.total_seconds()),
+            timeout=self.transaction_check_timeout,
+            # опоздавшая проверка не нужна: следующая по расписанию увидит те же транзакции
+            misfire_grace_time=self.transaction_check_interval,
+        )
+
+    def _add_archive_job(self):
+        if self.archive_service is None:
+            return
+        self.job_runner.add_job(
+            "partition_maintenance",
+            self.archive_service.maintain,
+            trigger=IntervalTrigger(seconds=self.archive_interval.total_seconds()),
+            misfire_grace_time=self.archive_interval,
+        )
+
+    def _add_snapshot_job(self):
+        if self.ledger_repository is None:
+            return
+        self.job_runner.add_job(
+            "balance_snapshots",
+            self.ledger_repository.take_snapshots,
+            trigger=IntervalTrigger(seconds=self.snapshot_interval.total_seconds()),
+            misfire_grace_time=self.snapshot_interval,
         )
 
     async def _start_chains(self):
@@ -105,18 +152,71 @@ class ChainService(
         for pair in pairs:
             chain = await self.chain_repository.get_by_pair_id(pair.id)
             if not chain:
-                chain = CreateChainDTO(
+                create_chain = CreateChainDTO(
                     current_block=1,
                     pair_id=pair.id,
                     status=ChainStatus.ACTIVE,
-                    created_at=datetime.now()
+                    created_at=self.clock.now()
                 )
-                await self.chain_repository.create(chain)
+                await self.chain_repository.create(create_chain)
+                chain = await self.chain_repository.get_by_pair_id(pair.id)
                 logger.info(f"Создана новая цепочка для пары {pair.id}: {chain}")
             else:
+                if self.resume_blocks and await self._resume_chain(chain):
+                    continue
                 await self._handle_interrupted_chain(chain.id)
 
-            await self.block_service.start_new_block(chain.id)
+            clock = self.block_clocks.get_for_chain(chain)
+            block = await self.block_service.start_new_block(chain.id)
+            self._block_deadlines[chain.id] = clock.boundary_after(block.created_at)
+            await self._publish(self._get_block_started_event(chain, block, clock))
+
+    async def _resume_chain(self, chain: Chain) -> bool:
+        """
+        Подхватывает незавершённый блок цепочки после рестарта, если его слот ещё не истёк.
+        Возвращает False, если блок продолжить нельзя и его нужно прервать.
+        """
+        last_block = await self.block_service.get_last_block(chain.id)
+        if not last_block or last_block.status != BlockStatus.IN_PROGRESS:
+            return False
+
+        clock = self.block_clocks.get_for_chain(chain)
+        deadline = clock.boundary_after(last_block.created_at)
+        if deadline <= self.clock.now():
+            logger.info(f"Окно блока {last_block.id} истекло в {deadline}, блок будет прерван")
+            return False
+
+        self._block_deadlines[chain.id] = deadline
+        logger.info(f"Блок {last_block.id} цепочки {chain.id} продолжен, завершится в {deadline}")
+        await self._publish(self._get_block_started_event(chain, last_block, clock))
+        return True
+
+    def _next_generation_run(self) -> Optional[datetime]:
+        return min(self._block_deadlines.values(), default=None)
+
+    @staticmethod
+    def _get_block_started_event(chain: Chain, block: Block, clock: BlockClock) -> BlockStartedEvent:
+        return BlockStartedEvent(
+            chain_id=chain.id,
+            pair_id=chain.pair_id,
+            block_id=block.id,
+            block_number=block.block_number,
+            created_at=block.created_at,
+            ends_at=clock.boundary_after(block.created_at),
+        )
+
+    @staticmethod
+    def _get_balances_changed_event(block: Block) -> BalancesChangedEvent:
+        return BalancesChangedEvent(
+            user_ids=list({bet.user_id for bet in block.bets or []}),
+        )
+
+    async def _publish(self, *events: Event) -> None:
+        # уведомления не должны ломать обработку блоков
+        try:
+            await self.event_publisher.publish(*events)
+        except Exception:
+            logger.error('Could not publish events', exc_info=True)
 
     async def _handle_interrupted_chain(self, chain_id: UUID) -> None:
         interrupted_block = await self.block_service.get_last_block(chain_id)
@@ -127,56 +227,82 @@ class ChainService(
             raise BaseException(f'Last block ({interrupted_block.id}) in interrupted chain {chain_id} is completed')  # noqa
 
         await self.block_service.handle_interrupted_block(interrupted_block.id)
+        await self._publish(self._get_balances_changed_event(interrupted_block))
 
     async def _generate_new_blocks(self):
         """
         Генерирует новые блоки и обрабатывает завершённые блоки для всех активных цепочек.
         """
-        logger.info(f"Начало генерации блоков в {datetime.now()}.")
+        logger.info(f"Начало генерации блоков в {self.clock.now()}.")
         try:
             chains = await self.chain_repository.get_all()
             for chain in chains:
                 if chain.status == ChainStatus.PAUSED:
+                    self._block_deadlines.pop(chain.id, None)
                     continue
 
+                clock = self.block_clocks.get_for_chain(chain)
                 last_block = await self.block_service.get_last_block(chain.id)
 
                 if last_block:
-                    elapsed_time = (datetime.now() - last_block.created_at).seconds + 1
-                    # logger.info(f'elapsed_time {elapsed_time}, block {last_block.id}, status {last_block.status}')
-                    if (elapsed_time >= self.block_generation_interval.total_seconds()
-                            and last_block.status == BlockStatus.IN_PROGRESS):
+                    # блок закрывается на границе своего слота, а не через interval от фактического старта
+                    deadline = clock.boundary_after(last_block.created_at)
+                    if self.clock.now() >= deadline and last_block.status == BlockStatus.IN_PROGRESS:
+                        settlement_started = time.perf_counter()
                         try:
-                            rewards = await self._process_completed_block(last_block)
+                            completed_block, rewards = await self._process_completed_block(last_block)
                         except StopPairProcessingException:
                             await self._pause_chain(chain)
+                            self._block_deadlines.pop(chain.id, None)
                             continue
+                    elif self.clock.now() >= deadline:
+                        # просроченный дедлайн без блока в работе: без пересчёта планировщик крутился бы каждую секунду
+                        logger.error(f"Chain {chain.id} integrity is broken: last block {last_block.id} is {last_block.status}")
+                        self._block_deadlines[chain.id] = clock.boundary_after(self.clock.now())
+                        continue
                     else:
-                        # logger.error(f"Chain {chain.id} integrity is broken")
                         continue
 
                 new_block = await self.block_service.start_new_block(chain.id)
+                self._block_deadlines[chain.id] = clock.boundary_after(new_block.created_at)
+                started_event = self._get_block_started_event(chain, new_block, clock)
                 if last_block:
+                    await self._publish(
+                        BlockCompletedEvent(
+                            chain_id=chain.id,
+                            pair_id=chain.pair_id,
+                            block_id=completed_block.id,  # noqa
+                            block_number=completed_block.block_number,
+                            result_vector=completed_block.result_vector,
+                            completed_at=completed_block.completed_at,
+                        ),
+                        started_event,
+                    )
                     await self.block_service.process_completed_block(
                         block=last_block,
                         new_block_id=new_block.id,
                         rewards=rewards,  # noqa
                     )
+                    BLOCK_SETTLEMENT_DURATION.observe(time.perf_counter() - settlement_started)  # noqa
+                    await self._publish(self._get_balances_changed_event(last_block))
+                else:
+                    await self._publish(started_event)
                 update_chain = UpdateChainDTO(
                     current_block=new_block.block_number
                 )
                 await self.chain_repository.update(chain.id, update_chain)
-                self._add_generation_job()
         except Exception:
             logger.error('Something went wrong during block generation', exc_info=True)
             raise
+        finally:
+            self._add_generation_job(self._next_generation_run())
 
-    async def _process_completed_block(self, block: Block) -> Rewards:
+    async def _process_completed_block(self, block: Block) -> tuple[Block, Rewards]:
         """
         Обрабатывает завершённый блок, распределяет результаты и обновляет данные.
         """
         logger.info(f"Обработка завершённого блока {block.block_number}.")
-        await self.block_service.complete_block(block.id)
+        completed_block = await self.block_service.complete_block(block.id)
         try:
             result = await self.orchestrator_service.process_block(block_id=block.id)
         except StopPairProcessingException:
@@ -184,24 +310,37 @@ class ChainService(
             raise
 
         logger.info(f"Завершённый блок {block.block_number} успешно обработан.")
-        return result.rewards
+        return completed_block, result.rewards
 
     async def stop_block_generation(self):
         """
         Останавливает процесс генерации блоков.
+        В режиме продолжения блоки не прерываются: их подхватит следующий запущенный процесс.
         """
 
-        chains = await self.chain_repository.get_all()
-        for chain in chains:
-            await self._stop_chain(chain)
+        # идущий расчёт доводится до конца, иначе блок останется обработанным частично
+        await self.job_runner.shutdown()
+
+        if not self.resume_blocks:
+            chains = await self.chain_repository.get_all()
+            for chain in chains:
+                await self._stop_chain(chain)
 
-        # self.scheduler.remove_job("block_generation")
-        self.scheduler.shutdown()
         logger.info("Сервис генерации блоков остановлен.")
 
+    async def suspend_block_generation(self):
+        """
+        Останавливает планировщик без изменений в БД, например при потере лидерства.
+        Идущие задачи отменяются, и метод ждёт их завершения: после потери лидерства блоки
+        может рассчитывать другой воркер, и этот не должен писать в БД параллельно с ним.
+        """
+        await self.job_runner.shutdown(cancel=True)
+        logger.info("Сервис генерации блоков приостановлен.")
+
     async def _stop_chain(self, chain: Chain):
         current_block = await self.block_service.get_last_block(chain.id)
         await self.block_service.handle_interrupted_block(current_block.id)
+        await self._publish(self._get_balances_changed_event(current_block))
 
 
     async def _connect_pool(self):  # disabled
@@ -7,12 +7,14 @@ from abstractions.repositories.deposit import DepositRepositoryInterface
 from abstractions.repositories.transaction import TransactionRepositoryInterface
 from abstractions.services.app_wallet import AppWalletServiceInterface
 from abstractions.services.deposit import DepositServiceInterface
+from abstractions.services.events import EventPublisherInterface
 from abstractions.services.tonclient import TonClientInterface
 from abstractions.services.user import UserServiceInterface
 from domain.dto.deposit import DepositEntryCreateDTO
 from domain.dto.transaction import CreateTransactionDTO
 from domain.enums import TransactionType
 from domain.enums.deposit import DepositEntryStatus
+from domain.models.events import BalancesChangedEvent
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,7 @@ class DepositService(
     transaction_repository: TransactionRepositoryInterface
     user_service: UserServiceInterface
     ton_client: TonClientInterface
+    event_publisher: EventPublisherInterface
 
     async def check_users_transactions(self) -> None:
         # logger.info("check_users_transactions")
@@ -35,6 +38,7 @@ class DepositService(
         transactions = await self.ton_client.get_transactions(wallet.address)
         # logger.info("transactions")
         # logger.info(transactions)
+        funded_user_ids = set()
         if transactions:
             for transaction in transactions:
                 user = await self.user_service.get_user_by_wallet(transaction.from_address)
@@ -64,3 +68,10 @@ class DepositService(
                     # logger.info(deposit)
                     await self.deposit_repository.create(deposit)
                     await self.user_service.deposit_funded(deposit.id)
+                    funded_user_ids.add(user.id)
+
+        if funded_user_ids:
+            try:
+                await self.event_publisher.publish(BalancesChangedEvent(user_ids=list(funded_user_ids)))
+            except Exception:
+                logger.error('Could not publish funded balances', exc_info=True)
@@ -1,3 +1,4 @@
+import logging
 from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
@@ -5,20 +6,29 @@ from uuid import UUID
 from pytoniq import Address
 
 from abstractions.repositories.block import BlockRepositoryInterface
+from abstractions.repositories.ledger import LedgerRepositoryInterface
 from abstractions.repositories.transaction import TransactionRepositoryInterface
 from abstractions.repositories.user import UserRepositoryInterface
 from abstractions.services.app_wallet import AppWalletServiceInterface
+from abstractions.services.events import EventPublisherInterface
 from abstractions.services.inner_token import InnerTokenInterface
 from abstractions.services.tonclient import TonClientInterface
+from abstractions.services.versions import VersionRegistryInterface
+from domain.dto.ledger import CreateLedgerEntryDTO
 from domain.dto.transaction import CreateTransactionDTO
 from domain.enums import TransactionType
+from domain.enums.ledger import LedgerEntryType
+from domain.models.events import BalancesChangedEvent
 from services.ton.client.base import AbstractBaseTonClient
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class InnerTokenService(InnerTokenInterface):
     ton_client: TonClientInterface
     user_repository: UserRepositoryInterface
+    ledger_repository: LedgerRepositoryInterface
     block_repository: BlockRepositoryInterface
     transaction_repository: TransactionRepositoryInterface
     app_wallet_provider: AppWalletServiceInterface
@@ -26,6 +36,8 @@ class InnerTokenService(InnerTokenInterface):
     token_minter_address_str: str
 
     token_minter_address: Optional[Address] = None
+    event_publisher: Optional[EventPublisherInterface] = None
+    version_registry: Optional[VersionRegistryInterface] = None
 
     def __post_init__(self):
         self.token_minter_address = Address(self.token_minter_address_str)
@@ -58,10 +70,6 @@ class InnerTokenService(InnerTokenInterface):
             token_address=self.token_minter_address,
             app_wallet=app_wallet,
         )
-        await self.user_repository.fund_user(
-            user_id=user.id,
-            amount=amount * -1,
-        )
         tx_dto = CreateTransactionDTO(
             amount=amount,
             user_id=user_id,
@@ -69,9 +77,22 @@ class InnerTokenService(InnerTokenInterface):
             recipient=user.wallet_address,
             sender=app_wallet.address,
         )
+        await self.ledger_repository.append([CreateLedgerEntryDTO(
+            user_id=user.id,
+            type=LedgerEntryType.WITHDRAWAL,
+            amount=amount * -1,
+            reference_id=tx_dto.id,
+        )])
         await self.transaction_repository.create(
             tx_dto
         )
+        if self.version_registry is not None:
+            self.version_registry.touch_users([user_id])
+        if self.event_publisher is not None:
+            try:
+                await self.event_publisher.publish(BalancesChangedEvent(user_ids=[user_id]))
+            except Exception:
+                logger.error('Could not publish the withdrawal', exc_info=True)
 
     async def add_liquidity(self):
         ...
@@ -16,6 +16,7 @@ from abstractions.services.user import UserServiceInterface
 from domain.models.orchestrator_result import OrchestratorResult
 from domain.models.prediction import Prediction
 from domain.models.user_prediction import UserPrediction
+from infrastructure.metrics import SETTLEMENT_STAGE_DURATION
 
 logger = logging.getLogger(__name__)
 
@@ -41,8 +42,9 @@ class OrchestratorService(OrchestratorServiceInterface):
         """
         block = await self.block_service.get_block(block_id)
         # 1. Получение агрегированной ставки
-        aggregated_bets = await self.aggregate_bets_service.aggregate_bets(block.id)
-        logger.info(f"Aggregated bets: {aggregated_bets}")
+        with SETTLEMENT_STAGE_DURATION.labels('aggregate').time():
+            aggregated_bets = await self.aggregate_bets_service.aggregate_bets(block.id)
+        logger.info("Aggregated bets: %s", aggregated_bets)
         if not aggregated_bets:
             block = await self.block_repository.get(block_id)
             chain = await self.chain_repository.get(block.chain_id)
@@ -67,9 +69,10 @@ class OrchestratorService(OrchestratorServiceInterface):
         )
 
         # 3. Распределение наград
-        logger.info(f"predictions: {prediction_dto}")
-        rewards = await self.reward_service.calculate_rewards(prediction_dto)
-        logger.info(f"Rewards: {rewards}")
+        logger.debug("predictions: %s", prediction_dto)
+        with SETTLEMENT_STAGE_DURATION.labels('rewards').time():
+            rewards = await self.reward_service.calculate_rewards(prediction_dto)
+        logger.debug("Rewards: %s", rewards)
 
 
         # Stage 4: минт
@@ -78,7 +81,8 @@ class OrchestratorService(OrchestratorServiceInterface):
         # Вызываем метод минтинга
         if reward_mint > 0:
             try:
-                await self.inner_token_service.mint(amount=reward_mint)
+                with SETTLEMENT_STAGE_DURATION.labels('mint').time():
+                    await self.inner_token_service.mint(amount=reward_mint)
             except Exception as e:
                 logger.error(f"not minted {reward_mint}", exc_info=True)
 
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Callable, Optional
+
+from abstractions.services.admission import AdmissionControllerInterface
+from domain.enums.request_priority import RequestPriority
+from domain.models.pool_usage import PoolUsage
+from infrastructure.metrics import (
+    ADMISSION_REJECTED,
+    ADMISSION_SHEDDING,
+    DB_POOL_CONNECTIONS,
+    DB_POOL_UTILIZATION,
+    EVENT_LOOP_LAG,
+)
+from services import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AdmissionController(
+    AdmissionControllerInterface,
+    metaclass=SingletonMeta,
+):
+    """
+    Допуск запросов API по загрузке пула соединений и задержке event loop.
+    Запрос, которому не хватит соединения, ждёт его в очереди пула до pool_timeout,
+    а расчёт блоков в том же процессе ждёт за ним. Поэтому при перегрузке запросы сразу
+    получают 503: сначала чтения с низким приоритетом (история, свечи), затем остальные,
+    записи — только когда заняты все соединения, кроме `reserved_connections`.
+    """
+    # без пула (хранилище в памяти) загрузка считается нулевой
+    pool_usage: Optional[Callable[[], PoolUsage]] = None
+    # пул реплики; без неё чтения идут в основной пул
+    read_pool_usage: Optional[Callable[[], PoolUsage]] = None
+    reserved_connections: int = 2
+    # доля доступных запросам соединений, занятых или ожидаемых, с которой запросы отклоняются
+    low_utilization: float = 0.7
+    normal_utilization: float = 0.9
+    high_utilization: float = 1.0
+    # задержка event loop, с которой запросы отклоняются; записи по ней не отклоняются
+    low_loop_lag: timedelta = timedelta(milliseconds=100)
+    normal_loop_lag: timedelta = timedelta(milliseconds=500)
+    sample_interval: timedelta = timedelta(milliseconds=100)
+    retry_after: timedelta = timedelta(seconds=1)
+
+    _loop_lag: float = field(default=0.0, init=False)
+    _task: Optional[asyncio.Task] = field(default=None, init=False)
+
+    def admit(self, priority: RequestPriority, replica: bool = False) -> Optional[timedelta]:
+        reason = self._overload(priority, self._utilization(self._get_usage(replica)))
+        if reason is None:
+            return None
+
+        ADMISSION_REJECTED.labels(priority.value, reason).inc()
+        return self.retry_after
+
+    def _get_usage(self, replica: bool = False) -> Optional[PoolUsage]:
+        pool_usage = self.read_pool_usage if replica and self.read_pool_usage is not None else self.pool_usage
+        return pool_usage() if pool_usage is not None else None
+
+    def _utilization(self, usage: Optional[PoolUsage]) -> float:
+        if usage is None:
+            return 0.0
+        available = max(usage.capacity - self.reserved_connections, 1)
+        return (usage.checked_out + usage.waiting) / available
+
+    def _overload(self, priority: RequestPriority, utilization: float) -> Optional[str]:
+        match priority:
+            case RequestPriority.LOW:
+                max_utilization, max_loop_lag = self.low_utilization, self.low_loop_lag
+            case RequestPriority.NORMAL:
+                max_utilization, max_loop_lag = self.normal_utilization, self.normal_loop_lag
+            case _:
+                max_utilization, max_loop_lag = self.high_utilization, None
+
+        if utilization >= max_utilization:
+            return 'db_pool'
+        if max_loop_lag is not None and self._loop_lag >= max_loop_lag.total_seconds():
+            return 'event_loop'
+        return None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._sample_forever())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _sample_forever(self) -> None:
+        interval = self.sample_interval.total_seconds()
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(interval)
+            lag = max(time.perf_counter() - started - interval, 0.0)
+            # пик затухает вдвое за замер: одна короткая пауза между долгими не снимает перегрузку
+            self._loop_lag = max(lag, self._loop_lag / 2)
+            try:
+                self._publish()
+            except Exception:
+                logger.error('Could not publish the admission state', exc_info=True)
+
+    def _publish(self) -> None:
+        pools = {'primary': False}
+        if self.read_pool_usage is not None:
+            pools['replica'] = True
+        utilizations = []
+        for pool, replica in pools.items():
+            usage = self._get_usage(replica)
+            utilization = self._utilization(usage)
+            if usage is not None:
+                DB_POOL_CONNECTIONS.labels(pool, 'checked_out').set(usage.checked_out)
+                DB_POOL_CONNECTIONS.labels(pool, 'waiting').set(usage.waiting)
+                DB_POOL_CONNECTIONS.labels(pool, 'capacity').set(usage.capacity)
+            DB_POOL_UTILIZATION.labels(pool).set(utilization)
+            utilizations.append(utilization)
+        EVENT_LOOP_LAG.set(self._loop_lag)
+        # приоритет считается отсекаемым, если запросы отклоняются хотя бы по одному пулу
+        for priority in RequestPriority:
+            shedding = any(self._overload(priority, utilization) is not None for utilization in utilizations)
+            ADMISSION_SHEDDING.labels(priority.value).set(shedding)
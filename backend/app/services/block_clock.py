@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from abstractions.repositories.chain import ChainRepositoryInterface
+from abstractions.services.block_clock import BlockClockRegistryInterface
+from domain.models.block_clock import BlockClock
+from domain.models.chain import Chain
+from services import SingletonMeta
+from services.exceptions import NotFoundException
+
+
+@dataclass
+class BlockClockRegistry(
+    BlockClockRegistryInterface,
+    metaclass=SingletonMeta,
+):
+    chain_repository: ChainRepositoryInterface
+    block_generation_interval: timedelta = timedelta(minutes=10)
+
+    _clocks_by_pair_id: dict[UUID, BlockClock] = field(default_factory=dict, init=False)
+
+    def get_for_chain(self, chain: Chain) -> BlockClock:
+        clock = self._clocks_by_pair_id.get(chain.pair_id)
+        if clock is None:
+            clock = BlockClock(
+                origin=self._to_local_naive(chain.created_at),
+                interval=self.block_generation_interval,
+            )
+            self._clocks_by_pair_id[chain.pair_id] = clock
+        return clock
+
+    async def get_by_pair_id(self, pair_id: UUID) -> BlockClock:
+        clock = self._clocks_by_pair_id.get(pair_id)
+        if clock is not None:
+            return clock
+
+        chain = await self.chain_repository.get_by_pair_id(pair_id)
+        if not chain:
+            raise NotFoundException(f"Chain for pair {pair_id} not found")
+        return self.get_for_chain(chain)
+
+    @staticmethod
+    def _to_local_naive(at: datetime) -> datetime:
+        # chains.created_at is timestamptz while blocks use naive local time
+        if at.tzinfo is None:
+            return at
+        return at.astimezone().replace(tzinfo=None)
@@ -0,0 +1,101 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+from uuid import UUID
+
+from abstractions.services.block_state_cache import BlockStateCacheInterface
+from abstractions.services.clock import ClockInterface
+from domain.models.bet import BetVector
+from domain.models.block_state import CachedBlockState
+from domain.models.events import Event, BlockStartedEvent, BlockCompletedEvent
+from services import SingletonMeta
+from services.clock import SystemClock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BlockStateCache(
+    BlockStateCacheInterface,
+    metaclass=SingletonMeta,
+):
+    """
+    Состояние текущих блоков в памяти процесса API.
+    Обновляется событиями из воркера, поэтому не требует опроса БД.
+
+    Блок, время которого вышло, считается промахом: событие о следующем могло не дойти
+    (ошибка NOTIFY) или не прийти вовсе (цепочка остановлена).
+    Загрузки из БД сохраняются, только если за время загрузки по паре не было событий.
+    """
+    clock: ClockInterface = field(default_factory=SystemClock)
+    _current_blocks: dict[UUID, CachedBlockState] = field(default_factory=dict, init=False)
+    _last_result_vectors: dict[UUID, BetVector] = field(default_factory=dict, init=False)
+    _active: bool = field(default=False, init=False)
+    # поколение растёт на каждом событии и сбросе; для пары хранится поколение её последнего события
+    _generation: int = field(default=0, init=False)
+    _reset_generation: int = field(default=0, init=False)
+    _pair_generations: dict[UUID, int] = field(default_factory=dict, init=False)
+
+    def get_generation(self, pair_id: UUID) -> int:
+        return max(self._reset_generation, self._pair_generations.get(pair_id, 0))
+
+    def get_current_block(self, pair_id: UUID) -> Optional[CachedBlockState]:
+        if not self._active:
+            return None
+        state = self._current_blocks.get(pair_id)
+        if state is None or state.ends_at <= self.clock.now():
+            return None
+        return state
+
+    def set_current_block(self, pair_id: UUID, state: CachedBlockState, generation: Optional[int] = None) -> None:
+        if self._is_current(pair_id, generation):
+            self._current_blocks[pair_id] = state
+
+    def get_last_result_vector(self, pair_id: UUID) -> Optional[BetVector]:
+        if not self._active:
+            return None
+        return self._last_result_vectors.get(pair_id)
+
+    def set_last_result_vector(self, pair_id: UUID, vector: BetVector, generation: Optional[int] = None) -> None:
+        if self._is_current(pair_id, generation):
+            self._last_result_vectors[pair_id] = vector
+
+    def _is_current(self, pair_id: UUID, generation: Optional[int]) -> bool:
+        if not self._active:
+            return False
+        if generation is not None and generation != self.get_generation(pair_id):
+            logger.debug('Dropping a stale load of pair %s: an event arrived while it ran', pair_id)
+            return False
+        return True
+
+    def handle(self, event: Event) -> None:
+        match event:
+            case BlockStartedEvent():
+                self._advance(event.pair_id)
+                self.set_current_block(
+                    event.pair_id,
+                    CachedBlockState(
+                        block_id=event.block_id,
+                        block_number=event.block_number,
+                        ends_at=event.ends_at,
+                    ),
+                )
+            case BlockCompletedEvent():
+                self._advance(event.pair_id)
+                self.set_last_result_vector(event.pair_id, event.result_vector)
+
+    def _advance(self, pair_id: UUID) -> None:
+        self._generation += 1
+        self._pair_generations[pair_id] = self._generation
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._reset_generation = self._generation
+        self._pair_generations.clear()
+        self._current_blocks.clear()
+        self._last_result_vectors.clear()
+
+    def set_active(self, active: bool) -> None:
+        logger.info(f'Block state cache is {"active" if active else "inactive"}')
+        self.invalidate()
+        self._active = active
@@ -1,13 +1,57 @@
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
-from abstractions.services.block import BlockServiceInterface
+from abstractions.repositories.candle import CandleRepositoryInterface
 from abstractions.services.candle import CandleServiceInterface
+from abstractions.services.read_coalescer import ReadCoalescerInterface
+from domain.enums.candle import CandleResolution
+from domain.metaholder.responses.candle import Candle
+from domain.models.candle import Candle as CandleModel
 
 
 @dataclass
 class CandleService(CandleServiceInterface):
-    block_service: BlockServiceInterface
+    candle_repository: CandleRepositoryInterface
+    read_coalescer: ReadCoalescerInterface
 
-    async def get_n_last_blocks_by_pair_id(self, pair_id: UUID, n: int):
-        return await self.block_service.get_n_last_active_blocks_by_pair_id(pair_id=pair_id, n=n)
+    async def get_candles(
+            self,
+            pair_id: UUID,
+            resolution: CandleResolution,
+            n: int,
+            start: Optional[datetime] = None,
+            end: Optional[datetime] = None,
+    ) -> list[Candle]:
+        return await self.read_coalescer.run(
+            'candles', pair_id, (resolution, n, start, end),
+            lambda: self._load_candles(pair_id, resolution, n, start, end),
+        )
+
+    async def _load_candles(
+            self,
+            pair_id: UUID,
+            resolution: CandleResolution,
+            n: int,
+            start: Optional[datetime],
+            end: Optional[datetime],
+    ) -> list[Candle]:
+        candles = await self.candle_repository.get_range(
+            pair_id=pair_id, resolution=resolution, n=n, start=start, end=end,
+        )
+        return [self._to_response(candle) for candle in candles]
+
+    @staticmethod
+    def _to_response(candle: CandleModel) -> Candle:
+        # 7 и 11 — заглушки фронта для блока без предыдущей цены и для нулевой цены
+        return Candle(
+            opening_price=candle.open if candle.open is not None else 7,
+            closing_price=candle.close if candle.close != 0 else 11,
+            high_price=candle.high or 0,
+            low_price=candle.low or 0,
+            volume=candle.volume,
+            block_number=candle.block_number,
+            start=candle.start,
+            block_count=candle.block_count,
+        )
@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from abstractions.services.clock import ClockInterface
+
+
+@dataclass
+class SystemClock(ClockInterface):
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+@dataclass
+class VirtualClock(ClockInterface):
+    """
+    Часы симуляции: время стоит на месте, пока его явно не передвинут.
+    """
+    current: datetime = field(default_factory=datetime.now)
+
+    def now(self) -> datetime:
+        return self.current
+
+    def advance(self, delta: timedelta) -> None:
+        if delta < timedelta(0):
+            raise ValueError(f'Virtual time cannot go backwards: {delta}')
+        self.current += delta
+
+    def advance_to(self, at: datetime) -> None:
+        """
+        Переводит часы на `at`; моменты в прошлом ничего не меняют.
+        """
+        if at > self.current:
+            self.current = at
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+from uuid import UUID
+
+from abstractions.services.events import EventBroadcasterInterface, EventListenerInterface, EventPublisherInterface
+from domain.models.events import Event, BalancesChangedEvent, BetsChangedEvent
+from services import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LocalEventPublisher(EventPublisherInterface, EventListenerInterface):
+    """
+    Раздаёт события обработчикам этого же процесса, без Postgres: для симуляций и тестов.
+    Служит и слушателем: при хранилище в памяти API и генерация блоков живут в одном процессе.
+    """
+    handlers: list[Callable[[Event], None]] = field(default_factory=list)
+    connection_handlers: list[Callable[[bool], None]] = field(default_factory=list)
+
+    def subscribe(self, handler: Callable[[Event], None]) -> None:
+        self.handlers.append(handler)
+
+    def on_connection_change(self, handler: Callable[[bool], None]) -> None:
+        self.connection_handlers.append(handler)
+
+    async def start(self) -> None:
+        # события не теряются, но подписчики ждут сигнала, чтобы начать им доверять
+        for handler in self.connection_handlers:
+            handler(True)
+
+    async def stop(self) -> None:
+        for handler in self.connection_handlers:
+            handler(False)
+
+    async def publish(self, *events: Event) -> None:
+        for event in events:
+            for handler in self.handlers:
+                handler(event)
+
+
+@dataclass
+class EventBroadcaster(
+    EventBroadcasterInterface,
+    metaclass=SingletonMeta,
+):
+    """
+    Раздаёт события подключённым клиентам этого процесса.
+    Изменения балансов и ставок уходят только их владельцам.
+    """
+    queue_size: int = 100
+
+    _subscribers: dict[asyncio.Queue, Optional[UUID]] = field(default_factory=dict, init=False)
+
+    def subscribe(self, user_id: Optional[UUID]) -> asyncio.Queue[Event]:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[queue] = user_id
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[Event]) -> None:
+        self._subscribers.pop(queue, None)
+
+    def handle(self, event: Event) -> None:
+        if isinstance(event, (BalancesChangedEvent, BetsChangedEvent)):
+            user_ids = set(event.user_ids)
+            for queue, user_id in self._subscribers.items():
+                if user_id in user_ids:
+                    self._put(queue, type(event)(user_ids=[user_id]))
+            return
+
+        for queue in self._subscribers:
+            self._put(queue, event)
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, event: Event) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # slow client: drop the event, it will catch up on the next one
+            logger.warning(f'Event queue is full, dropping {event.type}')
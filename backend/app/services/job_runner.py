@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+from apscheduler.events import EVENT_JOB_SUBMITTED, JobSubmissionEvent
+from apscheduler.schedulers.base import BaseScheduler
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.triggers.date import DateTrigger
+
+from abstractions.services.job_runner import JobRunnerInterface
+from infrastructure.db.instrumentation import QueryStats, report_repeated_queries, track_queries
+from infrastructure.metrics import JOB_DURATION, JOB_LAG, JOB_RUNS
+from services import SingletonMeta
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _JobState:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    failures: int = 0
+    retry_at: Optional[datetime] = None
+    scheduled_at: Optional[datetime] = None
+
+
+@dataclass
+class JobRunner(
+    JobRunnerInterface,
+    metaclass=SingletonMeta,
+):
+    scheduler: BaseScheduler
+    backoff_base: timedelta = timedelta(seconds=5)
+    backoff_max: timedelta = timedelta(minutes=5)
+    backoff_jitter: float = 0.2
+    # через сколько повторить одноразовую задачу, пропущенную из-за ещё идущего запуска
+    overlap_retry: timedelta = timedelta(seconds=1)
+    # отчёт о повторяющихся запросах (возможный N+1) только в debug-режиме
+    collect_query_shapes: bool = False
+    repeated_query_threshold: int = 5
+
+    _jobs: dict[str, _JobState] = field(default_factory=dict, init=False)
+    _running: set[asyncio.Task] = field(default_factory=set, init=False)
+
+    def __post_init__(self):
+        self.scheduler.add_listener(self._on_job_submitted, EVENT_JOB_SUBMITTED)
+
+    def add_job(
+            self,
+            job_id: str,
+            func: Callable[[], Awaitable[Any]],
+            trigger: BaseTrigger,
+            timeout: Optional[timedelta] = None,
+            misfire_grace_time: Optional[timedelta] = None,
+    ) -> None:
+        self._jobs.setdefault(job_id, _JobState())
+        self.scheduler.add_job(
+            self._run,
+            trigger=trigger,
+            args=(job_id, func, timeout),
+            id=job_id,
+            replace_existing=True,
+            coalesce=True,
+            # перекрытие отсекается в _run: планировщик не должен молча терять одноразовые задачи
+            max_instances=3,
+            misfire_grace_time=math.ceil(misfire_grace_time.total_seconds()) if misfire_grace_time else None,
+        )
+
+    def remove_job(self, job_id: str) -> None:
+        if self.scheduler.get_job(job_id):
+            self.scheduler.remove_job(job_id)
+
+    @property
+    def running(self) -> bool:
+        return self.scheduler.running
+
+    def start(self) -> None:
+        self.scheduler.start()
+
+    async def shutdown(self, cancel: bool = False) -> None:
+        # остановка исполнителя APScheduler отменяет идущие корутины: сначала новых запусков
+        # больше нет, идущие задачи доводятся до конца (или отменяются), потом остановка
+        if self.scheduler.running:
+            self.scheduler.pause()
+        tasks = list(self._running)
+        if cancel:
+            for task in tasks:
+                task.cancel()
+        if tasks:
+            logger.info(f'Waiting for {len(tasks)} running job(s), cancel={cancel}')
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+
+    def _on_job_submitted(self, event: JobSubmissionEvent) -> None:
+        state = self._jobs.get(event.job_id)
+        if state and event.scheduled_run_times:
+            state.scheduled_at = event.scheduled_run_times[-1]
+
+    async def _run(
+            self,
+            job_id: str,
+            func: Callable[[], Awaitable[Any]],
+            timeout: Optional[timedelta],
+    ) -> None:
+        state = self._jobs.setdefault(job_id, _JobState())
+        now = datetime.now(timezone.utc)
+        if state.scheduled_at:
+            JOB_LAG.labels(job_id).observe(max(0.0, (now - state.scheduled_at).total_seconds()))
+            state.scheduled_at = None
+
+        if state.lock.locked():
+            logger.warning(f'Job {job_id} is still running, skipping this run')
+            JOB_RUNS.labels(job_id, 'skipped').inc()
+            self._reschedule_if_dropped(job_id, func, timeout, now + self.overlap_retry)
+            return
+
+        if state.retry_at and now < state.retry_at:
+            JOB_RUNS.labels(job_id, 'backoff').inc()
+            self._reschedule_if_dropped(job_id, func, timeout, state.retry_at)
+            return
+
+        task = asyncio.current_task()
+        self._running.add(task)
+        try:
+            async with state.lock:
+                with track_queries(self.collect_query_shapes) as stats:
+                    await self._execute(job_id, state, func, timeout)
+                self._report_queries(job_id, stats)
+        finally:
+            self._running.discard(task)
+
+    async def _execute(
+            self,
+            job_id: str,
+            state: _JobState,
+            func: Callable[[], Awaitable[Any]],
+            timeout: Optional[timedelta],
+    ) -> None:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(func(), timeout.total_seconds() if timeout else None)
+        except asyncio.CancelledError:
+            JOB_RUNS.labels(job_id, 'cancelled').inc()
+            logger.warning(f'Job {job_id} was cancelled')
+            raise
+        except asyncio.TimeoutError:
+            self._on_failure(job_id, state, 'timeout')
+            logger.error(f'Job {job_id} timed out after {timeout}, retry at {state.retry_at}')
+        except Exception:
+            self._on_failure(job_id, state, 'error')
+            logger.error(f'Job {job_id} failed {state.failures} time(s), retry at {state.retry_at}', exc_info=True)
+        else:
+            state.failures = 0
+            state.retry_at = None
+            JOB_RUNS.labels(job_id, 'success').inc()
+        finally:
+            JOB_DURATION.labels(job_id).observe(time.perf_counter() - started)
+
+    def _report_queries(self, job_id: str, stats: QueryStats) -> None:
+        db_time_ms = round(stats.duration * 1000, 2)
+        logger.debug(
+            f'Job {job_id}: {stats.count} queries, {db_time_ms} ms in DB',
+            extra={'job': job_id, 'db_query_count': stats.count, 'db_time_ms': db_time_ms},
+        )
+        if self.collect_query_shapes:
+            report_repeated_queries(f'job {job_id}', stats, self.repeated_query_threshold)
+
+    def _on_failure(self, job_id: str, state: _JobState, outcome: str) -> None:
+        JOB_RUNS.labels(job_id, outcome).inc()
+        state.failures += 1
+        state.retry_at = datetime.now(timezone.utc) + self._get_backoff(state.failures)
+
+    def _get_backoff(self, failures: int) -> timedelta:
+        backoff = min(self.backoff_base * 2 ** (failures - 1), self.backoff_max)
+        # разброс, чтобы задачи нескольких процессов не повторялись синхронно
+        return backoff * random.uniform(1 - self.backoff_jitter, 1 + self.backoff_jitter)
+
+    def _reschedule_if_dropped(
+            self,
+            job_id: str,
+            func: Callable[[], Awaitable[Any]],
+            timeout: Optional[timedelta],
+            run_date: datetime,
+    ) -> None:
+        # у интервальных задач уже есть следующий запуск, одноразовую переносим, иначе она потеряется
+        if self.scheduler.get_job(job_id):
+            return
+        self.add_job(job_id, func, DateTrigger(run_date=run_date), timeout=timeout)
@@ -0,0 +1,101 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from abstractions.repositories.leaderboard import LeaderboardRepositoryInterface
+from abstractions.services.clock import ClockInterface
+from abstractions.services.leaderboard import LeaderboardServiceInterface
+from domain.enums.leaderboard import LeaderboardMetric, LeaderboardPeriod
+from domain.metaholder.responses.leaderboard import LeaderboardEntryResponse, LeaderboardResponse
+from domain.models.events import BalancesChangedEvent, Event
+from domain.models.leaderboard import LeaderboardEntry, period_start
+from services import SingletonMeta
+from services.clock import SystemClock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LeaderboardService(
+    LeaderboardServiceInterface,
+    metaclass=SingletonMeta,
+):
+    """
+    Таблицы лидеров пар. Первые `max_limit` строк каждой таблицы кэшируются на `cache_ttl`
+    и сбрасываются событием о расчёте блока; место пользователя читается из БД на каждый запрос.
+    """
+    leaderboard_repository: LeaderboardRepositoryInterface
+    cache_ttl: timedelta = timedelta(seconds=30)
+    max_limit: int = 100
+    clock: ClockInterface = field(default_factory=SystemClock)
+    # по началу периода: после его смены таблица прошлого периода не отдаётся вместе с местом в новом
+    _top: dict[
+        tuple[UUID, LeaderboardPeriod, LeaderboardMetric, datetime],
+        tuple[datetime, list[LeaderboardEntry]],
+    ] = field(default_factory=dict, init=False)
+    # растёт при каждом сбросе: таблица, прочитанная до сброса, не попадает в кэш после него
+    _generation: int = field(default=0, init=False)
+
+    async def get_leaderboard(
+            self,
+            pair_id: UUID,
+            period: LeaderboardPeriod,
+            metric: LeaderboardMetric,
+            limit: int,
+            user_id: Optional[UUID] = None,
+    ) -> LeaderboardResponse:
+        now = self.clock.now()
+        entries = await self._get_top(pair_id, period, metric, now)
+        me = None
+        if user_id is not None:
+            me = await self.leaderboard_repository.get_entry(
+                pair_id=pair_id, period=period, metric=metric, at=now, user_id=user_id,
+            )
+        return LeaderboardResponse(
+            pair_id=pair_id,
+            period=period,
+            metric=metric,
+            entries=[self._to_response(entry) for entry in entries[:min(limit, self.max_limit)]],
+            me=self._to_response(me) if me else None,
+        )
+
+    async def _get_top(
+            self,
+            pair_id: UUID,
+            period: LeaderboardPeriod,
+            metric: LeaderboardMetric,
+            now: datetime,
+    ) -> list[LeaderboardEntry]:
+        key = (pair_id, period, metric, period_start(period, now))
+        cached = self._top.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        generation = self._generation
+        entries = await self.leaderboard_repository.get_top(
+            pair_id=pair_id, period=period, metric=metric, at=now, limit=self.max_limit,
+        )
+        if generation == self._generation:
+            self._top[key] = (now + self.cache_ttl, entries)
+        return entries
+
+    def handle(self, event: Event) -> None:
+        # публикуется после записи наград блока в таблицы
+        match event:
+            case BalancesChangedEvent():
+                self.invalidate()
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._top.clear()
+
+    @staticmethod
+    def _to_response(entry: LeaderboardEntry) -> LeaderboardEntryResponse:
+        return LeaderboardEntryResponse(
+            rank=entry.rank,
+            user_id=entry.user_id,
+            total_reward=entry.total_reward,
+            accuracy=entry.accuracy,
+            bet_count=entry.resolved_count,
+        )
@@ -12,11 +12,37 @@ logger = logging.getLogger(__name__)
 @dataclass
 class AggregateBetsService(AggregateBetsServiceInterface):
     block_repository: BlockRepositoryInterface
+    # суммировать ставки в базе, не загружая блок со ставками и парами
+    in_database: bool = False
 
     async def aggregate_bets(
             self,
             block_id: UUID,
     ) -> BetVector:
+        if self.in_database:
+            aggregate = await self.block_repository.get_bets_aggregate(block_id)
+            total_weight = aggregate.total_stake
+            aggregate_x = aggregate.weighted_price
+            aggregate_y = aggregate.weighted_tx_count
+            bets_count = aggregate.count
+        else:
+            total_weight, aggregate_x, aggregate_y, bets_count = await self._sum_loaded_bets(block_id)
+
+        if total_weight > 0:
+            # цена делится ещё и на число ставок — так считалось всегда, режимы не должны расходиться
+            aggregate_x /= total_weight * bets_count
+            aggregate_y /= total_weight
+        else:
+            aggregate_x = 0
+            aggregate_y = 0
+
+        aggregated_quaternion = aggregate_x, aggregate_y  # todo: aa
+
+        logger.info('Block %s aggregated over %s bets: %s', block_id, bets_count, aggregated_quaternion)
+
+        return aggregated_quaternion
+
+    async def _sum_loaded_bets(self, block_id: UUID) -> tuple[float, float, float, int]:
         block = await self.block_repository.get(block_id)
 
         total_weight = 0
@@ -28,29 +54,9 @@ class AggregateBetsService(AggregateBetsServiceInterface):
             total_weight += weight
             aggregate_x += bet.vector[0] * weight
             aggregate_y += bet.vector[1] * weight
-            logger.info("weight")
-            logger.info(weight)
-            logger.info("total_weight")
-            logger.info(total_weight)
-            logger.info("aggregate_x")
-            logger.info(aggregate_x)
-            logger.info("aggregate_y")
-            logger.info(aggregate_y)
+            logger.debug(
+                'bet %s: weight=%s total_weight=%s aggregate_x=%s aggregate_y=%s',
+                bet.id, weight, total_weight, aggregate_x, aggregate_y,
+            )
 
-        if total_weight > 0:
-            aggregate_x /= total_weight * len(block.bets)
-            aggregate_y /= total_weight
-            logger.info(aggregate_x)
-            logger.info("aggregate_x")
-            logger.info(aggregate_y)
-            logger.info("aggregate_y")
-        else:
-            aggregate_x = 0
-            aggregate_y = 0
-
-        aggregated_quaternion = aggregate_x, aggregate_y  # todo: aa
-
-        logger.info("aggregated_quaternion")
-        logger.info(aggregated_quaternion)
-
-        return aggregated_quaternion
+        return total_weight, aggregate_x, aggregate_y, len(block.bets)
@@ -38,7 +38,7 @@ class RewardDistributionService(RewardDistributionServiceInterface):
         user_accuracies = {}
 
         for user_prediction in prediction.user_predictions:
-            logger.info(f"up: {user_prediction}")
+            logger.debug("up: %s", user_prediction)
             price_accuracy = self._calculate_accuracy_coefficient(
                 user_prediction.predicted_price_change, prediction.actual_price_change
             )
@@ -48,7 +48,7 @@ class RewardDistributionService(RewardDistributionServiceInterface):
             accuracy = (price_accuracy + tx_accuracy) / 2
             user_accuracies[user_prediction.user_id] = accuracy
             total_accuracy += accuracy * user_prediction.stake
-            logger.info(f"up stats: accuracy {accuracy} (price: {price_accuracy} tx: {tx_accuracy})")
+            logger.debug("up stats: accuracy %s (price: %s tx: %s)", accuracy, price_accuracy, tx_accuracy)
 
         if total_accuracy == 0:
             return Rewards(
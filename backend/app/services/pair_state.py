@@ -0,0 +1,107 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+from uuid import UUID
+
+from abstractions.repositories.bet import BetRepositoryInterface
+from abstractions.repositories.chain import ChainRepositoryInterface
+from abstractions.services.block import BlockServiceInterface
+from abstractions.services.candle import CandleServiceInterface
+from abstractions.services.clock import ClockInterface
+from abstractions.services.pair_state import PairStateServiceInterface
+from domain.enums.candle import CandleResolution
+from domain.enums.chain_status import ChainStatus
+from domain.metaholder.responses import BetResponse
+from domain.metaholder.responses.candle import Candle
+from domain.metaholder.responses.pair_state import PairStateResponse, PairsStateResponse
+from domain.models.bet import Bet
+from domain.models.events import BlockCompletedEvent, Event
+from services import SingletonMeta
+from services.clock import SystemClock
+from services.exceptions import NotFoundException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PairStateService(
+    PairStateServiceInterface,
+    metaclass=SingletonMeta,
+):
+    """
+    Состояние всех активных пар одним ответом для старта мини-приложения.
+    Блок и последний результат берутся из кэша состояния блоков, последняя свеча кэшируется здесь
+    до расчёта следующего блока пары; из БД на каждый запрос читаются только цепочки и ставки пользователя.
+    """
+    chain_repository: ChainRepositoryInterface
+    bet_repository: BetRepositoryInterface
+    block_service: BlockServiceInterface
+    candle_service: CandleServiceInterface
+    clock: ClockInterface = field(default_factory=SystemClock)
+
+    _last_candles: dict[UUID, Optional[Candle]] = field(default_factory=dict, init=False)
+    # идущие загрузки свечи: событие пары снимает отметку, и устаревший результат не сохраняется
+    _loads: dict[UUID, object] = field(default_factory=dict, init=False)
+    _active: bool = field(default=False, init=False)
+
+    async def get_pairs_state(self, user_id: Optional[UUID] = None) -> PairsStateResponse:
+        chains = [chain for chain in await self.chain_repository.get_all() if chain.status == ChainStatus.ACTIVE]
+
+        pending_bets: dict[UUID, Bet] = {}
+        if user_id is not None:
+            # от новых к старым: в паре остаётся последняя ставка
+            for bet in await self.bet_repository.get_pending_user_bets(user_id):
+                pending_bets.setdefault(bet.pair.id, bet)
+
+        pairs = []
+        for chain in chains:
+            try:
+                block = await self.block_service.get_current_block_state(chain.pair_id)
+            except NotFoundException:
+                block = None
+            bet = pending_bets.get(chain.pair_id)
+            pairs.append(PairStateResponse(
+                pair_id=chain.pair_id,
+                block=block,
+                last_vector=await self.block_service.get_last_result_vector(chain.pair_id),
+                last_candle=await self._get_last_candle(chain.pair_id),
+                pending_bet=self._to_bet_response(bet) if bet else None,
+            ))
+        return PairsStateResponse(server_time=self.clock.now(), pairs=pairs)
+
+    async def _get_last_candle(self, pair_id: UUID) -> Optional[Candle]:
+        if self._active and pair_id in self._last_candles:
+            return self._last_candles[pair_id]
+        load = self._loads[pair_id] = object()
+        candles = await self.candle_service.get_candles(pair_id=pair_id, resolution=CandleResolution.BLOCK, n=1)
+        candle = candles[0] if candles else None
+        if self._loads.get(pair_id) is load:
+            del self._loads[pair_id]
+            if self._active:
+                self._last_candles[pair_id] = candle
+        return candle
+
+    @staticmethod
+    def _to_bet_response(bet: Bet) -> BetResponse:
+        return BetResponse(
+            id=bet.id,
+            amount=bet.amount,
+            vector=bet.vector,
+            pair_name=bet.pair.name,
+            status=bet.status.value,
+            reward=bet.reward,
+            accuracy=bet.accuracy,
+            created_at=bet.created_at,
+        )
+
+    def handle(self, event: Event) -> None:
+        match event:
+            case BlockCompletedEvent():
+                # свеча блока записывается до публикации события
+                self._last_candles.pop(event.pair_id, None)
+                self._loads.pop(event.pair_id, None)
+
+    def set_active(self, active: bool) -> None:
+        self._last_candles.clear()
+        self._loads.clear()
+        self._active = active
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+from uuid import UUID
+
+from abstractions.services.clock import ClockInterface
+from abstractions.services.read_coalescer import ReadCoalescerInterface
+from domain.models.events import BlockCompletedEvent, BlockStartedEvent, Event
+from infrastructure.metrics import COALESCED_READS
+from services import SingletonMeta
+from services.clock import SystemClock
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+_Key = tuple[Optional[UUID], str, Hashable]
+
+
+@dataclass
+class ReadCoalescer(
+    ReadCoalescerInterface,
+    metaclass=SingletonMeta,
+):
+    """
+    Общие чтения процесса API. На смене блока тысячи клиентов запрашивают одно и то же
+    в одну секунду: в БД уходит один запрос на ключ, остальные ждут его результат,
+    который ещё `ttl` отдаётся из памяти. События о блоках пары сбрасывают её чтения сразу,
+    без событий данные устаревают не больше чем на `ttl`.
+    """
+    ttl: timedelta = timedelta(seconds=1)
+    max_entries: int = 10_000
+    clock: ClockInterface = field(default_factory=SystemClock)
+    _in_flight: dict[_Key, asyncio.Task] = field(default_factory=dict, init=False)
+    _cached: dict[_Key, tuple[datetime, Any]] = field(default_factory=dict, init=False)
+
+    async def run(
+            self,
+            name: str,
+            pair_id: Optional[UUID],
+            params: Hashable,
+            load: Callable[[], Awaitable[T]],
+    ) -> T:
+        key = (pair_id, name, params)
+        cached = self._cached.get(key)
+        if cached is not None and cached[0] > self.clock.now():
+            COALESCED_READS.labels(name, 'cached').inc()
+            return cached[1]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            COALESCED_READS.labels(name, 'loaded').inc()
+            task = asyncio.ensure_future(load())
+            self._in_flight[key] = task
+            task.add_done_callback(partial(self._store, key))
+        else:
+            COALESCED_READS.labels(name, 'joined').inc()
+        # отключившийся клиент не отменяет запрос, который ждут остальные
+        return await asyncio.shield(task)
+
+    def _store(self, key: _Key, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is not task:
+            # чтение сброшено событием, пока шёл запрос: результат мог устареть
+            return
+        del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        now = self.clock.now()
+        if len(self._cached) >= self.max_entries:
+            self._cached = {cached: entry for cached, entry in self._cached.items() if entry[0] > now}
+            if len(self._cached) >= self.max_entries:
+                logger.warning('Read cache is full with %s entries, dropping it', len(self._cached))
+                self._cached.clear()
+        self._cached[key] = (now + self.ttl, task.result())
+
+    def handle(self, event: Event) -> None:
+        match event:
+            case BlockStartedEvent() | BlockCompletedEvent():
+                self._invalidate_pair(event.pair_id)
+
+    def _invalidate_pair(self, pair_id: UUID) -> None:
+        for key in [key for key in self._cached if key[0] == pair_id]:
+            del self._cached[key]
+        for key in [key for key in self._in_flight if key[0] == pair_id]:
+            del self._in_flight[key]
+
+    def invalidate(self) -> None:
+        self._cached.clear()
+        self._in_flight.clear()
@@ -1,20 +1,38 @@
 import logging
+import time
 from dataclasses import dataclass
+from functools import wraps
 
 from pytoniq_core import Address
 
 from abstractions.services.tonclient import TonClientInterface, Nano
 from domain.models.app_wallet import AppWalletWithPrivateData
+from infrastructure.metrics import TON_CALL_DURATION
 from services.ton.client.base import AbstractBaseTonClient
 
 logger = logging.getLogger(__name__)
 
 
+def _timed(func):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        started, outcome = time.perf_counter(), 'error'
+        try:
+            result = await func(*args, **kwargs)
+            outcome = 'success'
+            return result
+        finally:
+            TON_CALL_DURATION.labels(func.__name__, outcome).observe(time.perf_counter() - started)
+
+    return wrapper
+
+
 @dataclass
 class MainTonClient(AbstractBaseTonClient):
     ton_client: TonClientInterface
     ton_api_client: TonClientInterface
 
+    @_timed
     async def provide_liquidity(
             self,
             ton_amount: float,
@@ -25,11 +43,13 @@ class MainTonClient(AbstractBaseTonClient):
         await self.ton_client.provide_liquidity(ton_amount=ton_amount, jetton_amount=jetton_amount,
                                                 admin_wallet=admin_wallet, pool_address=pool_address)
 
+    @_timed
     async def remove_liquidity(self, ton_amount: float, jetton_amount: float, admin_wallet: AppWalletWithPrivateData,
                                pool_address: str) -> None:
         await self.ton_client.remove_liquidity(ton_amount=ton_amount, jetton_amount=jetton_amount,
                                                admin_wallet=admin_wallet, pool_address=pool_address)
 
+    @_timed
     async def get_pool_reserves(self, pool_address: Address) -> tuple[float, float]:
         try:
             return await self.ton_client.get_pool_reserves(pool_address=pool_address)
@@ -37,19 +57,24 @@ class MainTonClient(AbstractBaseTonClient):
             logger.error("excepted", exc_info=True)
             return await self.ton_api_client.get_pool_reserves(pool_address=pool_address.to_str())
 
+    @_timed
     async def get_jetton_wallet_address(self, contract_address: Address, target_address: Address) -> Address:
         return await self.ton_client.get_jetton_wallet_address(contract_address=contract_address,
                                                                target_address=target_address)
 
+    @_timed
     async def get_public_key(self, address: str):
         return await self.ton_api_client.get_public_key(address)
 
+    @_timed
     async def get_current_pool_state(self):
         return await self.ton_api_client.get_current_pool_state()
 
+    @_timed
     async def get_transactions(self, address: str):
         return await self.ton_api_client.get_transactions(address)
 
+    @_timed
     async def send_jettons(
             self,
             user_wallet_address: Address,
@@ -59,9 +84,11 @@ class MainTonClient(AbstractBaseTonClient):
     ) -> None:
         return await self.ton_client.send_jettons(user_wallet_address, amount, token_address, app_wallet)
 
+    @_timed
     async def mint(self, amount: Nano, token_address: Address, admin_wallet: AppWalletWithPrivateData):
         return await self.ton_client.mint(amount, token_address, admin_wallet)
 
+    @_timed
     async def get_wallet_address(
             self,
             contract_address: Address,
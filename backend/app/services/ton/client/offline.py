@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from pytoniq_core import Address
+
+from abstractions.services.tonclient import Nano
+from domain.models.app_wallet import AppWalletWithPrivateData
+from domain.ton.transaction import TonTransaction
+from services import SingletonMeta
+from services.ton.client.base import AbstractBaseTonClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OfflineTonClient(
+    AbstractBaseTonClient,
+    metaclass=SingletonMeta,
+):
+    """
+    Клиент без сети для нагрузочных тестов и симуляций: операции только имитируют задержку,
+    входящие транзакции подкладываются через add_incoming_transaction.
+    """
+    latency: timedelta = timedelta(0)
+    pool_reserves: tuple[float, float] = (1_000_000.0, 1_000_000.0)
+
+    _incoming: list[TonTransaction] = field(default_factory=list, init=False)
+    minted: int = field(default=0, init=False)
+    sent: int = field(default=0, init=False)
+
+    def add_incoming_transaction(self, transaction: TonTransaction) -> None:
+        self._incoming.append(transaction)
+
+    async def mint(self, amount: Nano, token_address: Address, admin_wallet: AppWalletWithPrivateData) -> None:
+        await self._simulate_latency()
+        self.minted += amount
+
+    async def send_jettons(
+            self,
+            user_wallet_address: Address,
+            amount: Nano,
+            token_address: Address,
+            app_wallet: AppWalletWithPrivateData,
+    ) -> None:
+        await self._simulate_latency()
+        self.sent += amount
+
+    async def provide_liquidity(
+            self,
+            ton_amount: Nano,
+            jetton_amount: Nano,
+            admin_wallet: AppWalletWithPrivateData,
+            pool_address: str,
+    ) -> None:
+        await self._simulate_latency()
+
+    async def remove_liquidity(
+            self,
+            ton_amount: Nano,
+            jetton_amount: Nano,
+            admin_wallet: AppWalletWithPrivateData,
+            pool_address: str,
+    ) -> None:
+        await self._simulate_latency()
+
+    async def get_pool_reserves(self, pool_address: Address | str) -> tuple[float, float]:
+        await self._simulate_latency()
+        return self.pool_reserves
+
+    async def get_jetton_wallet_address(self, contract_address: Address, target_address: Address) -> Address:
+        await self._simulate_latency()
+        return target_address
+
+    async def get_wallet_address(self, contract_address: Address, target_address: Address) -> Address:
+        return await self.get_jetton_wallet_address(contract_address, target_address)
+
+    async def get_public_key(self, address: str) -> str:
+        await self._simulate_latency()
+        return '00' * 32
+
+    async def get_transactions(self, address: str) -> list[TonTransaction]:
+        await self._simulate_latency()
+        # как и tonapi с сохранённым lt, каждая транзакция отдаётся один раз
+        transactions, self._incoming = self._incoming, []
+        return transactions
+
+    async def get_current_pool_state(self) -> dict[str, float]:
+        await self._simulate_latency()
+        return {'X': self.pool_reserves[0], 'TON': self.pool_reserves[1]}
+
+    async def _simulate_latency(self) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency.total_seconds())
@@ -7,16 +7,27 @@ from pytoniq_core import Address
 from sqlalchemy.exc import NoResultFound
 
 from abstractions.repositories.deposit import DepositRepositoryInterface
+from abstractions.repositories.ledger import LedgerRepositoryInterface
+from abstractions.repositories.user_stats import UserStatsRepositoryInterface
 from abstractions.repositories.user import UserRepositoryInterface
 from abstractions.services.block import BlockServiceInterface
 from abstractions.services.currency import CurrencyServiceInterface
 from abstractions.services.user import UserServiceInterface
+from domain.dto.ledger import CreateLedgerEntryDTO
 from domain.dto.user import CreateUserDTO
 from domain.enums.deposit import DepositEntryStatus
+from domain.enums.ledger import LedgerEntryType
 from domain.metaholder.enums import BetStatus as MetaholderBetStatus
 from domain.metaholder.responses import TransactionResponse, BetResponse
-from domain.metaholder.responses.user import UserBetsResponse, UserHistoryResponse
+from domain.metaholder.responses.user import (
+    UserBetsResponse,
+    UserHistoryResponse,
+    UserInfoResponse,
+    UserPairStatsResponse,
+    UserStatsResponse,
+)
 from domain.models import User
+from domain.models.user_stats import UserStats
 from services.exceptions import NotFoundException, NoSuchUserException
 
 logger = logging.getLogger(__name__)
@@ -27,6 +38,8 @@ class UserService(UserServiceInterface):
     user_repository: UserRepositoryInterface
     block_service: BlockServiceInterface
     deposit_repository: DepositRepositoryInterface
+    ledger_repository: LedgerRepositoryInterface
+    user_stats_repository: UserStatsRepositoryInterface
     currency_service: CurrencyServiceInterface
 
     async def ensure_user(self, wallet_address: str) -> None:
@@ -41,7 +54,7 @@ class UserService(UserServiceInterface):
             await self.user_repository.create(dto)
 
     async def get_user_bets(self, user_id: UUID) -> UserBetsResponse:
-        user = await self.user_repository.get(user_id)
+        user = await self.user_repository.get_history(user_id)
         return UserBetsResponse(
             user_id=user.id,
             bets=[
@@ -56,8 +69,39 @@ class UserService(UserServiceInterface):
             ]
         )
 
+    async def get_user_info(self, user_id: UUID) -> UserInfoResponse:
+        if not await self.user_repository.exists(user_id):
+            raise NotFoundException(f"User with ID {user_id} not found.")
+        stats = await self.user_stats_repository.get(user_id) or UserStats(user_id=user_id)
+        return UserInfoResponse(
+            user_id=user_id,
+            balance=await self.ledger_repository.get_balance(user_id),
+            at_risk=stats.pending_stake,
+            total_staked=stats.total_staked,
+            total_reward=stats.total_reward,
+            bet_count=stats.bet_count,
+            accuracy=stats.accuracy,
+        )
+
+    async def get_user_stats(self, user_id: UUID) -> UserStatsResponse:
+        if not await self.user_repository.exists(user_id):
+            raise NotFoundException(f"User with ID {user_id} not found.")
+        return UserStatsResponse(
+            user_id=user_id,
+            pairs=[
+                UserPairStatsResponse(
+                    pair_id=stats.pair_id,
+                    at_risk=stats.pending_stake,
+                    total_staked=stats.total_staked,
+                    total_reward=stats.total_reward,
+                    bet_count=stats.bet_count,
+                    accuracy=stats.accuracy,
+                ) for stats in await self.user_stats_repository.get_by_pairs(user_id)
+            ],
+        )
+
     async def get_user_history(self, user_id: UUID) -> UserHistoryResponse:
-        user = await self.user_repository.get(user_id)
+        user = await self.user_repository.get_history(user_id)
         return UserHistoryResponse(
             user_id=user_id,
             transactions=[
@@ -89,4 +133,9 @@ class UserService(UserServiceInterface):
             convert = await self.currency_service.convert_ton_to_inner_token(deposit.amount)
             logger.info("convert")
             logger.info(convert)
-            await self.user_repository.fund_user(deposit.user_id, convert)
+            await self.ledger_repository.append([CreateLedgerEntryDTO(
+                user_id=deposit.user_id,
+                type=LedgerEntryType.DEPOSIT,
+                amount=convert,
+                reference_id=deposit.id,
+            )])
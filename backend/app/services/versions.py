@@ -0,0 +1,73 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, Optional
+from uuid import UUID, uuid4
+
+from abstractions.services.clock import ClockInterface
+from abstractions.services.versions import VersionRegistryInterface
+from domain.models.events import BalancesChangedEvent, BetsChangedEvent, BlockStartedEvent, Event
+from domain.models.version import Version
+from services import SingletonMeta
+from services.clock import SystemClock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VersionRegistry(
+    VersionRegistryInterface,
+    metaclass=SingletonMeta,
+):
+    """
+    Версии ответов для условных GET, без запросов к БД.
+
+    Свечи и векторы пары меняются, только когда завершается блок, а событие о начале следующего
+    приходит после записи результата: версия пары — номер текущего блока из этого события.
+    Версия пользователя — счётчик событий о его балансе и ставках и записей этого процесса; эпоха
+    меняется при каждом подключении слушателя, поэтому счётчики другого процесса
+    или до разрыва соединения с ней не совпадут.
+    """
+    clock: ClockInterface = field(default_factory=SystemClock)
+    _pairs: dict[UUID, Version] = field(default_factory=dict, init=False)
+    _users: dict[UUID, tuple[int, datetime]] = field(default_factory=dict, init=False)
+    _epoch: str = field(default='', init=False)
+    _activated_at: Optional[datetime] = field(default=None, init=False)
+    _active: bool = field(default=False, init=False)
+
+    def get_pair_version(self, pair_id: UUID) -> Optional[Version]:
+        if not self._active:
+            return None
+        return self._pairs.get(pair_id)
+
+    def get_user_version(self, user_id: UUID) -> Optional[Version]:
+        if not self._active:
+            return None
+        # всё, что изменилось до подключения, изменилось раньше него
+        count, modified_at = self._users.get(user_id, (0, self._activated_at))
+        return Version(tag=f'{user_id.hex}.{self._epoch}.{count}', modified_at=modified_at)
+
+    def handle(self, event: Event) -> None:
+        if not self._active:
+            return
+        match event:
+            case BlockStartedEvent():
+                self._pairs[event.pair_id] = Version(tag=str(event.block_number), modified_at=self.clock.now())
+            case BalancesChangedEvent() | BetsChangedEvent():
+                self.touch_users(event.user_ids)
+
+    def touch_users(self, user_ids: Iterable[UUID]) -> None:
+        if not self._active:
+            return
+        now = self.clock.now()
+        for user_id in user_ids:
+            count, _ = self._users.get(user_id, (0, now))
+            self._users[user_id] = (count + 1, now)
+
+    def set_active(self, active: bool) -> None:
+        logger.info(f'Response versions are {"active" if active else "inactive"}')
+        self._pairs.clear()
+        self._users.clear()
+        self._epoch = uuid4().hex[:8]
+        self._activated_at = self.clock.now()
+        self._active = active
@@ -0,0 +1,65 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+from abstractions.services.chain import ChainServiceInterface
+from abstractions.services.leader_election import LeaderElectionInterface
+from abstractions.services.worker import SettlementWorkerInterface
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SettlementWorker(SettlementWorkerInterface):
+    chain_service: ChainServiceInterface
+    leader_election: LeaderElectionInterface
+    retry_interval: timedelta = timedelta(seconds=5)
+    heartbeat_interval: timedelta = timedelta(seconds=5)
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """
+        Резервный процесс ждёт лидерства, лидер генерирует блоки.
+        При потере лидерства идущий расчёт отменяется, и лидерство запрашивается снова
+        только после его завершения; при штатной остановке расчёт доводится до конца,
+        блоки останавливаются и лидерство отдаётся.
+        """
+        while not stop_event.is_set():
+            if not await self.leader_election.try_acquire():
+                await self._wait(stop_event, self.retry_interval)
+                continue
+
+            logger.info('Лидерство получено, запускаем генерацию блоков')
+            try:
+                await self.chain_service.start_block_generation()
+            except Exception:
+                logger.error('Не удалось запустить генерацию блоков', exc_info=True)
+                await self.chain_service.suspend_block_generation()
+                await self.leader_election.release()
+                await self._wait(stop_event, self.retry_interval)
+                continue
+
+            await self._lead(stop_event)
+
+            if stop_event.is_set():
+                await self.chain_service.stop_block_generation()
+                await self.leader_election.release()
+            else:
+                logger.error('Лидерство потеряно, приостанавливаем генерацию блоков')
+                await self.chain_service.suspend_block_generation()
+                await self._wait(stop_event, self.retry_interval)
+
+        logger.info('Воркер остановлен')
+
+    async def _lead(self, stop_event: asyncio.Event) -> None:
+        while not stop_event.is_set():
+            await self._wait(stop_event, self.heartbeat_interval)
+            if not await self.leader_election.is_leader():
+                return
+
+    @staticmethod
+    async def _wait(stop_event: asyncio.Event, timeout: timedelta) -> None:
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=timeout.total_seconds())
+        except asyncio.TimeoutError:
+            pass
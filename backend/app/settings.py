@@ -1,20 +1,73 @@
 from pathlib import Path
-from typing import Type, Tuple
+from typing import Literal, Optional, Type, Tuple
 
-from pydantic import SecretStr
+from pydantic import SecretStr, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict, PydanticBaseSettingsSource, JsonConfigSettingsSource
 
 
+class EngineProfile(BaseSettings):
+    # per process: the API and the worker each open up to pool_size + max_overflow connections per engine
+    pool_size: int = 10
+    max_overflow: int = 10
+    # a checkout waiting longer fails; the admission controller keeps API requests from queueing that long
+    pool_timeout: int = 5  # seconds
+    pool_recycle: int = 1800  # seconds
+    # test connections on checkout, for connections dropped by a proxy or a failover
+    pre_ping: bool = False
+    # prepared statements kept per connection
+    statement_cache_size: int = 100
+    # transaction pooling of pgbouncer: no prepared statement cache and unique statement names.
+    # LISTEN and the advisory lock of the worker need a session, so the primary needs session pooling
+    pgbouncer: bool = False
+
+
+class ReplicaSettings(BaseSettings):
+    # same database name and credentials as the primary
+    host: str
+    port: int = 5432
+    profile: str = 'default'
+
+
 class DBSettings(BaseSettings):
     host: str
     port: int
     name: str
     user: str
     password: SecretStr
+    profiles: dict[str, EngineProfile] = {'default': EngineProfile()}
+    # profile of the primary engine
+    profile: str = 'default'
+    # pure reads of the API (candles, history, last vectors, leaderboards) go to the replica once it has
+    # replayed the writes of the last event the process has seen, to the primary until then;
+    # writes and block settlement stay on the primary
+    replica: Optional[ReplicaSettings] = None
+    # in debug mode, statement shapes repeated this many times per request/job are reported as possible N+1
+    repeated_query_threshold: int = 5
+
+    @model_validator(mode='after')
+    def check_profiles(self) -> 'DBSettings':
+        names = [self.profile] + ([self.replica.profile] if self.replica else [])
+        for name in names:
+            if name not in self.profiles:
+                raise ValueError(f'Unknown engine profile {name!r}, known are {sorted(self.profiles)}')
+        return self
 
     @property
     def url(self):
-        return f"postgresql+asyncpg://{self.user}:{self.password.get_secret_value()}@{self.host}:{self.port}/{self.name}"
+        return self._url(self.host, self.port)
+
+    @property
+    def replica_url(self) -> Optional[str]:
+        return self._url(self.replica.host, self.replica.port) if self.replica else None
+
+    def _url(self, host: str, port: int) -> str:
+        return f"postgresql+asyncpg://{self.user}:{self.password.get_secret_value()}@{host}:{port}/{self.name}"
+
+
+class RepositorySettings(BaseSettings):
+    # "memory" keeps all data in dicts of this process, for service-layer tests and load tests without Postgres;
+    # block generation must then run in the same process (worker.embedded)
+    backend: Literal['sql', 'memory'] = 'sql'
 
 
 class TonConnectSettings(BaseSettings):
@@ -25,6 +78,9 @@ class TonConnectSettings(BaseSettings):
 class TonSettings(BaseSettings):
     tonconnect: TonConnectSettings
     tonapi_key: SecretStr
+    # in-memory client without network access, for load tests and simulations
+    offline: bool = False
+    offline_latency_ms: int = 0
 
 
 class JwtSettings(BaseSettings):
@@ -49,6 +105,141 @@ class InnerTokenSettings(BaseSettings):
 class SecretsSettings(BaseSettings):
     expected_path: str
     expected_key: str
+    # in-memory vault with deterministic secrets, for load tests and simulations
+    offline: bool = False
+
+
+class ChainSettings(BaseSettings):
+    # re-attach to the still running block after restart instead of interrupting it
+    resume_blocks: bool = True
+    # block length; boundaries are aligned to the chain creation time
+    block_interval: int = 600  # seconds
+    # "sql" sums the bets of a settled block in the database instead of loading them
+    aggregation: Literal['python', 'sql'] = 'python'
+
+
+class WorkerSettings(BaseSettings):
+    # run block generation inside the API process instead of the dedicated worker
+    embedded: bool = False
+    advisory_lock_key: int = 7_300_001
+    retry_interval: int = 5  # seconds
+    heartbeat_interval: int = 5  # seconds
+    # prometheus endpoint of the worker process
+    metrics_port: int = 8001
+
+
+class MetricsSettings(BaseSettings):
+    # prometheus endpoint of metrics_exporter.py, which serves the samples of all API processes
+    port: int = 8002
+
+
+class JobsSettings(BaseSettings):
+    # failed jobs are retried after backoff_base * 2^(failures - 1), capped by backoff_max, +-jitter
+    backoff_base: int = 5  # seconds
+    backoff_max: int = 300  # seconds
+    backoff_jitter: float = 0.2
+    transaction_check_interval: int = 30  # seconds
+    transaction_check_timeout: int = 25  # seconds
+
+
+class ArchiveSettings(BaseSettings):
+    # monthly partitions of bets and blocks are created this many months ahead
+    months_ahead: int = 2
+    # resolved months older than this are exported to `directory` and dropped; 0 keeps everything
+    retention_months: int = 0
+    directory: str = 'storage/archive'
+    interval: int = 6 * 3600  # seconds
+
+
+class LedgerSettings(BaseSettings):
+    # appends of this many entries and more (block settlement) go through COPY
+    copy_threshold: int = 100
+    snapshot_interval: int = 600  # seconds
+
+
+class BetsSettings(BaseSettings):
+    # the most bets one POST /bets/batch places
+    batch_max_size: int = 20
+    # plans of a batch made again when the balance changes before it is committed
+    batch_attempts: int = 3
+
+
+class StatsSettings(BaseSettings):
+    # weight of the newest resolved bet in the average accuracy of a user
+    accuracy_alpha: float = 0.1
+
+
+class LeaderboardSettings(BaseSettings):
+    # tops are also dropped after every settled block
+    cache_ttl: int = 30  # seconds
+    max_limit: int = 100
+
+
+class CandlesSettings(BaseSettings):
+    # the most candles one request returns
+    max_count: int = 1000
+
+
+class CompressionSettings(BaseSettings):
+    # smaller responses are sent as is
+    minimum_size: int = 1024  # bytes
+    gzip_level: int = 6
+    # responses are compressed on the event loop: low qualities keep it cheap
+    brotli_quality: int = 4
+
+
+class ReadsSettings(BaseSettings):
+    # identical reads of the API (block state, last vectors, candles) share one query
+    # and its result for this long; block events of the pair drop it earlier
+    ttl: float = 1.0  # seconds
+    max_entries: int = 10_000
+
+
+class AdmissionSettings(BaseSettings):
+    enabled: bool = True
+    # connections of the pool API requests are not admitted to, left to block settlement of an embedded worker;
+    # long-lived connections (the event listener) count as taken
+    reserved_connections: int = 2
+    # requests are rejected with 503 once this share of the remaining connections is taken or waited for
+    low_utilization: float = 0.7
+    normal_utilization: float = 0.9
+    high_utilization: float = 1.0
+    # ... or once the event loop runs timers this late; writes are not rejected for it
+    low_loop_lag: float = 0.1  # seconds
+    normal_loop_lag: float = 0.5  # seconds
+    sample_interval: float = 0.1  # seconds
+    retry_after: int = 1  # seconds
+    # path prefixes; requests to other paths have normal priority
+    low_priority_paths: list[str] = ['/user/history', '/candles']
+    high_priority_paths: list[str] = ['/auth', '/bets', '/user/withdraw']
+    # path prefixes read from the replica when one is configured; they are admitted by the load of its pool
+    replica_paths: list[str] = ['/user/history', '/candles', '/block/last_vectors', '/leaderboard']
+
+
+class EventsSettings(BaseSettings):
+    # postgres LISTEN/NOTIFY channel shared by the worker and API processes
+    channel: str = 'wp_events'
+
+
+class LoggingSettings(BaseSettings):
+    # write records from a background thread instead of the event loop
+    queue: bool = True
+    json_format: bool = False
+    levels: dict[str, str] = {
+        'urllib3': 'INFO',
+        'httpcore': 'INFO',
+        'apscheduler': 'DEBUG',
+        'LiteClient': 'WARNING',
+    }
+    # logger prefix -> share of records below WARNING that are kept
+    sample_rates: dict[str, float] = {}
+    # logger prefix -> records per second per message template below WARNING
+    rate_limits: dict[str, float] = {
+        'services.math_services.AggregateBetsService': 5,
+        'routes.candle': 5,
+        'infrastructure.db.repositories.UserRepository': 20,
+    }
+    rate_limit_burst: int = 20
 
 
 class Settings(BaseSettings):
@@ -59,6 +250,22 @@ class Settings(BaseSettings):
     allowed_domains: list[str]
     inner_token: InnerTokenSettings
     secrets: SecretsSettings
+    repositories: RepositorySettings = Field(default_factory=RepositorySettings)
+    chain: ChainSettings = Field(default_factory=ChainSettings)
+    worker: WorkerSettings = Field(default_factory=WorkerSettings)
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
+    events: EventsSettings = Field(default_factory=EventsSettings)
+    jobs: JobsSettings = Field(default_factory=JobsSettings)
+    archive: ArchiveSettings = Field(default_factory=ArchiveSettings)
+    ledger: LedgerSettings = Field(default_factory=LedgerSettings)
+    bets: BetsSettings = Field(default_factory=BetsSettings)
+    stats: StatsSettings = Field(default_factory=StatsSettings)
+    leaderboard: LeaderboardSettings = Field(default_factory=LeaderboardSettings)
+    candles: CandlesSettings = Field(default_factory=CandlesSettings)
+    reads: ReadsSettings = Field(default_factory=ReadsSettings)
+    compression: CompressionSettings = Field(default_factory=CompressionSettings)
+    admission: AdmissionSettings = Field(default_factory=AdmissionSettings)
+    logging: LoggingSettings = Field(default_factory=LoggingSettings)
 
     debug: bool = True
 
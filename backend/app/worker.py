@@ -0,0 +1,36 @@
+import asyncio
+import logging
+import signal
+
+from dotenv import load_dotenv
+from prometheus_client import start_http_server
+
+from dependencies.services.worker import get_settlement_worker
+from infrastructure.log import setup_logging
+from settings import settings
+
+logger = logging.getLogger(__name__)
+log_listener = setup_logging(settings.logging, logging.DEBUG if settings.debug else logging.INFO)
+
+load_dotenv(dotenv_path='./.env')
+
+
+async def main() -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    start_http_server(settings.worker.metrics_port)
+
+    worker = get_settlement_worker()
+    logger.info('settlement worker started, waiting for leadership...')
+    await worker.run(stop_event)
+
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(main())
+    finally:
+        if log_listener:
+            log_listener.stop()